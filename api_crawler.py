@@ -1,93 +1,60 @@
 import asyncio
-import aiohttp
 import json
 from typing import List, Dict
 
+from src.crawler.http_engine import HttpBlockedError, HttpEngineError, search_places_http
+from src.crawler.geo_grid import make_grid, point_tiles, rank_matrix, sweep_grid
+
+def format_api_result(place: Dict, query: str) -> Dict:
+    """HTTP 엔진 결과를 저장 형식으로 변환 (빈 값은 'N/A')"""
+    return {
+        'rank': place['rank'],
+        'name': place['name'] or 'N/A',
+        'address': place['address'] or 'N/A',
+        'road_address': place['road_address'] or 'N/A',
+        'category': place['category'] or 'N/A',
+        'phone': place['phone'] or 'N/A',
+        'longitude': place['longitude'] or 'N/A',
+        'latitude': place['latitude'] or 'N/A',
+        'naver_id': place['place_id'] or 'N/A',
+        'search_query': query,
+        'page': place['page']
+    }
+
 async def search_naver_api(query: str, longitude: float = 127.0378515499566, latitude: float = 37.4774550570593) -> List[Dict]:
     """
     네이버 지도 allSearch API 직접 호출 방식
-    블로그에서 찾은 정보를 바탕으로 구현
+    요청/파싱은 공통 HTTP 엔진(src/crawler/http_engine.py)을 사용
     """
-    search_coord = f"{longitude};{latitude}"
-    boundary = f"{longitude};{latitude};{longitude};{latitude}"
-    
-    url = "https://map.naver.com/p/api/search/allSearch"
+    try:
+        print(f"🔍 '{query}' 요청 중...")
+        places = await search_places_http(
+            query, max_results=None, longitude=longitude, latitude=latitude, max_pages=5
+        )
+    except HttpBlockedError as e:
+        print(f"❌ 접근 거부 - 헤더나 파라미터 문제: {e}")
+        # 차단 전까지 받은 페이지는 유지
+        places = getattr(e, 'partial_results', [])
+        if not places:
+            return []
+    except HttpEngineError as e:
+        print(f"❌ 요청 실패: {e}")
+        return []
     
-    headers = {
-        "authority": "map.naver.com",
-        "accept": "application/json, text/plain, */*",
-        "accept-language": "ko-KR,ko;q=0.8,en-US;q=0.6,en;q=0.4",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "referer": f"https://map.naver.com/p/search/{query}?c=15.00,0,0,0,dh",
-    }
+    if not places:
+        print("❌ 검색 결과 없음")
     
     results = []
-    
-    async with aiohttp.ClientSession() as session:
-        for page in range(1, 6):  # 5페이지까지 수집
-            params = {
-                "query": query,
-                "type": "all",
-                "searchCoord": search_coord,
-                "boundary": boundary,
-                "page": str(page)
-            }
-            
-            try:
-                print(f"🔍 '{query}' 페이지 {page} 요청 중...")
-                
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if "result" in data and "place" in data["result"] and "list" in data["result"]["place"]:
-                            place_list = data["result"]["place"]["list"]
-                            
-                            if not place_list:
-                                print(f"❌ 페이지 {page}: 검색 결과 없음")
-                                break
-                            
-                            print(f"✅ 페이지 {page}: {len(place_list)}개 장소 발견")
-                            
-                            for i, place in enumerate(place_list):
-                                result = {
-                                    'rank': len(results) + 1,
-                                    'name': place.get('name', 'N/A'),
-                                    'address': place.get('address', 'N/A'),
-                                    'road_address': place.get('roadAddress', 'N/A'),
-                                    'category': place.get('category', 'N/A'),
-                                    'phone': place.get('tel', 'N/A'),
-                                    'longitude': place.get('x', 'N/A'),
-                                    'latitude': place.get('y', 'N/A'),
-                                    'naver_id': place.get('id', 'N/A'),
-                                    'search_query': query,
-                                    'page': page
-                                }
-                                results.append(result)
-                                print(f"  {result['rank']}. {result['name']} - {result['address']}")
-                        else:
-                            print(f"❌ 페이지 {page}: 예상치 못한 응답 구조")
-                            break
-                            
-                    elif response.status == 403:
-                        print(f"❌ 페이지 {page}: 접근 거부 (403) - 헤더나 파라미터 문제")
-                        break
-                    else:
-                        print(f"❌ 페이지 {page}: HTTP {response.status}")
-                        break
-                        
-                # 페이지 간 지연
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"❌ 페이지 {page} 요청 실패: {e}")
-                break
+    for place in places:
+        result = format_api_result(place, query)
+        results.append(result)
+        print(f"  {result['rank']}. {result['name']} - {result['address']}")
     
     return results
 
 async def search_multiple_locations(query: str) -> List[Dict]:
     """
-    여러 지역에서 검색하여 더 많은 결과 수집
+    여러 지역에서 동시에 검색하여 더 많은 결과 수집 (격자 조사 엔진 사용)
     """
     # 주요 도시 좌표
     locations = [
@@ -98,35 +65,40 @@ async def search_multiple_locations(query: str) -> List[Dict]:
         {"name": "대구 동성로", "longitude": 128.5963242, "latitude": 35.8682327},
     ]
     
+    print(f"\n📍 지역 {len(locations)}곳 동시 검색: {', '.join(location['name'] for location in locations)}")
+    sweep = await sweep_grid(query, point_tiles(locations), pages_per_tile=5, max_results_per_tile=0)
+    if sweep['blocked']:
+        print(f"❌ 접근 거부 - 헤더나 파라미터 문제: {sweep['blocked']}")
+    
+    # 중복 제거된 장소를 처음 발견된 지역 순서대로 정리 (순위는 그 지역에서의 순위)
+    tile_order = {tile['tile_id']: i for i, tile in enumerate(sweep['tiles'])}
     all_results = []
-    seen_places = set()  # 중복 제거용
+    for place in sweep['places']:
+        first_location = min(place['ranks'], key=tile_order.__getitem__)
+        result = format_api_result({**place, 'rank': place['ranks'][first_location], 'page': None}, query)
+        result['search_location'] = first_location
+        all_results.append(result)
+    all_results.sort(key=lambda result: (tile_order[result['search_location']], result['rank']))
     
-    for location in locations:
-        print(f"\n{'='*60}")
-        print(f"📍 지역: {location['name']}")
-        print(f"{'='*60}")
-        
-        results = await search_naver_api(
-            query, 
-            longitude=location['longitude'], 
-            latitude=location['latitude']
-        )
-        
-        # 중복 제거하면서 추가
-        for result in results:
-            place_key = f"{result['name']}_{result['address']}"
-            if place_key not in seen_places:
-                result['search_location'] = location['name']
-                all_results.append(result)
-                seen_places.add(place_key)
-        
-        print(f"📊 {location['name']} 결과: {len(results)}개 (중복 제거 후 총 {len(all_results)}개)")
-        
-        # 지역 간 지연
-        await asyncio.sleep(3)
+    for tile in sweep['tiles']:
+        print(f"📊 {tile['tile_id']} 결과: {tile['result_count']}개 ({tile['status']})")
+    print(f"📊 중복 제거 후 총 {len(all_results)}개 (요청 {sweep['requests_used']}회, {sweep['elapsed_seconds']}초)")
     
     return all_results
 
+async def search_grid(query: str, min_lon: float, min_lat: float, max_lon: float, max_lat: float,
+                      rows: int = 10, cols: int = 10, **options) -> Dict:
+    """
+    경계 상자를 rows x cols 타일로 나눠 조사하고 장소 x 타일 순위 행렬 반환
+    """
+    tiles = make_grid(min_lon, min_lat, max_lon, max_lat, rows, cols)
+    print(f"\n🧭 '{query}' 격자 조사: {rows}x{cols} 타일")
+    sweep = await sweep_grid(query, tiles, **options)
+    tile_ids, matrix = rank_matrix(sweep)
+    print(f"📊 타일 {sweep['tiles_ok']}/{sweep['tile_count']}개 성공, 장소 {len(matrix)}개 "
+          f"(요청 {sweep['requests_used']}/{sweep['request_budget']}회, {sweep['elapsed_seconds']}초)")
+    return {**sweep, 'tile_ids': tile_ids, 'rank_matrix': matrix}
+
 async def main():
     """메인 함수"""
     try:
@@ -150,9 +122,6 @@ async def main():
             # 상위 10개 출력
             for i, result in enumerate(results[:10], 1):
                 print(f"  {i}. {result['name']} ({result['category']}) - {result['search_location']}")
-            
-            # 키워드 간 지연
-            await asyncio.sleep(5)
         
         # 전체 결과 저장
         filename = "naver_api_results.json"
@@ -1,6 +1,5 @@
 import sys
 import os
-import re
 from pathlib import Path
 
 # 상위 디렉토리를 Python 경로에 추가 (src 폴더에 접근하기 위해)
@@ -8,14 +7,72 @@ current_dir = Path(__file__).parent
 parent_dir = current_dir.parent
 sys.path.insert(0, str(parent_dir))
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import asyncio
-from typing import List, Optional
-from src.crawler.naver_map_crawler import crawl_naver_map
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple, Union
+import aiohttp
+from config.settings import (
+    BROWSER_POOL_SETTINGS, CRAWLING_SETTINGS, RESULT_CACHE_SETTINGS, BATCH_SETTINGS
+)
+from src.crawler.naver_map_crawler import (
+    NaverMapCrawler, ProgressCallback, crawl_naver_map, run_search_engine
+)
+from src.crawler.errors import CircuitOpenError, CrawlError
+from src.crawler.resilience import circuit_stats
+from src.crawler.rate_limiter import get_rate_limiter
+from src.crawler.stealth_utils import get_profile_pool
+from src.crawler.browser_pool import BrowserPool
+from src.utils.result_cache import ResultCache, make_cache_key
+from src.utils.job_manager import JobManager, JobQueueFullError
+from src.data.rank_store import get_rank_store
+
+# 전역 브라우저 풀 (lifespan에서 생성)
+browser_pool: Optional[BrowserPool] = None
+# HTTP 엔진 공용 세션 (연결 재사용)
+http_session: Optional[aiohttp.ClientSession] = None
+# 검색 결과 캐시 (동일 요청 병합)
+result_cache = ResultCache()
+# 비동기 작업 관리자 (lifespan에서 생성)
+job_manager: Optional[JobManager] = None
 
-app = FastAPI(title="네이버 지도 크롤러 API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 브라우저 풀/HTTP 세션/작업 관리자 생성, 종료 시 정리"""
+    global browser_pool, http_session, job_manager
+    # 핑거프린트 프로필은 시작 시 한 번만 읽음 (컨텍스트 생성 경로에서 파일을 읽지 않도록)
+    get_profile_pool()
+    http_session = aiohttp.ClientSession()
+    if BROWSER_POOL_SETTINGS['enabled']:
+        pool_size = int(os.environ.get("BROWSER_POOL_SIZE", BROWSER_POOL_SETTINGS['size']))
+        pool = BrowserPool(size=pool_size)
+        try:
+            await pool.start()
+            browser_pool = pool
+            print(f"🌐 브라우저 풀 준비 완료 ({pool_size}개)")
+        except Exception as e:
+            # 풀 생성에 실패하면 요청마다 브라우저를 띄우는 기존 방식으로 동작
+            print(f"⚠️ 브라우저 풀 생성 실패, 요청별 브라우저 사용: {e}")
+            await pool.close()
+    job_manager = JobManager(run_search_job)
+    await job_manager.start()
+    try:
+        yield
+    finally:
+        await job_manager.stop()
+        job_manager = None
+        if browser_pool:
+            await browser_pool.close()
+            browser_pool = None
+        await http_session.close()
+        http_session = None
+
+app = FastAPI(title="네이버 지도 크롤러 API", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -26,47 +83,393 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def extract_business_name(raw_text: str) -> str:
-    """원시 텍스트에서 업체명만 추출"""
-    if not raw_text:
-        return ""
-    
-    # 일반적인 구분 키워드들
-    keywords = [
-        "예약", "광고", "영업", "리뷰", "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
-        "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
-        "네이버페이", "톡톡", "별점", "현재", "위치", "거리", "출발", "도착", "상세주소", "저장", "더보기"
-    ]
-    
-    # 키워드 중 가장 먼저 나오는 위치 찾기
-    first_keyword_pos = len(raw_text)
-    for keyword in keywords:
-        pos = raw_text.find(keyword)
-        if pos != -1 and pos < first_keyword_pos:
-            first_keyword_pos = pos
-    
-    # 키워드 전까지의 텍스트 추출
-    business_name = raw_text[:first_keyword_pos].strip()
-    
-    # 혹시 너무 짧거나 비어있으면 첫 10글자까지만 사용
-    if len(business_name) < 2:
-        business_name = raw_text[:10].strip()
-    
-    return business_name
-
 class SearchRequest(BaseModel):
     query: str
     limit: int = 10
+    debug: bool = False  # True면 해당 요청의 DOM 진단 캡처 저장
+    mode: Optional[Literal['dom', 'network']] = None  # None이면 설정의 crawl_mode 사용
+    engine: Optional[Literal['browser', 'http', 'auto']] = None  # None이면 설정의 engine 사용
+    longitude: Optional[float] = None  # HTTP 엔진 검색 기준 좌표
+    latitude: Optional[float] = None
 
 class PlaceResult(BaseModel):
     name: str
     rank: int
     raw_text: str  # 전체 원시 텍스트
+    category: Optional[str] = None
+    address: Optional[str] = None
+    rating: Optional[str] = None
+    review_count: Optional[str] = None
+    phone: Optional[str] = None
+    place_id: Optional[str] = None
+
+class CacheInfo(BaseModel):
+    hit: bool = False  # 캐시된 결과 여부
+    age_seconds: float = 0.0  # 캐시된 결과의 경과 시간
+    coalesced: bool = False  # 진행 중이던 동일 요청의 결과를 함께 받았는지 여부
 
 class SearchResponse(BaseModel):
     query: str
     results: List[PlaceResult]
     total_count: int
+    engine: Optional[str] = None  # 실제로 사용된 검색 엔진
+    cache: CacheInfo = CacheInfo()
+
+def to_place_result(item: Dict) -> PlaceResult:
+    """크롤러 결과를 PlaceResult로 변환"""
+    return PlaceResult(
+        rank=item.get('rank', 0),
+        name=item.get('name', ''),
+        raw_text=item.get('raw_text', ''),
+        category=item.get('category') or None,
+        address=item.get('address') or None,
+        rating=item.get('rating') or None,
+        review_count=item.get('review_count') or None,
+        phone=item.get('phone') or None,
+        place_id=item.get('place_id') or None
+    )
+
+async def execute_search(request: SearchRequest,
+                         on_event: Optional[ProgressCallback] = None) -> Tuple[List[Dict], str]:
+    """요청의 엔진 설정에 따라 검색 실행 후 (결과, 사용한 엔진) 반환"""
+    # debug가 아니면 설정된 샘플링 비율을 따름
+    diagnostics = True if request.debug else None
+    
+    async def browser_search() -> List[Dict]:
+        if browser_pool:
+            # 풀에서 미리 실행된 브라우저를 빌려 사용 (엔진 선택은 아래 run_search_engine에서만 수행)
+            async with browser_pool.acquire() as crawler:
+                return await crawler._browser_search(
+                    request.query, request.limit, diagnostics=diagnostics,
+                    mode=request.mode, on_event=on_event
+                )
+        # 크롤러 직접 호출 (max_results 파라미터 사용)
+        return await crawl_naver_map(
+            request.query, request.limit, diagnostics=diagnostics, mode=request.mode,
+            on_event=on_event
+        )
+    
+    raw_results, engine = await run_search_engine(
+        request.engine or CRAWLING_SETTINGS['engine'], request.query, request.limit,
+        browser_search, longitude=request.longitude, latitude=request.latitude,
+        http_session=http_session, on_event=on_event
+    )
+    await record_rank_history(request, raw_results, engine)
+    return raw_results, engine
+
+async def record_rank_history(request: SearchRequest, raw_results: List[Dict], engine: str):
+    """새로 크롤링한 결과를 순위 이력 저장소에 기록 (기록 실패는 검색 응답에 영향 없음)"""
+    rank_store = get_rank_store()
+    if not rank_store or not raw_results:
+        return
+    try:
+        await asyncio.to_thread(
+            rank_store.record_results, request.query, raw_results,
+            longitude=request.longitude, latitude=request.latitude, engine=engine, source='api'
+        )
+    except Exception as e:
+        print(f"⚠️ 순위 이력 기록 실패: {e}")
+
+def search_cache_key(request: SearchRequest) -> Tuple:
+    """검색어/개수/위치/엔진/모드로 결과 캐시 키 생성"""
+    return make_cache_key(
+        request.query, request.limit, request.longitude, request.latitude,
+        engine=request.engine or CRAWLING_SETTINGS['engine'],
+        mode=request.mode or CRAWLING_SETTINGS['crawl_mode']
+    )
+
+async def cached_search(request: SearchRequest,
+                        on_event: Optional[ProgressCallback] = None) -> Tuple[List[Dict], str, Dict]:
+    """캐시를 거쳐 검색 실행 후 (결과, 사용한 엔진, 캐시 정보) 반환
+    
+    같은 검색어/개수/위치/엔진 요청이 동시에 들어오면 크롤링 하나만 실행한다.
+    진단 캡처(debug) 요청은 캐시를 사용하지 않는다.
+    """
+    if not RESULT_CACHE_SETTINGS['enabled'] or request.debug:
+        raw_results, engine = await execute_search(request, on_event)
+        return raw_results, engine, CacheInfo().model_dump()
+    
+    key = search_cache_key(request)
+    # 빈 결과는 크롤링 실패일 수 있으므로 캐시하지 않음
+    (raw_results, engine), cache_info = await result_cache.get_or_compute(
+        key, lambda: execute_search(request, on_event), should_cache=lambda value: bool(value[0])
+    )
+    return raw_results, engine, cache_info
+
+def build_search_response(request: SearchRequest, raw_results: List[Dict],
+                          engine: str, cache_info: Dict) -> SearchResponse:
+    """크롤러 결과로 SearchResponse 구성"""
+    # PlaceResult 형식으로 변환
+    results = [to_place_result(item) for item in raw_results]
+    
+    return SearchResponse(
+        query=request.query,
+        results=results,
+        total_count=len(results),
+        engine=engine,
+        cache=CacheInfo(**cache_info)
+    )
+
+async def run_search_job(request: SearchRequest, on_event: ProgressCallback) -> SearchResponse:
+    """작업 관리자 워커에서 실행되는 검색"""
+    raw_results, engine, cache_info = await cached_search(request, on_event)
+    return build_search_response(request, raw_results, engine, cache_info)
+
+async def stream_search_events(request: SearchRequest) -> AsyncIterator[Dict]:
+    """검색 진행/장소/완료 이벤트를 발생 순서대로 전달
+    
+    이벤트 형식:
+      {"type": "progress", "stage": ..., ...}
+      {"type": "place", ...PlaceResult}
+      {"type": "done", "total_count": ..., "engine": ..., "cache": {...}}
+      {"type": "error", "detail": ...}
+    클라이언트 연결이 끊기면 진행 중인 크롤링도 취소된다.
+    """
+    use_cache = RESULT_CACHE_SETTINGS['enabled'] and not request.debug
+    key = search_cache_key(request) if use_cache else None
+    cached = result_cache.lookup(key) if use_cache else None
+    if cached is not None:
+        (raw_results, engine), age = cached
+        for item in raw_results:
+            yield {"type": "place", **to_place_result(item).model_dump()}
+        yield {"type": "done", "total_count": len(raw_results), "engine": engine,
+               "cache": CacheInfo(hit=True, age_seconds=round(age, 2)).model_dump()}
+        return
+    
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def on_event(stage: str, data: Dict):
+        events.put_nowait((stage, data))
+    
+    # 스트리밍 요청은 클라이언트와 수명을 같이하므로 single-flight 대신 직접 실행
+    search_task = asyncio.create_task(execute_search(request, on_event))
+    emitted_ranks = set()
+    try:
+        while True:
+            getter = asyncio.ensure_future(events.get())
+            done, _ = await asyncio.wait({getter, search_task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                if events.empty():
+                    break
+                continue
+            stage, data = getter.result()
+            if stage == "place":
+                place = data["place"]
+                if place.get('rank') in emitted_ranks:
+                    continue
+                emitted_ranks.add(place.get('rank'))
+                yield {"type": "place", **to_place_result(place).model_dump()}
+            else:
+                yield {"type": "progress", "stage": stage, **data}
+        
+        try:
+            raw_results, engine = search_task.result()
+        except CircuitOpenError as e:
+            yield {"type": "error", "status": 503, "retry_after": round(e.retry_after), **e.to_dict()}
+            return
+        except CrawlError as e:
+            yield {"type": "error", "status": 502, **e.to_dict()}
+            return
+        except Exception as e:
+            yield {"type": "error", "status": 500, "detail": str(e)}
+            return
+        
+        # place 이벤트 없이 반환된 결과가 있으면 마지막에 전달
+        for item in raw_results:
+            if item.get('rank') not in emitted_ranks:
+                yield {"type": "place", **to_place_result(item).model_dump()}
+        if use_cache and raw_results:
+            result_cache.set(key, (raw_results, engine))
+        yield {"type": "done", "total_count": len(raw_results), "engine": engine,
+               "cache": CacheInfo().model_dump()}
+    finally:
+        if not search_task.done():
+            search_task.cancel()
+
+class BatchKeyword(BaseModel):
+    query: str
+    limit: Optional[int] = None  # None이면 배치의 limit 사용
+    longitude: Optional[float] = None  # None이면 배치의 좌표 사용
+    latitude: Optional[float] = None
+
+class BatchSearchRequest(BaseModel):
+    keywords: List[Union[str, BatchKeyword]]
+    limit: int = 10
+    mode: Optional[Literal['dom', 'network']] = None
+    engine: Optional[Literal['browser', 'http', 'auto']] = None
+    longitude: Optional[float] = None
+    latitude: Optional[float] = None
+    concurrency: Optional[int] = None  # None이면 사용 가능한 크롤링 용량만큼
+
+class BatchKeywordResult(BaseModel):
+    query: str
+    limit: int
+    status: str  # ok, error
+    results: List[PlaceResult] = []
+    total_count: int = 0
+    engine: Optional[str] = None
+    cache: CacheInfo = CacheInfo()
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    queued_seconds: float = 0.0  # 실행 슬롯을 기다린 시간
+    duplicates: int = 0  # 같은 요청으로 합쳐진 중복 키워드 수
+
+class BatchSearchResponse(BaseModel):
+    results: List[BatchKeywordResult]  # 중복 제거 후 입력 순서
+    total_keywords: int
+    unique_keywords: int
+    succeeded: int
+    failed: int
+    concurrency: int
+    elapsed_seconds: float
+
+def plan_batch(batch: BatchSearchRequest) -> Tuple[List[SearchRequest], Dict[Tuple, int]]:
+    """배치 키워드를 개별 검색 요청으로 펼치고 캐시 키 기준으로 중복 제거
+    
+    반환값: (입력 순서대로 중복 제거된 요청 목록, 캐시 키별 입력 횟수)
+    """
+    requests: List[SearchRequest] = []
+    counts: Dict[Tuple, int] = {}
+    for keyword in batch.keywords:
+        if isinstance(keyword, str):
+            keyword = BatchKeyword(query=keyword)
+        if not keyword.query.strip():
+            continue
+        request = SearchRequest(
+            query=keyword.query.strip(),
+            limit=keyword.limit or batch.limit,
+            mode=batch.mode,
+            engine=batch.engine,
+            longitude=keyword.longitude if keyword.longitude is not None else batch.longitude,
+            latitude=keyword.latitude if keyword.latitude is not None else batch.latitude,
+        )
+        key = search_cache_key(request)
+        if key not in counts:
+            requests.append(request)
+        counts[key] = counts.get(key, 0) + 1
+    return requests, counts
+
+def batch_capacity(engine: str) -> int:
+    """동시에 실행할 수 있는 검색 수 (브라우저 풀 크기 또는 설정값)"""
+    if engine == 'http':
+        return BATCH_SETTINGS['http_concurrency']
+    if browser_pool:
+        return browser_pool.size
+    return CRAWLING_SETTINGS['keyword_concurrency']
+
+async def run_batch_search(batch: BatchSearchRequest) -> BatchSearchResponse:
+    """중복 제거한 키워드를 크롤링 용량만큼 동시에 실행 (세션/풀/캐시 공유)"""
+    started = time.perf_counter()
+    requests, counts = plan_batch(batch)
+    capacity = batch_capacity(batch.engine or CRAWLING_SETTINGS['engine'])
+    concurrency = max(1, min(batch.concurrency or capacity, capacity))
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(request: SearchRequest) -> BatchKeywordResult:
+        submitted = time.perf_counter()
+        async with semaphore:
+            begun = time.perf_counter()
+            item = BatchKeywordResult(
+                query=request.query, limit=request.limit, status="ok",
+                queued_seconds=round(begun - submitted, 3),
+                duplicates=counts[search_cache_key(request)] - 1
+            )
+            try:
+                raw_results, engine, cache_info = await cached_search(request)
+                response = build_search_response(request, raw_results, engine, cache_info)
+                item.results = response.results
+                item.total_count = response.total_count
+                item.engine = engine
+                item.cache = response.cache
+            except Exception as e:
+                print(f"❌ 일괄 검색 '{request.query}' 실패: {e}")
+                item.status = "error"
+                item.error = str(e)
+            item.elapsed_seconds = round(time.perf_counter() - begun, 3)
+            return item
+    
+    results = await asyncio.gather(*(run_one(request) for request in requests))
+    failed = sum(1 for item in results if item.status == "error")
+    return BatchSearchResponse(
+        results=results,
+        total_keywords=sum(counts.values()),
+        unique_keywords=len(requests),
+        succeeded=len(results) - failed,
+        failed=failed,
+        concurrency=concurrency,
+        elapsed_seconds=round(time.perf_counter() - started, 3)
+    )
+
+class RankRequest(BaseModel):
+    query: str
+    targets: List[str]  # 업체명 또는 플레이스 ID
+    rank_cap: Optional[int] = None  # 이 순위까지만 확인 (None이면 설정의 기본값)
+    mode: Optional[Literal['dom', 'network']] = None
+    engine: Optional[Literal['browser', 'http', 'auto']] = None
+    longitude: Optional[float] = None
+    latitude: Optional[float] = None
+
+class TargetRank(BaseModel):
+    target: str
+    rank: Optional[int] = None  # 찾지 못하면 None
+    matched_by: Optional[str] = None  # place_id, name, name_partial, raw_text
+    name: Optional[str] = None
+    place_id: Optional[str] = None
+    raw_text: Optional[str] = None
+
+class RankResponse(BaseModel):
+    query: str
+    rank_cap: int
+    engine: Optional[str] = None
+    all_found: bool
+    scanned: int  # 확인한 검색 결과 수
+    targets: List[TargetRank]
+
+async def execute_rank_lookup(request: RankRequest) -> Dict:
+    """대상 업체 순위 조회 (HTTP 엔진만 쓰는 경우 브라우저 풀 슬롯을 사용하지 않음)"""
+    engine = request.engine or CRAWLING_SETTINGS['engine']
+    options = dict(
+        rank_cap=request.rank_cap, mode=request.mode, engine=engine,
+        longitude=request.longitude, latitude=request.latitude, http_session=http_session
+    )
+    if browser_pool and engine != 'http':
+        async with browser_pool.acquire() as crawler:
+            return await crawler.find_ranks(request.query, request.targets, **options)
+    return await NaverMapCrawler().find_ranks(request.query, request.targets, **options)
+
+class RankHistoryPoint(BaseModel):
+    run_id: int
+    observed_at: str
+    keyword: str
+    location: str  # "경도,위도" (위치 없는 검색은 빈 문자열)
+    place_id: Optional[str] = None
+    name: Optional[str] = None
+    rank: int
+
+class RankHistoryResponse(BaseModel):
+    keyword: Optional[str] = None
+    place: Optional[str] = None
+    total_count: int
+    truncated: bool = False  # limit을 넘어 오래된 행이 빠졌으면 True (최신 limit행만 포함)
+    history: List[RankHistoryPoint]
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, done, failed
+    progress: Dict[str, Any]
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Optional[SearchResponse] = None
+
+def circuit_open_exception(error: CircuitOpenError) -> HTTPException:
+    """서킷이 열려 즉시 거부한 요청 (503 + Retry-After)"""
+    return HTTPException(
+        status_code=503, detail=str(error),
+        headers={"Retry-After": str(max(1, round(error.retry_after)))}
+    )
 
 @app.post("/search", response_model=SearchResponse)
 async def search_places(request: SearchRequest):
@@ -74,33 +477,148 @@ async def search_places(request: SearchRequest):
     print(f"📋 검색 요청: '{request.query}' (최대 {request.limit}개)")
     
     try:
-        # 크롤러 직접 호출 (max_results 파라미터 사용)
-        raw_results = await crawl_naver_map(request.query, request.limit)
-        
-        # PlaceResult 형식으로 변환
-        results = []
-        for item in raw_results:
-            place_result = PlaceResult(
-                rank=item.get('rank', 0),
-                name=item.get('name', ''),
-                raw_text=item.get('raw_text', '')
-            )
-            results.append(place_result)
-        
-        return SearchResponse(
-            query=request.query,
-            results=results,
-            total_count=len(results)
-        )
+        raw_results, engine, cache_info = await cached_search(request)
+        return build_search_response(request, raw_results, engine, cache_info)
         
+    except CircuitOpenError as e:
+        print(f"🚫 검색 거부 (서킷 열림): {e}")
+        raise circuit_open_exception(e)
+    except CrawlError as e:
+        print(f"❌ 검색 실패 ({type(e).__name__}, 단계 {e.stage}): {e}")
+        raise HTTPException(status_code=502, detail=str(e))
     except Exception as e:
         print(f"❌ 검색 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/search/stream")
+async def search_places_stream(request: SearchRequest, http_request: Request):
+    """장소를 추출되는 즉시 전달하는 스트리밍 검색
+    
+    기본은 NDJSON(한 줄에 이벤트 하나), Accept: text/event-stream이면 SSE 형식
+    """
+    print(f"📡 스트리밍 검색 요청: '{request.query}' (최대 {request.limit}개)")
+    use_sse = "text/event-stream" in http_request.headers.get("accept", "")
+    
+    async def body():
+        async for event in stream_search_events(request):
+            line = json.dumps(event, ensure_ascii=False)
+            yield f"data: {line}\n\n" if use_sse else line + "\n"
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream" if use_sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/search/batch", response_model=BatchSearchResponse)
+async def search_places_batch(batch: BatchSearchRequest):
+    """여러 키워드를 한 번에 검색 (키워드별 결과/오류/소요 시간 반환)"""
+    if len(batch.keywords) > BATCH_SETTINGS['max_keywords']:
+        raise HTTPException(
+            status_code=422,
+            detail=f"키워드는 최대 {BATCH_SETTINGS['max_keywords']}개까지 요청할 수 있습니다"
+        )
+    print(f"📋 일괄 검색 요청: 키워드 {len(batch.keywords)}개")
+    response = await run_batch_search(batch)
+    print(f"✅ 일괄 검색 완료: {response.succeeded}/{response.unique_keywords}개 성공 "
+          f"({response.elapsed_seconds:.1f}초, 동시 {response.concurrency}개)")
+    return response
+
+@app.post("/rank", response_model=RankResponse)
+async def rank_lookup(request: RankRequest):
+    """대상 업체의 순위만 조회 (모두 찾으면 즉시 중단)"""
+    print(f"🎯 순위 조회 요청: '{request.query}' 대상 {len(request.targets)}개")
+    try:
+        return RankResponse(**await execute_rank_lookup(request))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except CircuitOpenError as e:
+        print(f"🚫 순위 조회 거부 (서킷 열림): {e}")
+        raise circuit_open_exception(e)
+    except CrawlError as e:
+        print(f"❌ 순위 조회 실패 ({type(e).__name__}, 단계 {e.stage}): {e}")
+        raise HTTPException(status_code=502, detail=str(e))
+    except Exception as e:
+        print(f"❌ 순위 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/history", response_model=RankHistoryResponse)
+async def rank_history(keyword: Optional[str] = None, place: Optional[str] = None,
+                       longitude: Optional[float] = None, latitude: Optional[float] = None,
+                       since: Optional[str] = None, until: Optional[str] = None,
+                       limit: Optional[int] = None):
+    """키워드/업체(업체명 또는 플레이스 ID)의 순위 이력 조회 (since/until은 ISO 날짜 또는 시각)"""
+    rank_store = get_rank_store()
+    if not rank_store:
+        raise HTTPException(status_code=503, detail="순위 이력 저장소가 비활성화되어 있습니다")
+    try:
+        history, truncated = await asyncio.to_thread(
+            rank_store.query_history, keyword=keyword, place=place, longitude=longitude,
+            latitude=latitude, since=since, until=until, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return RankHistoryResponse(keyword=keyword, place=place, total_count=len(history),
+                               truncated=truncated, history=history)
+
+@app.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(request: SearchRequest):
+    """검색 작업 등록 (즉시 작업 ID 반환, 결과는 GET /jobs/{job_id}로 조회)"""
+    if not job_manager:
+        raise HTTPException(status_code=503, detail="작업 관리자가 준비되지 않았습니다")
+    try:
+        job = job_manager.submit(request)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    print(f"📥 작업 등록: {job.id} '{request.query}'")
+    return JobResponse(**job.to_dict())
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """작업 상태/진행 상황/결과 조회"""
+    job = job_manager.get(job_id) if job_manager else None
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다 (만료되었거나 존재하지 않음)")
+    return JobResponse(**job.to_dict(), result=job.result)
+
+@app.get("/jobs")
+async def job_stats():
+    """작업 관리자 상태"""
+    if not job_manager:
+        return {"enabled": False}
+    return {"enabled": True, **job_manager.stats()}
+
 @app.get("/")
 async def root():
     return {"message": "🗺️ 네이버 지도 크롤러 API가 실행 중입니다!"}
 
+@app.get("/cache")
+async def cache_stats():
+    """결과 캐시 상태"""
+    return {"enabled": RESULT_CACHE_SETTINGS['enabled'], **result_cache.stats()}
+
+@app.get("/circuits")
+async def circuit_breaker_stats():
+    """엔진별 서킷 브레이커 상태 (최근 차단 비율, 열림 여부)"""
+    return circuit_stats()
+
+@app.get("/rate-limits")
+async def rate_limit_stats():
+    """호스트별 속도 제한 상태 (현재 속도/동시 요청 수/차단 횟수)"""
+    return get_rate_limiter().stats()
+
+@app.get("/profiles")
+async def fingerprint_profile_stats():
+    """핑거프린트 프로필별 사용 횟수"""
+    return get_profile_pool().stats()
+
+@app.get("/pool")
+async def pool_stats():
+    """브라우저 풀 상태"""
+    if not browser_pool:
+        return {"enabled": False}
+    return {"enabled": True, **browser_pool.stats()}
+
 if __name__ == "__main__":
     import uvicorn
     import os
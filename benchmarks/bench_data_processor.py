@@ -0,0 +1,107 @@
+"""
+DataProcessor.process_crawling_results 벤치마크
+기존 행 단위 처리(dict 복사 + 행마다 strftime/정규식)와 컬럼 단위 처리, 청크 처리의
+초당 처리 행 수를 비교한다
+
+사용법: python benchmarks/bench_data_processor.py [--rows 1000000] [--chunk-size 200000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import os
+import time
+from datetime import datetime
+from itertools import chain
+
+import pandas as pd
+
+# 프로젝트 루트를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.data_processor import COLUMN_ORDER, DataProcessor
+
+
+def legacy_process(results):
+    """기존 구현 (비교 기준)"""
+    all_data = []
+    for keyword, places in results.items():
+        for place in places:
+            place_data = place.copy()
+            place_data['search_keyword'] = keyword
+            place_data['crawled_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for key, value in place_data.items():
+                if isinstance(value, str):
+                    value = value.strip().replace('\n', ' ').replace('\r', ' ')
+                    place_data[key] = ' '.join(value.split())
+            if place_data.get('rating'):
+                match = re.search(r'(\d+\.?\d*)', place_data['rating'])
+                if match:
+                    place_data['rating'] = match.group(1)
+            if place_data.get('review_count'):
+                match = re.search(r'(\d+)', place_data['review_count'].replace(',', ''))
+                if match:
+                    place_data['review_count'] = match.group(1)
+            all_data.append(place_data)
+    df = pd.DataFrame(all_data)
+    df = df[[col for col in COLUMN_ORDER if col in df.columns]]
+    return df.sort_values(['search_keyword', 'rank']).reset_index(drop=True)
+
+
+def make_results(rows: int, per_keyword: int = 50, seed: int = 42):
+    """키워드당 per_keyword개씩 rows개의 검색 결과 생성"""
+    rng = random.Random(seed)
+    results = {}
+    for k in range(rows // per_keyword):
+        results[f"키워드 {k}"] = [
+            {
+                'rank': rank,
+                'name': f"  업체\n{k}-{rank}  지점 ",
+                'address': "서울 강남구\n역삼동  123",
+                'category': rng.choice(["카페", "한식", "치킨"]),
+                'rating': f"별점 {rng.uniform(3, 5):.2f}점",
+                'review_count': f"리뷰 {rng.randint(1, 20000):,}개",
+                'phone': "02-123-4567",
+                'raw_text': "업체 카페 영업 중 별점4.5 리뷰 1,234",
+            }
+            for rank in range(1, per_keyword + 1)
+        ]
+    return results
+
+
+def bench(label: str, rows: int, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:8.2f}초  {rows / elapsed:12,.0f}행/초")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DataProcessor 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="처리할 행 수")
+    parser.add_argument("--chunk-size", type=int, default=200_000, help="청크 처리 크기")
+    parser.add_argument("--skip-legacy", action="store_true", help="기존 구현 측정 생략")
+    args = parser.parse_args()
+
+    results = make_results(args.rows)
+    rows = sum(len(places) for places in results.values())
+    processor = DataProcessor()
+    print(f"검색 결과 {rows:,}행 (키워드 {len(results):,}개)\n")
+
+    if not args.skip_legacy:
+        bench("기존 행 단위 처리", rows, lambda: legacy_process(results))
+    df = bench("컬럼 단위 처리", rows, lambda: processor.process_crawling_results(results))
+
+    records = chain.from_iterable(
+        ({**place, 'search_keyword': keyword} for place in places) for keyword, places in results.items()
+    )
+    chunk_rows = bench(f"청크 처리 ({args.chunk_size:,}행)", rows, lambda: sum(
+        len(chunk) for chunk in processor.iter_processed_chunks(records, args.chunk_size)
+    ))
+    print(f"\n결과 {len(df):,}행 / 청크 합계 {chunk_rows:,}행, 메모리 {df.memory_usage(deep=True).sum() / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+DataProcessor.save_to_excel 벤치마크
+기존 방식(키워드마다 전체 DataFrame 마스킹 + 요약 통계에서 다시 마스킹)과
+groupby 한 번 처리(pandas/streaming 모드)의 저장 시간과 최대 메모리(tracemalloc)를 비교한다
+
+사용법: python benchmarks/bench_excel_export.py [--rows 10000] [--per-keyword 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+# 프로젝트 루트를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_data_processor import make_results
+from config.settings import OUTPUT_SETTINGS
+from src.utils.data_processor import DataProcessor
+
+
+def legacy_save_to_excel(df: pd.DataFrame, output_path: str):
+    """기존 구현 (비교 기준)"""
+    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='전체_데이터', index=False)
+        for keyword in df['search_keyword'].unique():
+            keyword_df = df[df['search_keyword'] == keyword]
+            keyword_df.to_excel(writer, sheet_name=str(keyword)[:30], index=False)
+        summary = []
+        for keyword in df['search_keyword'].unique():
+            keyword_df = df[df['search_keyword'] == keyword]
+            summary.append({
+                '검색_키워드': keyword,
+                '총_장소_수': len(keyword_df),
+                '평균_평점': pd.to_numeric(keyword_df['rating'], errors='coerce').mean(),
+                '평균_리뷰_수': pd.to_numeric(keyword_df['review_count'], errors='coerce').mean(),
+                '카테고리_수': keyword_df['category'].nunique(),
+            })
+        pd.DataFrame(summary).to_excel(writer, sheet_name='요약_통계', index=False)
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<24} {elapsed:8.2f}초  최대 메모리 {peak / 1024 / 1024:8.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel 저장 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000, help="행 수")
+    parser.add_argument("--per-keyword", type=int, default=20, help="키워드당 행 수")
+    parser.add_argument("--skip-legacy", action="store_true", help="기존 구현 측정 생략")
+    args = parser.parse_args()
+
+    processor = DataProcessor()
+    df = processor.process_crawling_results(make_results(args.rows, args.per_keyword))
+    print(f"{len(df):,}행, 키워드 {df['search_keyword'].nunique():,}개 (tracemalloc 측정 중이라 실제보다 느림)\n")
+
+    output_dir = OUTPUT_SETTINGS['output_directory']
+    if not args.skip_legacy:
+        measure("기존 (키워드별 마스킹)", lambda: legacy_save_to_excel(
+            df, os.path.join(output_dir, "bench_legacy.xlsx")))
+    measure("groupby (pandas)", lambda: processor.save_to_excel(df, "bench_pandas.xlsx", streaming=False))
+    measure("groupby (streaming)", lambda: processor.save_to_excel(df, "bench_streaming.xlsx", streaming=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+raw_text 파서 벤치마크
+기존 방식(키워드마다 str.find로 전체 텍스트 스캔)과 컴파일된 정규식 파서의
+업체명 추출/전체 필드 파싱 처리량을 비교한다
+
+사용법: python benchmarks/bench_raw_text_parser.py [--count 100000]
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+
+# 프로젝트 루트를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.raw_text_parser import (
+    NAME_STOP_KEYWORDS, extract_business_name, parse_raw_texts
+)
+
+NAMES = ["스타벅스 강남역점", "을지로 노가리골목 만선호프", "블루보틀 삼청 카페", "교촌치킨 역삼점",
+         "진미평양냉면", "Bistro Seoul", "더플레이스 베이커리", "제주 흑돼지 삼겹살 전문점"]
+CATEGORIES = ["카페", "한식", "치킨", "냉면", "베이커리", "이자카야", "술집", "양식"]
+ADDRESSES = ["서울 강남구 역삼동 123", "부산 해운대구 우동 45", "경기 성남시 분당구 정자동 7", "제주 제주시 연동 88"]
+EXTRAS = ["네이버페이", "예약", "톡톡", "광고", "새로오픈", "미쉐린", ""]
+
+
+def legacy_extract_business_name(raw_text: str) -> str:
+    """기존 크롤러 구현 (비교 기준)"""
+    if not raw_text:
+        return ""
+    first_keyword_pos = len(raw_text)
+    for keyword in NAME_STOP_KEYWORDS:
+        pos = raw_text.find(keyword)
+        if pos != -1 and pos < first_keyword_pos:
+            first_keyword_pos = pos
+    name = raw_text[:first_keyword_pos].strip()
+    if len(name) > 30:
+        name = name[:30] + "..."
+    return name if name else raw_text[:20] + "..." if len(raw_text) > 20 else raw_text
+
+
+def make_raw_texts(count: int, seed: int = 42):
+    """검색 결과와 비슷한 형태의 원시 텍스트 생성"""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = [
+            rng.choice(NAMES),
+            rng.choice(CATEGORIES),
+            rng.choice(["영업 중", "영업 종료", "휴무", ""]),
+            f"{rng.randint(9, 23)}:00에 영업 종료" if rng.random() < 0.7 else "",
+            f"별점{rng.uniform(3, 5):.2f}" if rng.random() < 0.8 else "",
+            f"리뷰 {rng.randint(1, 9999)}" + ("+" if rng.random() < 0.1 else ""),
+            rng.choice(ADDRESSES),
+            rng.choice(EXTRAS),
+            "저장더보기",
+        ]
+        texts.append("".join(parts))
+    return texts
+
+
+def bench(label: str, func, texts):
+    started = time.perf_counter()
+    result = func(texts)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed * 1000:9.1f}ms  {len(texts) / elapsed:12,.0f}건/초")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="raw_text 파서 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="원시 텍스트 개수")
+    args = parser.parse_args()
+
+    texts = make_raw_texts(args.count)
+    print(f"원시 텍스트 {len(texts):,}개 (평균 {sum(map(len, texts)) / len(texts):.0f}자)\n")
+
+    legacy, legacy_time = bench("업체명 (기존 str.find x33)", lambda ts: [legacy_extract_business_name(t) for t in ts], texts)
+    names, name_time = bench("업체명 (컴파일된 정규식)", lambda ts: [extract_business_name(t) for t in ts], texts)
+    bench("전체 필드 parse_raw_texts", parse_raw_texts, texts)
+
+    mismatches = sum(1 for a, b in zip(legacy, names) if a != b)
+    print(f"\n업체명 속도 향상: {legacy_time / name_time:.1f}배, 기존 결과와 불일치 {mismatches}건")
+
+
+if __name__ == "__main__":
+    main()
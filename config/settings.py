@@ -62,6 +62,186 @@ CRAWLING_SETTINGS = {
     'page_load_strategy': 'domcontentloaded',  # networkidle 대신 domcontentloaded 사용
     'scroll_delay': 2,  # 스크롤 간 지연
     'random_delay_range': (1, 3),  # 랜덤 지연 범위
+    'keyword_concurrency': 3,  # crawl_keywords 동시 실행 페이지 수
+    'crawl_mode': 'dom',  # 'dom': 렌더링된 목록 파싱, 'network': 검색 응답 JSON 파싱 (실패 시 dom)
+    'engine': 'browser',  # 'browser': Playwright, 'http': allSearch API, 'auto': http 우선 후 실패 시 browser
+}
+
+# HTTP 검색 엔진 설정 (allSearch API)
+HTTP_ENGINE_SETTINGS = {
+    'url': 'https://map.naver.com/p/api/search/allSearch',
+    'timeout': 10,  # 요청 타임아웃 (초)
+    'max_pages': 5,  # 최대 요청 페이지 수
+    'default_longitude': 127.0378515499566,  # 기본 검색 좌표 (서울 강남)
+    'default_latitude': 37.4774550570593,
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+}
+
+# 단계별 재시도 설정 (지터가 있는 지수 백오프)
+RETRY_SETTINGS = {
+    # 단계별 최대 시도 횟수 (CRAWLING_SETTINGS['max_retries'] + 1을 넘지 않음)
+    'stage_attempts': {
+        'goto': 3,  # 페이지 이동 + 검색창
+        'iframe': 2,  # searchIframe 표시
+        'list_selector': 2,  # 검색 결과 목록 선택자
+        'scroll': 2,  # 목록 스크롤/페이지 이동
+        'http': 3,  # allSearch 요청 (차단 응답은 재시도하지 않음)
+    },
+    'base_delay': 0.5,  # 첫 재시도 최대 대기 (초), 시도마다 두 배
+    'max_delay': 8.0,
+}
+
+# 엔진별 서킷 브레이커 설정 (차단 비율이 높으면 새 크롤링을 즉시 실패 또는 다른 엔진으로 전환)
+CIRCUIT_BREAKER_SETTINGS = {
+    'enabled': True,
+    'window_seconds': 300,  # 차단 비율 계산 구간 (초)
+    'min_samples': 5,  # 구간 안 결과가 이 수 이상일 때만 판단
+    'block_rate_threshold': 0.5,  # 차단 비율이 이 값 이상이면 열림
+    'open_seconds': 120,  # 열린 뒤 이 시간이 지나면 시험 요청 하나 허용 (half-open)
+    'route_to_other_engine': True,  # 열린 엔진 대신 다른 엔진 사용 (False면 CircuitOpenError)
+}
+
+# 호스트별 요청 속도 제한 (토큰 버킷 + AIMD 동시 요청 수 조절)
+RATE_LIMIT_SETTINGS = {
+    'enabled': True,
+    # 호스트별 초당 요청 수(rate)와 순간 허용량(burst)
+    # 목록에 없는 호스트는 CRAWLING_SETTINGS['delay_between_requests'] 간격(burst 1)으로 제한
+    'hosts': {
+        'map.naver.com': {'rate': 4.0, 'burst': 8},  # 지도 페이지 이동 + allSearch API
+        'pcmap.place.naver.com': {'rate': 2.0, 'burst': 4},  # 플레이스 상세
+    },
+    'initial_concurrency': 4,  # 호스트별 시작 동시 요청 수
+    'min_concurrency': 1,
+    'max_concurrency': 16,
+    'success_window': 10,  # 연속 성공 이 횟수마다 동시 요청 수 +1 (가산 증가)
+    'decrease_factor': 0.5,  # 차단 신호(403/429/캡차) 시 동시 요청 수와 속도에 곱함 (승산 감소)
+    'min_rate_ratio': 0.1,  # 속도는 설정값의 이 비율 아래로 내리지 않음
+    'block_cooldown': 30,  # 차단 후 이 시간(초) 동안은 증가하지 않고 random_delay_range 지연 추가
+}
+
+# 격자(geo-grid) 순위 조사 설정 (HTTP 엔진으로 타일별 검색)
+GEO_GRID_SETTINGS = {
+    'concurrency': 6,  # 동시에 요청하는 타일 수
+    'request_budget': 300,  # 조사 한 번에 허용하는 allSearch 최대 요청 수
+    'pages_per_tile': 1,  # 타일당 최대 요청 페이지 수
+    'max_results_per_tile': 50,  # 타일당 수집할 최대 결과 수
+    'max_tiles': 400,  # 격자 최대 타일 수 (rows x cols)
+}
+
+# 페이지 준비 상태 감지 설정 (단계별 타임아웃, ms)
+READINESS_SETTINGS = {
+    'iframe_timeout': 15000,  # searchIframe 요소 등장 대기
+    'frame_load_timeout': 10000,  # searchIframe 문서 로드 대기
+    'search_response_timeout': 10000,  # 검색 목록 응답 대기
+    'list_item_selector': 'li',  # 안정화 판단에 사용할 목록 항목 선택자
+    'list_settle_timeout': 8000,  # 목록 항목 수 안정화 대기
+    'list_settle_quiet_ms': 400,  # 이 시간 동안 항목 수가 변하지 않으면 안정화로 판단
+    'scroll_timeout': 3000,  # 스크롤 후 추가 항목 로드 대기
+    'scroll_quiet_ms': 300,
+}
+
+# 깊은 목록 스크롤/페이지 이동 설정 (100~300위 수집)
+SCROLL_ENGINE_SETTINGS = {
+    # 실제로 스크롤되는 목록 컨테이너 (없으면 마지막 항목의 스크롤 가능한 부모를 탐색)
+    'container_selectors': ['#_pcmap_list_scroll_container', "div[class*='scroll_container']"],
+    # 페이지 버튼 영역과 다음 페이지 화살표
+    'pagination_selectors': ['.zRM9F', "div[class*='pagination']", "[role='navigation']"],
+    'next_page_selectors': ['a.eUTV2:last-of-type', "a[class*='next']", "button[class*='next']"],
+    'max_steps': 30,  # 스크롤 + 페이지 이동 최대 횟수
+    'max_pages': 6,  # 최대 페이지 수
+    'page_timeout': 8000,  # 페이지 이동 후 목록 교체 대기 (ms)
+    'bottom_timeout': 800,  # 컨테이너 끝에서 추가 로드를 기다리는 시간 (ms)
+}
+
+# 대상 업체 순위 조회 설정
+RANK_LOOKUP_SETTINGS = {
+    'default_rank_cap': 100,  # 순위 상한 미지정 시 이 순위까지만 확인
+    'max_rank_cap': 300,  # 요청 가능한 최대 순위 상한
+    'max_scrolls': 40,  # 순위 조회 시 최대 스크롤 횟수 (일반 검색은 SCROLL_ENGINE_SETTINGS['max_steps'])
+}
+
+# 검색 결과 선택자 캐시 설정
+SELECTOR_CACHE_SETTINGS = {
+    'path': 'output/selector_cache.json',
+    'ttl_seconds': 6 * 60 * 60,  # 6시간이 지나면 다시 탐색
+}
+
+# DOM 진단 캡처 설정 (기본 꺼짐)
+DIAGNOSTICS_SETTINGS = {
+    'sample_rate': 0.0,  # 요청 중 진단 캡처할 비율 (예: 0.01 = 1%)
+    'directory': 'debug_html',  # 캡처 저장 디렉토리
+}
+
+# 크롤링 컨텍스트 리소스 차단 설정 (lite 프로필)
+RESOURCE_BLOCKING_SETTINGS = {
+    'enabled': True,
+    'blocked_resource_types': ['image', 'media', 'font'],
+    # 지도 타일 호스트 (하위 도메인 포함)
+    'blocked_hosts': [
+        'map.pstatic.net',
+        'nrbe.pstatic.net',
+        'map.naver.net',
+    ],
+    # 분석/추적 요청 URL 키워드
+    'blocked_url_keywords': [
+        'wcs.naver.',
+        'lcs.naver.com',
+        'nlog.naver.com',
+        'tivan.naver.com',
+        'veta.naver.com',
+        'nelo2-col',
+        'google-analytics.com',
+        'googletagmanager.com',
+        'doubleclick.net',
+    ],
+    # 차단 사유별 요청 1건당 평균 크기 추정치 (절감 바이트 계산용)
+    'estimated_bytes': {
+        'image': 25000,
+        'media': 200000,
+        'font': 40000,
+        'tile': 20000,
+        'tracking': 2000,
+        'other': 5000,
+    },
+}
+
+# 브라우저 풀 설정 (backend에서 요청 간 브라우저 재사용)
+BROWSER_POOL_SETTINGS = {
+    'enabled': True,
+    'size': 2,  # 미리 띄워둘 브라우저 수 (BROWSER_POOL_SIZE 환경변수로 덮어쓰기 가능)
+    'max_uses': 50,  # 이 횟수만큼 사용한 브라우저는 재시작
+    'acquire_timeout': 60,  # 빈 슬롯 대기 시간 (초)
+    'health_check_timeout': 5,  # 헬스 체크 타임아웃 (초)
+}
+
+# /search 결과 캐시 설정
+RESULT_CACHE_SETTINGS = {
+    'enabled': True,
+    'ttl_seconds': 300,  # 캐시 유지 시간 (초)
+    'max_entries': 500,  # 최대 캐시 항목 수 (초과 시 LRU 제거)
+}
+
+# 비동기 작업(/jobs) 설정
+JOB_SETTINGS = {
+    'workers': 2,  # 동시에 실행할 작업 수 (브라우저 풀 크기와 맞추는 것을 권장)
+    'retention_seconds': 60 * 60,  # 완료된 작업 보관 시간 (초)
+    'max_queued': 1000,  # 최대 대기 작업 수
+    'cleanup_interval': 60,  # 만료 작업 정리 주기 (초)
+}
+
+# 일괄 검색 설정 (POST /search/batch)
+BATCH_SETTINGS = {
+    'max_keywords': 500,  # 요청 하나에 허용하는 최대 키워드 수
+    'http_concurrency': 8,  # http 엔진 사용 시 동시 검색 수 (브라우저 미사용)
+}
+
+# 순위 이력 저장소 (SQLite) 설정
+RANK_STORE_SETTINGS = {
+    'enabled': True,
+    'db_path': 'output/rank_history.sqlite3',
+    'busy_timeout_ms': 5000,  # 다른 프로세스가 쓰는 중이면 대기할 시간
+    'default_limit': 1000,  # 이력 조회 기본 최대 행 수
+    'max_limit': 50000,
 }
 
 # 스텔스 설정 (Patchright 최적화)
@@ -77,6 +257,15 @@ STEALTH_SETTINGS = {
     'isolated_context': True,  # Patchright 권장
 }
 
+# 브라우저 핑거프린트 프로필 풀 (UA/뷰포트/로케일/플랫폼을 한 묶음으로 사용)
+FINGERPRINT_SETTINGS = {
+    'enabled': True,  # False면 기본 프로필(default_profile_id) 하나만 사용
+    # 프로세스 시작 시 한 번만 읽는 번들 파일 (네트워크 접근 없음)
+    'profiles_path': 'config/fingerprint_profiles.json',
+    'default_profile_id': 'win-chrome120-1366',
+    'override_platform': True,  # navigator.platform을 프로필 값으로 맞춤 (UA와 일치)
+}
+
 # 검색 키워드 (테스트용)
 SEARCH_KEYWORDS = [
     '강남 맛집',
@@ -94,6 +283,21 @@ OUTPUT_SETTINGS = {
     'json_filename': 'naver_places_{timestamp}.json',
     'log_filename': 'crawler.log',
     'timestamp_format': '%Y%m%d_%H%M%S',
+    # 이 행 수 이상이면 Excel을 write_only 모드로 한 행씩 기록 (메모리 일정)
+    'excel_streaming_threshold': 100_000,
+    'excel_trace_memory': False,  # Excel 저장 시 tracemalloc으로 최대 메모리 측정 (저장이 느려짐)
+    # 수집일/키워드로 분할한 Parquet/Arrow 데이터셋 디렉토리 (pyarrow 필요)
+    'dataset_directory': 'output/dataset',
+    'arrow_dataset_directory': 'output/dataset_arrow',
+    'ndjson_filename': 'naver_places_{timestamp}.ndjson',
+}
+
+# 키워드가 끝날 때마다 한 줄씩 추가하는 NDJSON 기록 설정
+NDJSON_SETTINGS = {
+    'compression': 'gzip',  # None, 'gzip', 'zstd' (zstandard 패키지가 없으면 gzip으로 대체)
+    # fsync 정책: 'always'(줄마다), 'batch'(키워드 묶음마다), 'never'(OS에 맡김)
+    'fsync': 'batch',
+    'compression_level': 6,
 }
 
 # 로깅 설정
@@ -0,0 +1,203 @@
+"""
+브라우저 풀
+미리 실행해 둔 Chromium 브라우저를 요청 간에 재사용하여
+요청마다 브라우저를 띄우고 닫는 비용을 없앤다
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+import sys
+import os
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TargetClosedError
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import BROWSER_POOL_SETTINGS
+from src.crawler.naver_map_crawler import (
+    NaverMapCrawler, launch_chromium, create_crawl_context
+)
+from src.crawler.resource_blocker import ResourceBlocker, create_resource_blocker
+
+
+def is_target_closed(error: BaseException) -> bool:
+    """예외(또는 CrawlError로 감싸기 전 원인)가 브라우저/페이지 종료로 인한 것인지 여부"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, TargetClosedError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class BrowserSlot:
+    """풀에 들어있는 브라우저 하나 (브라우저 + 컨텍스트 + 페이지)"""
+
+    def __init__(self, slot_id: int):
+        self.slot_id = slot_id
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.blocker: Optional[ResourceBlocker] = None
+        self.uses = 0
+        self.launched_at = 0.0
+        self.crashed = False
+
+    def to_dict(self) -> Dict:
+        return {
+            'slot_id': self.slot_id,
+            'uses': self.uses,
+            'age_seconds': round(time.monotonic() - self.launched_at, 1) if self.launched_at else 0,
+            'connected': bool(self.browser and self.browser.is_connected()),
+        }
+
+
+class BrowserPool:
+    """체크아웃/체크인 방식의 브라우저 풀"""
+
+    def __init__(self, size: Optional[int] = None, max_uses: Optional[int] = None,
+                 acquire_timeout: Optional[float] = None,
+                 health_check_timeout: Optional[float] = None):
+        self.size = size or BROWSER_POOL_SETTINGS['size']
+        self.max_uses = max_uses or BROWSER_POOL_SETTINGS['max_uses']
+        self.acquire_timeout = acquire_timeout or BROWSER_POOL_SETTINGS['acquire_timeout']
+        self.health_check_timeout = health_check_timeout or BROWSER_POOL_SETTINGS['health_check_timeout']
+
+        self.playwright = None
+        self.slots: List[BrowserSlot] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._background_tasks = set()
+        self._closed = False
+        self.recycled_count = 0
+        self.logger = logging.getLogger('BrowserPool')
+
+    async def start(self):
+        """풀 생성 및 브라우저 사전 실행"""
+        self.playwright = await async_playwright().start()
+        self.slots = [BrowserSlot(i) for i in range(self.size)]
+        await asyncio.gather(*(self._launch_slot(slot) for slot in self.slots))
+        for slot in self.slots:
+            self._idle.put_nowait(slot)
+        self.logger.info(f"브라우저 풀 시작: {self.size}개")
+
+    async def close(self):
+        """모든 브라우저 종료"""
+        self._closed = True
+        for task in list(self._background_tasks):
+            task.cancel()
+        await asyncio.gather(*(self._dispose_slot(slot) for slot in self.slots),
+                             return_exceptions=True)
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self.logger.info("브라우저 풀 종료")
+
+    @asynccontextmanager
+    async def acquire(self, timeout: Optional[float] = None):
+        """빈 슬롯을 체크아웃하여 해당 브라우저를 사용하는 크롤러 반환"""
+        if self._closed:
+            raise RuntimeError("브라우저 풀이 종료되었습니다")
+
+        slot = await asyncio.wait_for(self._idle.get(), timeout or self.acquire_timeout)
+        try:
+            if not await self._is_healthy(slot):
+                await self._recycle_slot(slot, reason="헬스 체크 실패")
+        except BaseException:
+            self._idle.put_nowait(slot)
+            raise
+
+        crawler = NaverMapCrawler(browser=slot.browser, context=slot.context, page=slot.page,
+                                  resource_blocker=slot.blocker)
+        try:
+            yield crawler
+        except Exception as e:
+            # 차단/시간 초과/결과 없음 등 검색 실패는 브라우저를 그대로 재사용하고,
+            # 브라우저 연결이 끊기거나 페이지가 닫힌 경우만 크래시로 보고 재시작
+            if is_target_closed(e) or not (slot.browser and slot.browser.is_connected()):
+                slot.crashed = True
+            raise
+        finally:
+            slot.uses += 1
+            self._checkin(slot)
+
+    def _checkin(self, slot: BrowserSlot):
+        """슬롯 반납 (사용 횟수 초과/크래시 시 백그라운드에서 재시작 후 반납)"""
+        if slot.crashed:
+            reason = "크래시"
+        elif not (slot.browser and slot.browser.is_connected()) or not slot.page or slot.page.is_closed():
+            reason = "브라우저/페이지 종료"
+        elif slot.uses >= self.max_uses:
+            reason = f"사용 횟수 {slot.uses}회"
+        else:
+            reason = None
+        if reason is None or self._closed:
+            self._idle.put_nowait(slot)
+            return
+
+        task = asyncio.create_task(self._recycle_and_release(slot, reason))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _recycle_and_release(self, slot: BrowserSlot, reason: str):
+        try:
+            await self._recycle_slot(slot, reason)
+        except Exception as e:
+            self.logger.error(f"슬롯 {slot.slot_id} 재시작 실패: {e}")
+        finally:
+            # 재시작에 실패해도 슬롯은 반납하여 다음 체크아웃 시 다시 시도
+            self._idle.put_nowait(slot)
+
+    async def _is_healthy(self, slot: BrowserSlot) -> bool:
+        """브라우저 연결 및 페이지 응답 확인"""
+        if not slot.browser or not slot.browser.is_connected():
+            return False
+        if not slot.page or slot.page.is_closed():
+            return False
+        try:
+            await asyncio.wait_for(slot.page.evaluate("1"), self.health_check_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _recycle_slot(self, slot: BrowserSlot, reason: str):
+        """슬롯의 브라우저를 종료하고 새로 실행"""
+        self.logger.info(f"슬롯 {slot.slot_id} 재시작 ({reason})")
+        await self._dispose_slot(slot)
+        await self._launch_slot(slot)
+        self.recycled_count += 1
+
+    async def _launch_slot(self, slot: BrowserSlot):
+        slot.browser = await launch_chromium(self.playwright)
+        slot.blocker = create_resource_blocker()
+        slot.context = await create_crawl_context(slot.browser, slot.blocker)
+        slot.page = await slot.context.new_page()
+        slot.uses = 0
+        slot.crashed = False
+        slot.launched_at = time.monotonic()
+
+    async def _dispose_slot(self, slot: BrowserSlot):
+        try:
+            if slot.browser:
+                await slot.browser.close()
+        except Exception as e:
+            self.logger.warning(f"슬롯 {slot.slot_id} 종료 중 오류: {e}")
+        finally:
+            slot.browser = None
+            slot.context = None
+            slot.page = None
+
+    def stats(self) -> Dict:
+        """풀 상태"""
+        return {
+            'size': self.size,
+            'idle': self._idle.qsize(),
+            'in_use': self.size - self._idle.qsize(),
+            'max_uses': self.max_uses,
+            'recycled': self.recycled_count,
+            'slots': [slot.to_dict() for slot in self.slots],
+        }
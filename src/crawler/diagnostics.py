@@ -0,0 +1,133 @@
+"""
+searchIframe DOM 진단 캡처
+기본적으로 꺼져 있으며 요청별로 켜거나 일정 비율로 샘플링한다.
+캡처는 페이지 내 평가 1회로 수집하고 파일 기록은 백그라운드에서 고유한 이름으로 수행한다
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+import sys
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import DIAGNOSTICS_SETTINGS
+
+# DOM 구조 분석용 선택자
+DEBUG_SELECTORS = [
+    "li", "ul li", "ol li", "div", "span", "a",
+    "._3XamX", ".TYaxT", ".CHC5F", ".YwYLL",
+    "[data-id]", "[data-place-id]", "[data-sid]",
+    ".place_bluelink", ".item_name", ".item", ".result",
+    ".search_item", ".list_item", ".place_item",
+    "[role='listitem']", "[class*='item']", "[class*='place']",
+    "[class*='search']", "[class*='result']"
+]
+
+# HTML과 선택자별 매칭 정보를 한 번에 수집
+CAPTURE_SCRIPT = """
+(selectors) => {
+    const dataAttrs = ['data-id', 'data-place-id', 'data-sid'];
+    const probes = selectors.map(selector => {
+        let elements = [];
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            return {selector, count: 0};
+        }
+        const probe = {selector, count: elements.length};
+        if (elements.length > 3) {
+            const first = elements[0];
+            probe.first_class = first.getAttribute('class');
+            const attrs = {};
+            for (const attr of dataAttrs) {
+                const value = first.getAttribute(attr);
+                if (value) attrs[attr] = value;
+            }
+            probe.data_attrs = attrs;
+        }
+        return probe;
+    });
+    return {
+        url: location.href,
+        html: document.documentElement.outerHTML,
+        probes: probes.filter(probe => probe.count > 0),
+    };
+}
+"""
+
+
+class Diagnostics:
+    """샘플링 기반 DOM 진단 캡처"""
+
+    def __init__(self, sample_rate: Optional[float] = None, directory: Optional[str] = None):
+        self.sample_rate = DIAGNOSTICS_SETTINGS['sample_rate'] if sample_rate is None else sample_rate
+        self.directory = directory or DIAGNOSTICS_SETTINGS['directory']
+        self.logger = logging.getLogger('Diagnostics')
+        self._pending = set()
+
+    def should_capture(self, force: Optional[bool] = None) -> bool:
+        """요청별 설정(force)이 있으면 따르고, 없으면 sample_rate 비율로 캡처"""
+        if force is not None:
+            return force
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def capture(self, frame, query: str, selectors: Optional[List[str]] = None) -> Dict:
+        """프레임 DOM을 수집하고 파일 기록을 백그라운드로 예약"""
+        snapshot = await frame.evaluate(CAPTURE_SCRIPT, selectors or DEBUG_SELECTORS)
+        snapshot['query'] = query
+        snapshot['captured_at'] = datetime.now().isoformat()
+
+        base_name = self._capture_name(query)
+        task = asyncio.create_task(asyncio.to_thread(self._write, base_name, snapshot))
+        self._pending.add(task)
+        task.add_done_callback(self._on_written)
+
+        self.logger.info(
+            f"진단 캡처 '{query}': HTML {len(snapshot['html'])}자, "
+            f"매칭 선택자 {len(snapshot['probes'])}개 -> {base_name}"
+        )
+        return snapshot
+
+    async def flush(self):
+        """대기 중인 파일 기록 완료까지 대기"""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _capture_name(self, query: str) -> str:
+        slug = re.sub(r'[^\w가-힣]+', '_', query).strip('_')[:40] or 'query'
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{timestamp}_{slug}_{uuid.uuid4().hex[:8]}"
+
+    def _write(self, base_name: str, snapshot: Dict):
+        os.makedirs(self.directory, exist_ok=True)
+        html_path = os.path.join(self.directory, f"{base_name}.html")
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot['html'])
+
+        meta = {key: value for key, value in snapshot.items() if key != 'html'}
+        with open(os.path.join(self.directory, f"{base_name}.json"), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    def _on_written(self, task: asyncio.Task):
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception():
+            self.logger.warning(f"진단 캡처 저장 실패: {task.exception()}")
+
+
+_default_diagnostics: Optional[Diagnostics] = None
+
+
+def get_diagnostics() -> Diagnostics:
+    """프로세스 전역 진단 캡처기"""
+    global _default_diagnostics
+    if _default_diagnostics is None:
+        _default_diagnostics = Diagnostics()
+    return _default_diagnostics
@@ -0,0 +1,43 @@
+"""
+크롤링 실패 유형
+"결과 없음"(빈 리스트)과 실패를 구분할 수 있도록 단계(stage)와 재시도 가능 여부를 담은 예외를 사용한다
+"""
+
+from typing import Optional
+
+
+class CrawlError(Exception):
+    """크롤링 실패 (stage: goto, iframe, list_selector, scroll, search, http 등)"""
+
+    retryable = True
+    blocked = False
+
+    def __init__(self, message: str, stage: Optional[str] = None, status: Optional[int] = None):
+        super().__init__(message)
+        self.stage = stage
+        self.status = status
+
+    def to_dict(self):
+        return {'type': type(self).__name__, 'stage': self.stage, 'status': self.status, 'detail': str(self)}
+
+
+class BlockedError(CrawlError):
+    """차단 신호 (403/429, 캡차 페이지) - 같은 조건으로 재시도하지 않음"""
+
+    retryable = False
+    blocked = True
+
+
+class StageTimeoutError(CrawlError):
+    """단계별 대기 시간 초과"""
+
+
+class CircuitOpenError(CrawlError):
+    """차단 비율이 높아 엔진 사용이 일시 중단됨 (retry_after 초 후 다시 시도)"""
+
+    retryable = False
+
+    def __init__(self, message: str, engine: Optional[str] = None, retry_after: float = 0.0):
+        super().__init__(message, stage='circuit')
+        self.engine = engine
+        self.retry_after = retry_after
@@ -0,0 +1,276 @@
+"""
+격자(geo-grid) 순위 조사 엔진
+지역 순위는 검색 좌표(searchCoord)와 범위(boundary)에 따라 크게 달라지므로
+경계 상자를 rows x cols 타일로 나눠 타일마다 allSearch를 동시에 요청하고,
+타일 간 중복 장소를 합쳐 장소 x 타일 순위 행렬을 만든다
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+import aiohttp
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import GEO_GRID_SETTINGS
+from src.crawler.http_engine import HttpBlockedError, HttpBudgetError, HttpEngineError, search_places_http
+
+# 타일 상태
+TILE_OK = 'ok'
+TILE_ERROR = 'error'
+TILE_SKIPPED = 'skipped'  # 요청 예산 소진 또는 차단으로 요청하지 않음
+
+
+def make_grid(min_lon: float, min_lat: float, max_lon: float, max_lat: float,
+              rows: int, cols: int) -> List[Dict]:
+    """경계 상자를 rows x cols 타일로 분할 (북서쪽 r0c0부터 행 우선)
+
+    타일마다 중심 좌표(searchCoord)와 타일 범위(boundary "경도;위도;경도;위도")를 가진다.
+    """
+    if rows < 1 or cols < 1:
+        raise ValueError("rows와 cols는 1 이상이어야 합니다")
+    if rows * cols > GEO_GRID_SETTINGS['max_tiles']:
+        raise ValueError(f"타일은 최대 {GEO_GRID_SETTINGS['max_tiles']}개까지 만들 수 있습니다")
+    if min_lon >= max_lon or min_lat >= max_lat:
+        raise ValueError("경계 상자의 최소 좌표가 최대 좌표보다 작아야 합니다")
+
+    lon_step = (max_lon - min_lon) / cols
+    lat_step = (max_lat - min_lat) / rows
+    tiles = []
+    for row in range(rows):
+        top = max_lat - row * lat_step
+        bottom = top - lat_step
+        for col in range(cols):
+            left = min_lon + col * lon_step
+            right = left + lon_step
+            tiles.append({
+                'tile_id': f"r{row}c{col}",
+                'row': row,
+                'col': col,
+                'longitude': round((left + right) / 2, 7),
+                'latitude': round((top + bottom) / 2, 7),
+                'boundary': f"{left:.7f};{bottom:.7f};{right:.7f};{top:.7f}",
+            })
+    return tiles
+
+
+def point_tiles(locations: Iterable[Dict]) -> List[Dict]:
+    """이름 있는 좌표 목록을 타일로 변환 ({'name', 'longitude', 'latitude'}, boundary는 좌표 한 점)"""
+    return [
+        {
+            'tile_id': location.get('name') or f"p{i}",
+            'row': i,
+            'col': 0,
+            'longitude': location['longitude'],
+            'latitude': location['latitude'],
+            'boundary': None,
+        }
+        for i, location in enumerate(locations)
+    ]
+
+
+def place_key(place: Dict) -> str:
+    """타일 간 중복 판단 키 (플레이스 ID, 없으면 이름+주소)"""
+    return place.get('place_id') or f"{place.get('name', '')}_{place.get('address', '')}"
+
+
+class RequestBudget:
+    """조사 전체가 공유하는 allSearch 요청 수 한도"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+
+    def take(self) -> bool:
+        """요청 하나를 사용 (남은 예산이 없으면 False)"""
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    @property
+    def remaining(self) -> int:
+        return self.limit - self.used
+
+
+class GridSweep:
+    """타일별 검색을 동시에 실행하고 결과를 장소 단위로 병합
+
+    요청 예산은 재시도를 포함한 실제 HTTP 요청마다 차감되며, 아직 시작하지 않은 타일의 첫 페이지 몫을
+    남겨둔 뒤에만 다음 페이지나 재시도를 요청한다 (깊이보다 타일 범위 우선).
+    예산이 없으면 남은 타일은 skipped로 남는다.
+    max_results_per_tile이 0이면 pages_per_tile까지 모든 결과를 수집한다.
+    한 타일이라도 차단(403/429)되면 아직 시작하지 않은 타일은 요청하지 않는다.
+    concurrency는 상한이며 실제 요청 속도는 HTTP 엔진의 호스트별 속도 제한기가 조절한다.
+    """
+
+    def __init__(self, query: str, tiles: List[Dict],
+                 session: Optional[aiohttp.ClientSession] = None,
+                 concurrency: Optional[int] = None,
+                 request_budget: Optional[int] = None,
+                 pages_per_tile: Optional[int] = None,
+                 max_results_per_tile: Optional[int] = None,
+                 on_tile: Optional[Callable[[Dict], None]] = None):
+        self.query = query
+        self.tiles = tiles
+        self.session = session
+        self.concurrency = concurrency or GEO_GRID_SETTINGS['concurrency']
+        self.budget = RequestBudget(request_budget or GEO_GRID_SETTINGS['request_budget'])
+        self.pages_per_tile = pages_per_tile or GEO_GRID_SETTINGS['pages_per_tile']
+        self.max_results_per_tile = (GEO_GRID_SETTINGS['max_results_per_tile']
+                                     if max_results_per_tile is None else max_results_per_tile)
+        self.on_tile = on_tile
+        self.blocked: Optional[str] = None
+        self.tile_results: Dict[str, Dict] = {}
+        self._unstarted = len(tiles)
+
+    async def run(self) -> Dict:
+        """모든 타일을 검색하고 병합 결과 반환"""
+        started = time.perf_counter()
+        own_session = self.session is None
+        session = self.session or aiohttp.ClientSession()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_tile(tile: Dict):
+            async with semaphore:
+                self.tile_results[tile['tile_id']] = await self._search_tile(session, tile)
+                if self.on_tile:
+                    self.on_tile(self.tile_results[tile['tile_id']])
+
+        try:
+            await asyncio.gather(*(run_tile(tile) for tile in self.tiles))
+        finally:
+            if own_session:
+                await session.close()
+
+        return self.report(time.perf_counter() - started)
+
+    async def _search_tile(self, session: aiohttp.ClientSession, tile: Dict) -> Dict:
+        result = {'tile_id': tile['tile_id'], 'status': TILE_SKIPPED, 'places': [],
+                  'error': None, 'elapsed_ms': 0.0}
+        self._unstarted -= 1
+        if self.blocked:
+            result['error'] = f"차단으로 중단: {self.blocked}"
+            return result
+
+        requested = False
+
+        def charge_request(page: int, attempt: int) -> bool:
+            """HTTP 요청마다 예산 차감 (첫 페이지 첫 요청 외에는 시작하지 않은 타일 몫을 남겨둠)"""
+            nonlocal requested
+            if (page, attempt) != (1, 1) and self.budget.remaining <= self._unstarted:
+                return False
+            taken = self.budget.take()
+            requested = requested or taken
+            return taken
+
+        def reserve_for_unstarted(_) -> bool:
+            """남은 예산이 시작하지 않은 타일 몫뿐이면 다음 페이지를 요청하지 않음"""
+            return self.budget.remaining <= self._unstarted
+
+        started = time.perf_counter()
+        try:
+            result['places'] = await search_places_http(
+                self.query, self.max_results_per_tile or None,
+                longitude=tile['longitude'], latitude=tile['latitude'],
+                session=session, max_pages=self.pages_per_tile, boundary=tile['boundary'],
+                should_stop=reserve_for_unstarted, before_request=charge_request,
+            )
+            result['status'] = TILE_OK
+        except HttpBudgetError as e:
+            # 결과 없이 예산이 끝난 타일 (부분 결과가 있으면 search_places_http가 그대로 반환함)
+            if not requested:
+                result['error'] = "요청 예산 소진"
+                return result
+            result.update(status=TILE_ERROR, error=f"첫 페이지 재시도 중 {e}")
+        except HttpBlockedError as e:
+            self.blocked = str(e)
+            # 차단 전까지 받은 페이지의 순위는 유지
+            result.update(status=TILE_ERROR, error=str(e), places=getattr(e, 'partial_results', []))
+        except HttpEngineError as e:
+            result.update(status=TILE_ERROR, error=str(e))
+        result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        print(f"   📍 {tile['tile_id']}: {len(result['places'])}개 ({result['status']})")
+        return result
+
+    def merge_places(self) -> List[Dict]:
+        """타일 간 중복을 제거한 장소 목록 (최고 순위, 노출 타일 수/평균 순위 포함)
+
+        최고 순위 -> 노출 타일 수(많은 순) 순으로 정렬
+        """
+        merged: Dict[str, Dict] = {}
+        for tile in self.tiles:
+            result = self.tile_results.get(tile['tile_id'])
+            if not result:
+                continue
+            for place in result['places']:
+                key = place_key(place)
+                entry = merged.get(key)
+                if entry is None:
+                    entry = merged[key] = {
+                        **{k: v for k, v in place.items() if k not in ('rank', 'page')},
+                        'place_key': key,
+                        'best_rank': place['rank'],
+                        'best_tile': tile['tile_id'],
+                        'ranks': {},
+                    }
+                entry['ranks'][tile['tile_id']] = place['rank']
+                if place['rank'] < entry['best_rank']:
+                    entry['best_rank'] = place['rank']
+                    entry['best_tile'] = tile['tile_id']
+
+        places = list(merged.values())
+        for entry in places:
+            entry['tiles_seen'] = len(entry['ranks'])
+            entry['average_rank'] = round(sum(entry['ranks'].values()) / entry['tiles_seen'], 2)
+        places.sort(key=lambda entry: (entry['best_rank'], -entry['tiles_seen']))
+        return places
+
+    def report(self, elapsed: float = 0.0) -> Dict:
+        places = self.merge_places()
+        statuses = [self.tile_results.get(tile['tile_id'], {}).get('status', TILE_SKIPPED)
+                    for tile in self.tiles]
+        return {
+            'query': self.query,
+            'tiles': [
+                {**tile, **{k: v for k, v in self.tile_results.get(tile['tile_id'], {}).items()
+                            if k != 'places'},
+                 'result_count': len(self.tile_results.get(tile['tile_id'], {}).get('places', []))}
+                for tile in self.tiles
+            ],
+            'places': places,
+            'tile_count': len(self.tiles),
+            'tiles_ok': statuses.count(TILE_OK),
+            'tiles_failed': statuses.count(TILE_ERROR),
+            'tiles_skipped': statuses.count(TILE_SKIPPED),
+            'requests_used': self.budget.used,
+            'request_budget': self.budget.limit,
+            'blocked': self.blocked,
+            'elapsed_seconds': round(elapsed, 2),
+        }
+
+
+def rank_matrix(sweep: Dict) -> Tuple[List[str], List[Dict]]:
+    """sweep 결과로 장소 x 타일 순위 행렬 생성
+
+    반환값: (타일 ID 목록, [{'place_key', 'name', 'ranks': [타일 순서대로 순위 또는 None]}])
+    """
+    tile_ids = [tile['tile_id'] for tile in sweep['tiles']]
+    rows = [
+        {
+            'place_key': place['place_key'],
+            'name': place.get('name', ''),
+            'ranks': [place['ranks'].get(tile_id) for tile_id in tile_ids],
+        }
+        for place in sweep['places']
+    ]
+    return tile_ids, rows
+
+
+async def sweep_grid(query: str, tiles: List[Dict], **options) -> Dict:
+    """타일 목록으로 격자 조사 실행 (options는 GridSweep 인자)"""
+    return await GridSweep(query, tiles, **options).run()
@@ -0,0 +1,179 @@
+"""
+HTTP 검색 엔진
+네이버 지도 allSearch JSON API를 aiohttp로 직접 호출한다.
+브라우저 없이 밀리초 단위로 응답하며, 차단(403/429)이나 응답 구조 변경 시
+HttpEngineError를 발생시켜 호출하는 쪽에서 브라우저 엔진으로 대체할 수 있게 한다
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+import sys
+import os
+
+import aiohttp
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import HTTP_ENGINE_SETTINGS
+from src.crawler.network_engine import extract_place_items, normalize_place
+from src.crawler.errors import BlockedError, CrawlError
+from src.crawler.rate_limiter import get_rate_limiter
+from src.crawler.resilience import retry_stage
+
+
+class HttpEngineError(CrawlError):
+    """HTTP 엔진 검색 실패"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message, stage='http', status=status)
+
+
+class HttpBlockedError(HttpEngineError, BlockedError):
+    """접근 거부/요청 제한 (403, 429)"""
+
+
+class HttpSchemaError(HttpEngineError):
+    """예상하지 못한 응답 구조 (재시도해도 같으므로 재시도하지 않음)"""
+
+    retryable = False
+
+
+class HttpBudgetError(HttpEngineError):
+    """호출한 쪽의 요청 한도(before_request)가 더 이상 요청을 허용하지 않음"""
+
+    retryable = False
+
+
+def build_headers(query: str) -> Dict[str, str]:
+    """allSearch 요청 헤더"""
+    return {
+        "authority": "map.naver.com",
+        "accept": "application/json, text/plain, */*",
+        "accept-language": "ko-KR,ko;q=0.8,en-US;q=0.6,en;q=0.4",
+        "user-agent": HTTP_ENGINE_SETTINGS['user_agent'],
+        "referer": f"https://map.naver.com/p/search/{quote(query)}?c=15.00,0,0,0,dh",
+    }
+
+
+def build_params(query: str, page: int, longitude: float, latitude: float,
+                 boundary: Optional[str] = None) -> Dict[str, str]:
+    """allSearch 요청 파라미터 (boundary가 없으면 좌표 한 점으로 지정)"""
+    return {
+        "query": query,
+        "type": "all",
+        "searchCoord": f"{longitude};{latitude}",
+        "boundary": boundary or f"{longitude};{latitude};{longitude};{latitude}",
+        "page": str(page),
+    }
+
+
+def parse_all_search_page(payload: Any) -> List[Dict]:
+    """allSearch 응답에서 장소 항목 추출
+
+    결과가 없는 정상 응답은 빈 리스트, 구조를 인식할 수 없으면 HttpSchemaError
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get('result'), dict):
+        raise HttpSchemaError("allSearch 응답에 result가 없습니다")
+
+    place = payload['result'].get('place')
+    if place is None:
+        return []
+    if not isinstance(place, dict) or not isinstance(place.get('list'), list):
+        raise HttpSchemaError("allSearch 응답의 place.list 구조가 변경되었습니다")
+    return extract_place_items(payload)
+
+
+async def fetch_all_search_page(session: aiohttp.ClientSession, query: str, page: int,
+                                longitude: float, latitude: float,
+                                boundary: Optional[str] = None) -> List[Dict]:
+    """allSearch 한 페이지 요청 (호스트별 속도 제한기를 거침, 403/429는 제한기에 차단 신호로 전달)"""
+    try:
+        async with get_rate_limiter().request(HTTP_ENGINE_SETTINGS['url']):
+            async with session.get(
+                HTTP_ENGINE_SETTINGS['url'],
+                headers=build_headers(query),
+                params=build_params(query, page, longitude, latitude, boundary),
+                timeout=aiohttp.ClientTimeout(total=HTTP_ENGINE_SETTINGS['timeout']),
+            ) as response:
+                if response.status in (403, 429):
+                    raise HttpBlockedError(f"접근 거부 (HTTP {response.status})", response.status)
+                if response.status != 200:
+                    raise HttpEngineError(f"HTTP {response.status}", response.status)
+                try:
+                    payload = await response.json(content_type=None)
+                except ValueError:
+                    raise HttpSchemaError("allSearch 응답이 JSON이 아닙니다", response.status)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise HttpEngineError(f"요청 실패: {e!r}")
+
+    return parse_all_search_page(payload)
+
+
+async def search_places_http(query: str, max_results: Optional[int] = 10,
+                             longitude: Optional[float] = None, latitude: Optional[float] = None,
+                             session: Optional[aiohttp.ClientSession] = None,
+                             max_pages: Optional[int] = None,
+                             boundary: Optional[str] = None,
+                             should_stop: Optional[Callable[[List[Dict]], bool]] = None,
+                             before_request: Optional[Callable[[int, int], bool]] = None) -> List[Dict]:
+    """allSearch API로 장소 검색 (크롤러 결과와 같은 형식, 페이지 번호 포함)
+
+    max_results가 None이면 max_pages까지 모든 결과 수집
+    should_stop: 페이지마다 새로 추가된 결과로 호출되며 True를 반환하면 다음 페이지를 요청하지 않음
+    before_request: 재시도를 포함한 실제 HTTP 요청마다 (페이지, 시도 번호)로 호출되며
+    False를 반환하면 요청하지 않고 HttpBudgetError로 중단 (요청 예산 차감용)
+    두 번째 페이지부터 실패하면 이미 모은 결과를 반환한다. 단 차단(403/429)은
+    서킷 브레이커/격자 조사가 알 수 있도록 그대로 발생시키고, 모은 결과는 예외의 partial_results에 담는다.
+    """
+    longitude = HTTP_ENGINE_SETTINGS['default_longitude'] if longitude is None else longitude
+    latitude = HTTP_ENGINE_SETTINGS['default_latitude'] if latitude is None else latitude
+    max_pages = max_pages or HTTP_ENGINE_SETTINGS['max_pages']
+
+    own_session = session is None
+    session = session or aiohttp.ClientSession()
+    results: List[Dict] = []
+    seen_ids = set()
+    try:
+        for page in range(1, max_pages + 1):
+            attempt = 0
+
+            async def fetch_page(page: int = page) -> List[Dict]:
+                nonlocal attempt
+                attempt += 1
+                if before_request and not before_request(page, attempt):
+                    raise HttpBudgetError(f"요청 한도 소진 ({page}페이지 {attempt}번째 시도)")
+                return await fetch_all_search_page(session, query, page, longitude, latitude, boundary)
+
+            # 네트워크 오류/5xx는 지터 백오프로 재시도, 차단(403/429)과 구조 변경은 바로 실패
+            try:
+                items = await retry_stage("http", fetch_page)
+            except CrawlError as e:
+                if not results:
+                    raise
+                if e.blocked:
+                    e.partial_results = results if max_results is None else results[:max_results]
+                    raise
+                if not isinstance(e, HttpBudgetError):
+                    print(f"⚠ '{query}' {page}페이지 실패, {len(results)}개 결과만 반환: {e}")
+                break
+            if not items:
+                break
+            page_start = len(results)
+            for item in items:
+                place = normalize_place(item, len(results) + 1)
+                if place['place_id'] in seen_ids:
+                    continue
+                seen_ids.add(place['place_id'])
+                place['page'] = page
+                results.append(place)
+            if max_results is not None and len(results) >= max_results:
+                break
+            if should_stop and should_stop(results[page_start:]):
+                break
+    finally:
+        if own_session:
+            await session.close()
+
+    return results if max_results is None else results[:max_results]
@@ -5,12 +5,14 @@ Playwright 기반으로 개선된 크롤링
 """
 
 import asyncio
+import inspect
 import logging
 import time
 import random
 import json
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import sys
 import os
 from urllib.parse import quote
@@ -21,19 +23,182 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from config.settings import (
     BROWSER_SETTINGS, NAVER_MAP, CRAWLING_SETTINGS, 
-    STEALTH_SETTINGS
+    STEALTH_SETTINGS, READINESS_SETTINGS, RANK_LOOKUP_SETTINGS, CIRCUIT_BREAKER_SETTINGS
 )
-from src.crawler.stealth_utils import StealthUtils
+from src.crawler.stealth_utils import draw_profile, profile_context_options, profile_init_script
+from src.crawler.resource_blocker import ResourceBlocker, create_resource_blocker
+from src.crawler.selector_cache import SelectorCache, get_selector_cache, resolve_result_selector
+from src.crawler.scroll_engine import DeepListScroller
+from src.crawler.network_engine import SearchResponseCollector
+from src.crawler.http_engine import HttpEngineError, search_places_http
+from src.crawler.diagnostics import Diagnostics, get_diagnostics
+from src.crawler.target_matcher import TargetMatcher
+from src.crawler.rate_limiter import BLOCK_STATUSES, get_rate_limiter, is_captcha_url
+from src.crawler.errors import BlockedError, CrawlError
+from src.crawler.resilience import get_circuit_breaker, retry_stage, to_crawl_error
+from src.crawler.readiness import (
+    StageTimer, has_no_results_message, is_search_list_response, wait_for_item_count_settle
+)
+from src.utils.raw_text_parser import extract_business_name, parse_raw_text
+
+# 단계 대기 시간 초과로 보는 예외 (StageTimeoutError로 변환)
+STAGE_TIMEOUT_ERRORS = (PlaywrightTimeoutError, asyncio.TimeoutError)
+
+# DOM 필드 요소가 없을 때 원시 텍스트에서 채우는 필드
+RAW_TEXT_FIELDS = ('name', 'category', 'address', 'rating', 'review_count')
+
+
+def is_production_environment() -> bool:
+    """Railway/production 환경 여부"""
+    return bool(os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("PORT"))
+
+
+# Chromium 실행 인수
+CHROMIUM_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-features=TranslateUI',
+    '--disable-extensions',
+    # Production 환경 추가 설정
+    '--single-process',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows'
+]
+
+
+async def launch_chromium(playwright) -> Browser:
+    """환경에 맞는 설정으로 Chromium 실행"""
+    is_production = is_production_environment()
+    return await playwright.chromium.launch(
+        headless=True if is_production else False,  # 환경에 따라 자동 설정
+        slow_mo=1000 if not is_production else 0,   # production에서는 빠르게
+        args=CHROMIUM_LAUNCH_ARGS
+    )
+
+
+async def create_crawl_context(browser: Browser,
+                               blocker: Optional[ResourceBlocker] = None,
+                               profile: Optional[Dict] = None) -> BrowserContext:
+    """크롤링용 브라우저 컨텍스트 생성 (blocker가 있으면 불필요한 리소스 차단)
+
+    profile을 주지 않으면 핑거프린트 프로필 풀에서 하나를 뽑아 UA/뷰포트/로케일을 함께 적용한다.
+    """
+    profile = profile or draw_profile()
+    context = await browser.new_context(**profile_context_options(profile))
+    init_script = profile_init_script(profile)
+    if init_script:
+        await context.add_init_script(init_script)
+    if blocker:
+        await blocker.install(context)
+    return context
+
+
+# 진행 이벤트 콜백: (단계 이름, 데이터) 형식으로 호출됨
+ProgressCallback = Callable[[str, Dict], None]
+# 검색 시작 페이지
+NAVER_MAP_SEARCH_URL = "https://map.naver.com/p?c=15.00,0,0,0,dh"
+
+# 키워드 완료 콜백: (키워드, 결과, 키워드별 통계)
+ResultCallback = Callable[[str, List[Dict], Dict], Optional[Awaitable[None]]]
+
+
+def emit_progress(on_event: Optional[ProgressCallback], stage: str, **data):
+    """진행 이벤트 전달 (콜백 오류는 크롤링에 영향을 주지 않음)"""
+    if on_event is None:
+        return
+    try:
+        on_event(stage, data)
+    except Exception as e:
+        logging.getLogger('NaverMapCrawler').warning(f"진행 이벤트 콜백 오류 ({stage}): {e}")
+
+
+# 검색 엔진: browser(Playwright), http(allSearch API), auto(http 우선, 실패 시 browser)
+SEARCH_ENGINES = ('browser', 'http', 'auto')
+
+
+async def run_search_engine(engine: str, query: str, max_results: int,
+                            browser_search: Callable[[], Awaitable[List[Dict]]],
+                            longitude: Optional[float] = None,
+                            latitude: Optional[float] = None,
+                            http_session=None,
+                            on_event: Optional[ProgressCallback] = None,
+                            should_stop: Optional[Callable[[List[Dict]], bool]] = None) -> Tuple[List[Dict], str]:
+    """엔진 선택에 따라 검색 실행 후 (결과, 실제 사용한 엔진) 반환
+    
+    auto는 HTTP 엔진이 차단(403/429)되거나 응답 구조가 바뀌면 browser_search로 대체한다.
+    http는 실패 시 HttpEngineError를 그대로 발생시킨다.
+    요청한 엔진의 서킷이 열려 있으면 다른 엔진으로 전환하고(auto 또는 route_to_other_engine 설정),
+    전환할 수 없으면 CircuitOpenError로 즉시 실패한다.
+    should_stop은 HTTP 엔진의 페이지 요청 조기 종료에 사용된다.
+    """
+    if engine not in SEARCH_ENGINES:
+        raise ValueError(f"알 수 없는 검색 엔진: {engine}")
+    
+    primary = 'browser' if engine == 'browser' else 'http'
+    secondary = 'http' if primary == 'browser' else 'browser'
+    chosen = primary
+    can_route = engine == 'auto' or CIRCUIT_BREAKER_SETTINGS['route_to_other_engine']
+    if (can_route and not get_circuit_breaker(primary).is_available()
+            and get_circuit_breaker(secondary).is_available()):
+        print(f"⚠ {primary} 서킷이 열려 {secondary} 엔진으로 전환")
+        emit_progress(on_event, "engine_fallback", reason=f"{primary} circuit open")
+        chosen = secondary
+    
+    if chosen == 'http':
+        try:
+            emit_progress(on_event, "http_request", query=query)
+            results = await get_circuit_breaker('http').call(lambda: search_places_http(
+                query, max_results, longitude, latitude, session=http_session,
+                should_stop=should_stop
+            ))
+            for place in results:
+                emit_progress(on_event, "place", place=place)
+            emit_progress(on_event, "extracted", count=len(results), source="http")
+            return results, 'http'
+        except HttpEngineError as e:
+            if engine != 'auto':
+                raise
+            print(f"⚠ HTTP 엔진 실패, 브라우저로 대체: {e}")
+            emit_progress(on_event, "engine_fallback", reason=str(e))
+    
+    return await browser_search(), 'browser'
 
 
 class NaverMapCrawler:
     """네이버 지도 크롤러 (iframe 방식)"""
     
-    def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None 
-        self.page: Optional[Page] = None
+    def __init__(self, browser: Optional[Browser] = None,
+                 context: Optional[BrowserContext] = None,
+                 page: Optional[Page] = None,
+                 selector_cache: Optional[SelectorCache] = None,
+                 diagnostics: Optional[Diagnostics] = None,
+                 resource_blocker: Optional[ResourceBlocker] = None):
+        self.browser: Optional[Browser] = browser
+        self.context: Optional[BrowserContext] = context
+        self.page: Optional[Page] = page
         self.playwright = None
+        # 외부(브라우저 풀)에서 주입받은 브라우저는 직접 종료하지 않음
+        self._owns_browser = browser is None
+        # async with 사용 중에는 검색마다 브라우저를 닫지 않음
+        self._managed = False
+        self.last_keyword_stats: Dict[str, Dict] = {}
+        self.last_wait_timings: Dict = {}
+        self.selector_cache = selector_cache or get_selector_cache()
+        self.diagnostics = diagnostics or get_diagnostics()
+        # 주입받은 컨텍스트는 주입한 쪽의 차단기를 사용, 직접 만드는 컨텍스트는 init_browser에서 생성
+        self.resource_blocker = resource_blocker
+        self.last_resource_stats: Dict = {}
+        self.last_engine: Optional[str] = None
+        self.last_scroll_report: Dict = {}
         self.setup_logging()
         
     def setup_logging(self):
@@ -51,42 +216,14 @@ class NaverMapCrawler:
     async def init_browser(self):
         """브라우저 초기화 (환경에 따라 headless 모드 자동 설정)"""
         try:
-            # 환경 감지: Railway/production 환경에서는 headless=True
-            is_production = os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("PORT")
-            headless_mode = True if is_production else False
-            
-            self.logger.info(f"환경 감지: {'Production (headless)' if is_production else 'Development (GUI)'}")
+            self.logger.info(f"환경 감지: {'Production (headless)' if is_production_environment() else 'Development (GUI)'}")
             
             self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=headless_mode,  # 환경에 따라 자동 설정
-                slow_mo=1000 if not is_production else 0,   # production에서는 빠르게
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--disable-gpu',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=TranslateUI',
-                    '--disable-extensions',
-                    # Production 환경 추가 설정
-                    '--single-process',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows'
-                ]
-            )
+            self.browser = await launch_chromium(self.playwright)
             
             # 컨텍스트 생성
-            self.context = await self.browser.new_context(
-                viewport={'width': 1366, 'height': 768},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            self.resource_blocker = create_resource_blocker()
+            self.context = await create_crawl_context(self.browser, self.resource_blocker)
             
             # 페이지 생성
             self.page = await self.context.new_page()
@@ -99,66 +236,340 @@ class NaverMapCrawler:
     
     def extract_business_name(self, raw_text: str) -> str:
         """원시 텍스트에서 업체명만 추출"""
+        return extract_business_name(raw_text)
+        
+    def _build_result(self, record: Dict) -> Optional[Dict]:
+        """추출 레코드를 결과 형식으로 변환 (빈 항목은 None)"""
+        raw_text = record.get('raw_text', '').strip()
         if not raw_text:
-            return ""
+            return None
         
-        # 일반적인 구분 키워드들
-        keywords = [
-            "예약", "광고", "영업", "리뷰", "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
-            "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
-            "네이버페이", "톡톡", "별점", "현재", "위치", "거리", "출발", "도착", "상세주소", "저장", "더보기"
-        ]
+        # 필드 요소가 없는 항목만 원시 텍스트에서 파싱
+        missing = [field for field in RAW_TEXT_FIELDS if not record.get(field)]
+        parsed = parse_raw_text(raw_text, missing) if missing else {}
         
-        # 키워드 중 가장 먼저 나오는 위치 찾기
-        first_keyword_pos = len(raw_text)
-        for keyword in keywords:
-            pos = raw_text.find(keyword)
-            if pos != -1 and pos < first_keyword_pos:
-                first_keyword_pos = pos
+        return {
+            'rank': record['index'] + 1,
+            # 이름 요소가 있으면 사용, 없으면 원시 텍스트에서 파싱
+            'name': record.get('name') or parsed['name'],
+            'raw_text': raw_text,
+            'category': record.get('category') or parsed.get('category', ''),
+            'address': record.get('address') or parsed.get('address', ''),
+            'rating': record.get('rating') or parsed.get('rating', ''),
+            'review_count': record.get('review_count') or parsed.get('review_count', ''),
+            'phone': record.get('phone', ''),
+            'place_id': record.get('place_id', ''),
+        }
+    
+    def _append_records(self, records: List[Dict], results: List[Dict],
+                        on_event: Optional[ProgressCallback] = None):
+        """추출 레코드를 결과 형식으로 변환하여 results에 추가하고 place 이벤트 전달"""
+        for record in records:
+            result = self._build_result(record)
+            if result:
+                results.append(result)
+                print(f"{result['rank']}. {result['name']}")
+                emit_progress(on_event, "place", place=result)
+    
+    async def search_places(self, query: str, max_results: int = 10,
+                            diagnostics: Optional[bool] = None,
+                            mode: Optional[str] = None,
+                            engine: Optional[str] = None,
+                            longitude: Optional[float] = None,
+                            latitude: Optional[float] = None,
+                            on_event: Optional[ProgressCallback] = None) -> List[Dict]:
+        """네이버 지도에서 장소 검색
         
-        # 업체명 추출 (키워드 전까지, 최대 30자)
-        name = raw_text[:first_keyword_pos].strip()
-        if len(name) > 30:
-            name = name[:30] + "..."
-            
-        return name if name else raw_text[:20] + "..." if len(raw_text) > 20 else raw_text
+        diagnostics: True면 DOM 진단 캡처, False면 캡처 안 함, None이면 설정된 샘플링 비율을 따름
+        mode: 'dom'(렌더링된 목록 파싱) 또는 'network'(검색 응답 JSON 파싱, 실패 시 dom으로 대체).
+              None이면 CRAWLING_SETTINGS['crawl_mode']
+        engine: 'browser', 'http', 'auto'. None이면 CRAWLING_SETTINGS['engine']
+        longitude/latitude: HTTP 엔진 검색 기준 좌표 (None이면 기본 좌표)
+        on_event: 진행 이벤트 콜백 (page_loaded, frame_found, results_found, scroll, extracted)
+        
+        빈 리스트는 "검색 결과 없음"이며, 실패는 CrawlError 계열 예외로 발생한다
+        (BlockedError: 차단, StageTimeoutError: 단계 시간 초과, CircuitOpenError: 서킷 열림).
+        """
+        try:
+            results, self.last_engine = await run_search_engine(
+                engine or CRAWLING_SETTINGS['engine'], query, max_results,
+                lambda: self._browser_search(query, max_results, diagnostics, mode, on_event),
+                longitude=longitude, latitude=latitude, on_event=on_event
+            )
+            return results
+        except CrawlError as e:
+            print(f"❌ 검색 실패 ({type(e).__name__}, 단계 {e.stage}): {e}")
+            raise
         
-    async def search_places(self, query: str, max_results: int = 10) -> List[Dict]:
-        """네이버 지도에서 장소 검색"""
+        finally:
+            # async with 블록 안에서는 __aexit__에서 종료
+            if self._owns_browser and not self._managed and self.browser:
+                print("브라우저 종료...")
+                await self.close()
+    
+    async def _browser_search(self, query: str, max_results: int,
+                              diagnostics: Optional[bool] = None,
+                              mode: Optional[str] = None,
+                              on_event: Optional[ProgressCallback] = None,
+                              matcher: Optional[TargetMatcher] = None) -> List[Dict]:
+        """브라우저(Playwright) 엔진으로 검색 (서킷이 열려 있으면 브라우저를 띄우지 않고 실패)"""
+        breaker = get_circuit_breaker('browser')
+        if not breaker.is_available():
+            breaker.check()  # CircuitOpenError
         if not self.browser:
             await self.init_browser()
             
+        timer = StageTimer()
+        resource_before = self.resource_blocker.snapshot() if self.resource_blocker else None
+        try:
+            return await breaker.call(lambda: self._search_on_page(
+                self.page, query, max_results, timer, diagnostics, mode, on_event, matcher
+            ))
+        
+        finally:
+            self.last_wait_timings = timer.report()
+            if resource_before:
+                self.last_resource_stats = self.resource_blocker.since(resource_before)
+                self.logger.info(
+                    f"'{query}' 리소스 차단: 요청 {self.last_resource_stats['requests_blocked']}/"
+                    f"{self.last_resource_stats['requests_total']}건, "
+                    f"약 {self.last_resource_stats['estimated_bytes_saved'] // 1024}KB 절감"
+                )
+    
+    async def find_ranks(self, query: str, targets: List[str],
+                         rank_cap: Optional[int] = None,
+                         mode: Optional[str] = None,
+                         engine: Optional[str] = None,
+                         longitude: Optional[float] = None,
+                         latitude: Optional[float] = None,
+                         http_session=None,
+                         on_event: Optional[ProgressCallback] = None) -> Dict:
+        """대상 업체(업체명 또는 플레이스 ID)의 순위 조회
+        
+        모든 대상을 찾거나 rank_cap 순위에 도달하면 스크롤/추출/페이지 요청을 멈추고
+        대상별 순위와 매칭 근거만 반환한다 (찾지 못한 대상은 rank None).
+        """
+        matcher = TargetMatcher(targets)
+        rank_cap = min(rank_cap or RANK_LOOKUP_SETTINGS['default_rank_cap'],
+                       RANK_LOOKUP_SETTINGS['max_rank_cap'])
+        
+        async def browser_search() -> List[Dict]:
+            # auto 엔진에서 HTTP 도중 실패했으면 그때까지의 기록은 버리고 다시 확인
+            matcher.reset()
+            return await self._browser_search(query, rank_cap, mode=mode, on_event=on_event,
+                                              matcher=matcher)
+        
+        started = time.perf_counter()
+        try:
+            _, self.last_engine = await run_search_engine(
+                engine or CRAWLING_SETTINGS['engine'], query, rank_cap, browser_search,
+                longitude=longitude, latitude=latitude, http_session=http_session, on_event=on_event,
+                should_stop=lambda places: matcher.scan(p for p in places if p['rank'] <= rank_cap)
+            )
+        finally:
+            if self._owns_browser and not self._managed and self.browser:
+                await self.close()
+        
+        self.logger.info(
+            f"'{query}' 순위 조회: {len(matcher.found)}/{len(matcher.targets)}개 발견 "
+            f"(결과 {matcher.scanned}개 확인, {time.perf_counter() - started:.1f}초)"
+        )
+        return {
+            'query': query,
+            'rank_cap': rank_cap,
+            'engine': self.last_engine,
+            'all_found': matcher.done,
+            'scanned': matcher.scanned,
+            'targets': matcher.report(),
+        }
+    
+    async def crawl_keywords(self, keywords: List[str], max_results: int = 10,
+                             concurrency: Optional[int] = None,
+                             mode: Optional[str] = None,
+                             on_result: Optional[ResultCallback] = None,
+                             retain_results: bool = True) -> Dict[str, List[Dict]]:
+        """여러 키워드를 동시에 검색 (키워드별 결과 반환)
+        
+        키워드마다 별도 컨텍스트/페이지를 사용하는 워커를 최대 concurrency개 실행하며,
+        키워드별 소요 시간은 self.last_keyword_stats에 기록된다.
+        on_result(keyword, places, stats)는 키워드가 끝날 때마다 호출되며(동기/비동기 모두 가능)
+        결과를 바로 파일에 기록할 때 사용한다. retain_results가 False면 결과를 메모리에
+        모아두지 않고 빈 dict를 반환한다 (on_result로만 전달).
+        """
+        if not self.browser:
+            await self.init_browser()
+        
+        # 중복 키워드 제거 (입력 순서 유지)
+        unique_keywords = list(dict.fromkeys(keywords))
+        concurrency = concurrency or CRAWLING_SETTINGS['keyword_concurrency']
+        worker_count = max(1, min(concurrency, len(unique_keywords)))
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for keyword in unique_keywords:
+            queue.put_nowait(keyword)
+        
+        results: Dict[str, List[Dict]] = {}
+        stats: Dict[str, Dict] = {}
+        
+        async def worker(worker_id: int):
+            blocker = create_resource_blocker()
+            context = await create_crawl_context(self.browser, blocker)
+            try:
+                page = await context.new_page()
+                while True:
+                    try:
+                        keyword = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    
+                    started = time.perf_counter()
+                    timer = StageTimer()
+                    resource_before = blocker.snapshot() if blocker else None
+                    error = None
+                    error_type = None
+                    try:
+                        places = await get_circuit_breaker('browser').call(
+                            lambda: self._search_on_page(page, keyword, max_results, timer, mode=mode)
+                        )
+                    except Exception as e:
+                        error = str(e)
+                        error_type = type(e).__name__
+                        places = []
+                    
+                    elapsed = time.perf_counter() - started
+                    stats[keyword] = {
+                        'elapsed_seconds': round(elapsed, 2),
+                        'result_count': len(places),
+                        'worker': worker_id,
+                        'wait_timings': timer.report(),
+                        'resource_savings': blocker.since(resource_before) if blocker else {},
+                        'error': error,
+                        'error_type': error_type,  # BlockedError, StageTimeoutError, CircuitOpenError 등
+                    }
+                    self.logger.info(f"'{keyword}' 완료: {len(places)}개 ({elapsed:.1f}초, 워커 {worker_id})")
+                    if retain_results:
+                        results[keyword] = places
+                    if on_result:
+                        outcome = on_result(keyword, places, stats[keyword])
+                        if inspect.isawaitable(outcome):
+                            await outcome
+            finally:
+                await context.close()
+        
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(worker(i) for i in range(worker_count)))
+        finally:
+            if self._owns_browser and not self._managed:
+                await self.close()
+        
+        self.last_keyword_stats = stats
+        self.logger.info(
+            f"키워드 {len(unique_keywords)}개 크롤링 완료 "
+            f"(동시 {worker_count}개, 총 {time.perf_counter() - started:.1f}초)"
+        )
+        if not retain_results:
+            return {}
+        return {keyword: results.get(keyword, []) for keyword in unique_keywords}
+    
+    async def _navigate(self, page: Page, url: str):
+        """호스트별 속도 제한기를 거쳐 페이지 이동 (403/429/캡차 페이지는 차단 신호로 전달 후 BlockedError)"""
+        async with get_rate_limiter().request(url) as slot:
+            response = await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            if response and response.status in BLOCK_STATUSES:
+                slot.blocked(f"HTTP {response.status}")
+                raise BlockedError(f"접근 거부 (HTTP {response.status})", stage='goto', status=response.status)
+            if is_captcha_url(page.url):
+                slot.blocked("captcha")
+                raise BlockedError(f"캡차 페이지로 이동됨: {page.url}", stage='goto')
+    
+    async def _search_on_page(self, page: Page, query: str, max_results: int,
+                              timer: Optional[StageTimer] = None,
+                              diagnostics: Optional[bool] = None,
+                              mode: Optional[str] = None,
+                              on_event: Optional[ProgressCallback] = None,
+                              matcher: Optional[TargetMatcher] = None) -> List[Dict]:
+        """주어진 페이지에서 검색을 수행하고 결과 수집
+        
+        고정 sleep 대신 검색 목록 응답/프레임 로드/항목 수 안정화 신호로 대기하며
+        단계별 대기 시간은 timer에 기록된다.
+        목록은 DeepListScroller로 컨테이너 스크롤/페이지 이동을 하며 수집하고
+        단계별 항목 수는 self.last_scroll_report에 기록된다.
+        matcher가 있으면 스크롤할 때마다 새 항목을 추출해 대상을 확인하고,
+        모든 대상을 찾으면 즉시 멈춘다 (순위 조회).
+        단계(goto, iframe, list_selector, scroll)마다 지터 백오프로 재시도하며
+        실패하면 CrawlError 계열 예외를 발생시킨다 (이미 수집한 결과가 있으면 그 결과 반환).
+        목록을 찾지 못했을 때는 '검색 결과 없음' 안내가 보이는 경우만 빈 리스트를 반환한다.
+        """
         results = []
+        incremental = on_event is not None or matcher is not None
+        timer = timer or StageTimer()
+        response_task = None
+        mode = mode or CRAWLING_SETTINGS['crawl_mode']
+        collector = None
         
         try:
             print("네이버 지도 접속 중...")
-            await self.page.goto("https://map.naver.com/p?c=15.00,0,0,0,dh", wait_until='domcontentloaded', timeout=30000)
-            print("✓ 페이지 로드 완료: https://map.naver.com/p?c=15.00,0,0,0,dh")
             
-            # 검색창 찾기
-            print("검색창 찾는 중...")
-            search_input = await self.page.wait_for_selector(".input_search", timeout=10000)
+            async def open_search_page():
+                await self._navigate(page, NAVER_MAP_SEARCH_URL)
+                print(f"✓ 페이지 로드 완료: {NAVER_MAP_SEARCH_URL}")
+                # 검색창 찾기
+                print("검색창 찾는 중...")
+                return await page.wait_for_selector(".input_search", timeout=10000)
+            
+            search_input = await retry_stage("goto", open_search_page, timeout_types=STAGE_TIMEOUT_ERRORS)
             print("✓ 검색창 발견!")
+            emit_progress(on_event, "page_loaded")
+            
+            # 검색 목록 응답 대기를 검색 실행 전에 등록 (응답을 놓치지 않도록)
+            response_task = asyncio.ensure_future(page.wait_for_event(
+                "response",
+                predicate=is_search_list_response,
+                timeout=READINESS_SETTINGS['search_response_timeout']
+            ))
+            
+            # network 모드: 검색 목록 응답 JSON 수집 시작
+            if mode == 'network':
+                collector = SearchResponseCollector(page)
+                collector.attach()
             
             # 검색 실행
             await search_input.fill(query)
-            await self.page.keyboard.press("Enter")
+            await page.keyboard.press("Enter")
             print("✓ 검색 실행")
+            emit_progress(on_event, "search_submitted", query=query)
+            
+            if collector:
+                network_places = await timer.measure("network_payload", collector.wait_for_places(
+                    max_results, READINESS_SETTINGS['search_response_timeout'] / 1000
+                ))
+                if network_places and matcher and not matcher.scan(network_places):
+                    # 응답에 대상이 없으면 DOM 목록을 스크롤하며 더 깊이 확인
+                    print(f"⚠ 검색 응답 {len(network_places)}개에 대상이 없어 DOM 방식으로 계속 확인")
+                    matcher.reset()
+                elif network_places:
+                    print(f"✓ 검색 응답에서 {len(network_places)}개 수집 (응답 {collector.payload_count}개)")
+                    for place in network_places:
+                        print(f"{place['rank']}. {place['name']}")
+                        emit_progress(on_event, "place", place=place)
+                    emit_progress(on_event, "extracted", count=len(network_places), source="network")
+                    return network_places
+                else:
+                    print("⚠ 검색 응답을 파싱하지 못해 DOM 방식으로 대체")
             
             # searchIframe 로드 대기 및 안정적인 접근
             print("searchIframe 로드 대기 중...")
             
-            # iframe이 완전히 로드될 때까지 더 오래 기다리기
-            try:
+            async def wait_for_search_iframe():
                 # iframe 요소가 나타날 때까지 대기
-                await self.page.wait_for_selector("#searchIframe", timeout=15000)
+                await timer.measure("iframe", page.wait_for_selector(
+                    "#searchIframe", timeout=READINESS_SETTINGS['iframe_timeout']
+                ))
                 print("✓ searchIframe 요소 발견!")
                 
-                # iframe이 완전히 로드될 때까지 추가 대기
-                await asyncio.sleep(3)
-                
                 # iframe 로드 상태 확인
-                iframe_element = await self.page.query_selector("#searchIframe")
+                iframe_element = await page.query_selector("#searchIframe")
                 if iframe_element:
                     # iframe의 src 속성 확인
                     src = await iframe_element.get_attribute("src")
@@ -166,17 +577,15 @@ class NaverMapCrawler:
                     
                     # iframe이 완전히 로드될 때까지 대기
                     await iframe_element.wait_for_element_state("visible")
-                    
-            except Exception as e:
-                print(f"❌ searchIframe 로드 실패: {e}")
-                return []
+            
+            await retry_stage("iframe", wait_for_search_iframe, timeout_types=STAGE_TIMEOUT_ERRORS)
             
             # iframe으로 전환 - 여러 방법 시도
             search_frame = None
             
             # 방법 1: name으로 접근
             try:
-                search_frame = self.page.frame(name="searchIframe")
+                search_frame = page.frame(name="searchIframe")
                 if search_frame:
                     print("✓ 방법1(name) - searchIframe 접근 성공!")
             except Exception as e:
@@ -185,7 +594,7 @@ class NaverMapCrawler:
             # 방법 2: url로 접근
             if not search_frame:
                 try:
-                    frames = self.page.frames
+                    frames = page.frames
                     for frame in frames:
                         frame_url = frame.url
                         if "search" in frame_url.lower() or "place" in frame_url.lower():
@@ -198,7 +607,7 @@ class NaverMapCrawler:
             # 방법 3: 선택자로 접근
             if not search_frame:
                 try:
-                    iframe_element = await self.page.query_selector("#searchIframe")
+                    iframe_element = await page.query_selector("#searchIframe")
                     if iframe_element:
                         search_frame = await iframe_element.content_frame()
                         if search_frame:
@@ -209,173 +618,160 @@ class NaverMapCrawler:
             if not search_frame:
                 print("❌ 모든 방법으로 searchIframe 프레임 접근 실패")
                 # 디버깅을 위해 현재 프레임들 확인
-                frames = self.page.frames
+                frames = page.frames
                 print(f"현재 페이지의 프레임 개수: {len(frames)}")
                 for i, frame in enumerate(frames):
                     print(f"  프레임 {i}: name='{frame.name}', url='{frame.url}'")
-                return []
+                raise CrawlError("searchIframe 프레임 접근 실패", stage='iframe')
             
             print("✓ searchIframe으로 전환 성공!")
+            emit_progress(on_event, "frame_found")
+            
+            # 기존 iframe 발견 후 고정 대기(3초)를 프레임 로드 이벤트로 대체
+            try:
+                await timer.measure("frame_load", search_frame.wait_for_load_state(
+                    "domcontentloaded", timeout=READINESS_SETTINGS['frame_load_timeout']
+                ), replaces_ms=3000)
+            except Exception as e:
+                print(f"⚠ searchIframe 로드 이벤트 대기 실패: {e}")
             
             # 검색 결과 로드 대기 및 선택자 시도
             print("검색 결과 로드 대기 중...")
             
-            # 더 오래 기다려서 모든 결과가 로드되도록 함
-            await asyncio.sleep(5)
+            # 기존 고정 대기(5초)를 검색 목록 응답 + 항목 수 안정화로 대체
+            try:
+                await timer.measure("search_response", response_task)
+                print("✓ 검색 목록 응답 수신")
+            except Exception as e:
+                print(f"⚠ 검색 목록 응답 대기 실패: {e}")
             
-            # DOM 구조 분석을 위한 디버깅 추가
-            print("🔍 iframe 내부 DOM 구조 분석 중...")
             try:
-                # iframe 내의 모든 HTML을 가져와서 분석
-                html_content = await search_frame.content()
-                print(f"HTML 길이: {len(html_content)} 문자")
-                
-                # HTML을 파일로 저장해서 분석
-                import os
-                debug_dir = "debug_html"
-                if not os.path.exists(debug_dir):
-                    os.makedirs(debug_dir)
-                
-                with open(f"{debug_dir}/naver_map_iframe.html", "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                print(f"✓ HTML 저장됨: {debug_dir}/naver_map_iframe.html")
-                
-                # 더 많은 선택자들로 테스트
-                debug_selectors = [
-                    "li", "ul li", "ol li", "div", "span", "a",
-                    "._3XamX", ".TYaxT", ".CHC5F", ".YwYLL", 
-                    "[data-id]", "[data-place-id]", "[data-sid]",
-                    ".place_bluelink", ".item_name", ".item", ".result",
-                    ".search_item", ".list_item", ".place_item",
-                    "[role='listitem']", "[class*='item']", "[class*='place']",
-                    "[class*='search']", "[class*='result']"
-                ]
-                
-                for debug_selector in debug_selectors:
-                    try:
-                        debug_elements = await search_frame.query_selector_all(debug_selector)
-                        count = len(debug_elements)
-                        if count > 0:
-                            print(f"   선택자 '{debug_selector}': {count}개")
-                            # 3개보다 많은 결과가 있으면 첫 번째 요소의 클래스 확인
-                            if count > 3:
-                                try:
-                                    first_element = debug_elements[0]
-                                    classes = await first_element.get_attribute("class")
-                                    data_attrs = {}
-                                    for attr in ["data-id", "data-place-id", "data-sid"]:
-                                        val = await first_element.get_attribute(attr)
-                                        if val:
-                                            data_attrs[attr] = val
-                                    print(f"      → 첫 번째 요소 클래스: {classes}")
-                                    if data_attrs:
-                                        print(f"      → 데이터 속성: {data_attrs}")
-                                except:
-                                    pass
-                    except:
-                        pass
-                        
+                settle = await timer.measure("list_settle", wait_for_item_count_settle(
+                    search_frame,
+                    READINESS_SETTINGS['list_item_selector'],
+                    timeout_ms=READINESS_SETTINGS['list_settle_timeout'],
+                    quiet_ms=READINESS_SETTINGS['list_settle_quiet_ms'],
+                ), replaces_ms=5000)
+                print(f"✓ 목록 항목 수 안정화: {settle['count']}개 ({'안정' if settle['settled'] else '타임아웃'})")
             except Exception as e:
-                print(f"DOM 분석 실패: {e}")
-            
-            # 여러 선택자를 순서대로 시도 
-            selectors = [
-                "ul li", "li", ".YwYLL", "._3XamX", ".TYaxT", ".CHC5F", 
-                "[data-id]", "div[data-place-id]", ".place_bluelink", 
-                ".item_name", ".item", ".result"
-            ]
-            places = []
-            used_selector = None
-            
-            for selector in selectors:
+                print(f"⚠ 목록 안정화 대기 실패: {e}")
+            
+            # DOM 구조 진단 (기본 꺼짐, 요청별 또는 샘플링으로 활성화)
+            if self.diagnostics.should_capture(diagnostics):
+                print("🔍 iframe 내부 DOM 구조 진단 캡처 중...")
+                try:
+                    snapshot = await self.diagnostics.capture(search_frame, query)
+                    for probe in snapshot['probes']:
+                        print(f"   선택자 '{probe['selector']}': {probe['count']}개")
+                except Exception as e:
+                    print(f"DOM 분석 실패: {e}")
+            
+            # 캐시된 선택자를 먼저 확인하고, 필요할 때만 전체 후보를 한 번에 탐색
+            async def find_result_list():
+                selector, count, found_by = await timer.measure(
+                    "selector", resolve_result_selector(search_frame, self.selector_cache)
+                )
+                if not selector or not count:
+                    raise CrawlError("검색 결과 목록을 찾지 못함", stage='list_selector')
+                return selector, count, found_by
+            
+            try:
+                used_selector, item_count, source = await retry_stage(
+                    "list_selector", find_result_list, timeout_types=STAGE_TIMEOUT_ERRORS
+                )
+            except CrawlError as e:
+                # '검색 결과 없음' 안내가 보일 때만 빈 결과로 처리하고,
+                # 그 외(차단, 시간 초과, 선택자 변경 등)는 호출한 쪽과 서킷 브레이커가 알 수 있도록 발생시킴
+                if e.blocked:
+                    raise
                 try:
-                    await search_frame.wait_for_selector(selector, timeout=3000)
-                    places = await search_frame.query_selector_all(selector)
-                    if places and len(places) > 3:  # 3개보다 많은 결과를 가진 선택자를 우선
-                        used_selector = selector
-                        print(f"✓ 선택자 '{selector}' 발견! ({len(places)}개)")
-                        break
-                    elif places and len(places) > 0:
-                        if not used_selector:  # 백업용으로 저장
-                            used_selector = selector
-                            print(f"⚠ 선택자 '{selector}' 발견 (백업용: {len(places)}개)")
-                except:
-                    print(f"   선택자 '{selector}' 시도 실패")
-                    continue
-            
-            if not places:
-                print("❌ 검색 결과를 찾을 수 없음")
+                    no_results = await has_no_results_message(search_frame)
+                except Exception:
+                    no_results = False
+                if not no_results:
+                    raise
+                print("❌ 검색 결과 없음")
                 return []
             
-            print(f"✓ 검색 결과 {len(places)}개 발견! (선택자: {used_selector})")
+            print(f"✓ 검색 결과 {item_count}개 발견! (선택자: {used_selector}, {'캐시' if source == 'cache' else '탐색'})")
+            emit_progress(on_event, "results_found", count=item_count, target=max_results)
             
-            # 더 많은 결과가 필요한 경우 스크롤을 통해 추가 로드
-            if len(places) < max_results:
-                print(f"더 많은 결과 로드 중... (현재: {len(places)}개, 목표: {max_results}개)")
-                
-                # 스크롤을 통해 더 많은 결과 로드 시도
-                for scroll_attempt in range(5):  # 최대 5번 스크롤 시도
-                    try:
-                        # 검색 결과 영역에서 스크롤
-                        await search_frame.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        await asyncio.sleep(2)  # 로딩 대기
-                        
-                        # 새로운 결과 확인
-                        new_places = await search_frame.query_selector_all(used_selector)
-                        print(f"   스크롤 {scroll_attempt + 1}회 후: {len(new_places)}개")
-                        
-                        if len(new_places) >= max_results:
-                            places = new_places
-                            print(f"✓ 목표 개수 달성: {len(places)}개")
-                            break
-                        elif len(new_places) == len(places):
-                            print(f"   더 이상 새로운 결과가 없습니다.")
-                            break
-                        else:
-                            places = new_places
-                            
-                    except Exception as e:
-                        print(f"   스크롤 {scroll_attempt + 1}회 실패: {e}")
-                        break
+            async def on_records(records: List[Dict]) -> bool:
+                """추출된 항목을 결과에 추가하고, 순위 조회 대상을 모두 찾았으면 True"""
+                before = len(results)
+                self._append_records(records, results, on_event)
+                return bool(matcher and matcher.scan(results[before:]))
             
-            print(f"최종 검색 결과: {len(places)}개")
+            # 목록 컨테이너 스크롤 + 페이지 이동으로 목표 개수까지 수집
+            # (스트리밍/순위 조회 중이면 스크롤할 때마다 새 항목을 바로 추출)
+            if item_count < max_results:
+                print(f"더 많은 결과 로드 중... (현재: {item_count}개, 목표: {max_results}개)")
+            scroller = DeepListScroller(
+                search_frame, used_selector, max_results, timer=timer,
+                on_event=lambda stage, data: emit_progress(on_event, stage, **data),
+                eager=incremental,
+                max_steps=RANK_LOOKUP_SETTINGS['max_scrolls'] if matcher else None
+            )
+            try:
+                # 재시도 시에는 이미 로드/추출한 위치부터 이어서 수집
+                scroll_report = await retry_stage(
+                    "scroll", lambda: scroller.collect(scroller.count or item_count, on_records),
+                    timeout_types=STAGE_TIMEOUT_ERRORS
+                )
+            except CrawlError as e:
+                if not results:
+                    raise
+                print(f"⚠ 스크롤 중단, 수집한 {len(results)}개 반환: {e}")
+                scroll_report = scroller.report('error')
+            self.last_scroll_report = scroll_report
             
-            # 결과 수집
-            for i, place in enumerate(places[:max_results]):
-                try:
-                    # 전체 텍스트 가져오기
-                    raw_text = await place.text_content()
-                    if not raw_text or raw_text.strip() == "":
-                        continue
-                    
-                    # 업체명 파싱
-                    business_name = self.extract_business_name(raw_text.strip())
-                    
-                    # 결과 구성
-                    result = {
-                        'rank': i + 1,
-                        'name': business_name,
-                        'raw_text': raw_text.strip()
-                    }
-                    
-                    results.append(result)
-                    print(f"{i+1}. {business_name}")
-                    
-                except Exception as e:
-                    print(f"❌ {i+1}번째 장소 처리 실패: {e}")
-                    continue
+            print(f"최종 검색 결과: {scroll_report['total_items']}개 "
+                  f"(페이지 {scroll_report['pages']}, 단계 {len(scroll_report['steps'])}회, "
+                  f"종료: {scroll_report['stopped_by']})")
+            emit_progress(on_event, "extracted", count=len(results), source="dom")
                     
         except Exception as e:
-            print(f"❌ 크롤링 오류: {e}")
+            if not results:
+                error = to_crawl_error(e, 'search', STAGE_TIMEOUT_ERRORS)
+                if error is e:
+                    raise
+                raise error from e
+            print(f"❌ 크롤링 오류, 수집한 {len(results)}개 반환: {e}")
         
         finally:
-            print("브라우저 종료...")
-            await self.close()
+            if collector:
+                collector.detach()
+            
+            # 조기 종료 시 응답 대기 작업 정리
+            if response_task:
+                if not response_task.done():
+                    response_task.cancel()
+                elif not response_task.cancelled():
+                    response_task.exception()
+            
+            report = timer.report()
+            self.logger.debug(f"'{query}' 단계별 대기 시간: {report['stages_ms']}")
+            self.logger.info(
+                f"'{query}' 대기 시간 {report['total_wait_ms']}ms "
+                f"(기존 고정 대기 {report['replaced_sleep_ms']}ms 대비 {report['saved_ms']}ms 절감)"
+            )
             
         return results
     
+    async def __aenter__(self):
+        if not self.browser:
+            await self.init_browser()
+        self._managed = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._managed = False
+        await self.close()
+    
     async def close(self):
-        """리소스 정리"""
+        """리소스 정리 (주입받은 브라우저는 풀에서 관리)"""
+        if not self._owns_browser:
+            return
         try:
             if self.page:
                 await self.page.close()
@@ -387,16 +783,23 @@ class NaverMapCrawler:
                 await self.playwright.stop()
         except Exception as e:
             print(f"종료 중 오류: {e}")
+        finally:
+            self.page = None
+            self.context = None
+            self.browser = None
+            self.playwright = None
 
 
 # 전역 함수로 간단한 인터페이스 제공
-async def crawl_naver_map(query: str, max_results: int = 10) -> List[Dict]:
-    """네이버 지도 크롤링 간단 인터페이스"""
+async def crawl_naver_map(query: str, max_results: int = 10,
+                          diagnostics: Optional[bool] = None,
+                          mode: Optional[str] = None,
+                          on_event: Optional[ProgressCallback] = None) -> List[Dict]:
+    """네이버 지도 크롤링 간단 인터페이스 (브라우저 엔진, 실패 시 CrawlError 계열 예외)"""
     crawler = NaverMapCrawler()
     try:
-        return await crawler.search_places(query, max_results)
-    except Exception as e:
-        print(f"크롤링 실패: {e}")
-        return []
+        return await crawler._browser_search(
+            query, max_results, diagnostics=diagnostics, mode=mode, on_event=on_event
+        )
     finally:
         await crawler.close() 
\ No newline at end of file
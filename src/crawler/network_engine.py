@@ -0,0 +1,154 @@
+"""
+네트워크 응답 기반 검색 결과 수집
+searchIframe 목록을 채우는 allSearch/GraphQL 응답을 가로채 구조화된 데이터를 직접 파싱한다
+(렌더링된 텍스트를 휴리스틱으로 나누는 DOM 방식 대비 이름/ID/카테고리/좌표가 정확함)
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from src.crawler.readiness import is_search_list_response
+
+# GraphQL 응답에서 광고 목록으로 간주할 키 접두사
+AD_KEY_PREFIXES = ('ad', 'Ad')
+
+
+def _join(value: Any) -> str:
+    """리스트 값은 쉼표로 합치고 None은 빈 문자열로"""
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ','.join(str(v) for v in value if v)
+    return str(value)
+
+
+def normalize_place(item: Dict, rank: int) -> Dict:
+    """allSearch/GraphQL 장소 항목을 크롤러 결과 형식으로 변환"""
+    name = _join(item.get('name'))
+    category = _join(item.get('category'))
+    address = _join(item.get('address') or item.get('fullAddress'))
+    road_address = _join(item.get('roadAddress') or item.get('commonAddress'))
+    review_count = item.get('visitorReviewCount') or item.get('reviewCount') or ''
+    return {
+        'rank': rank,
+        'name': name,
+        'raw_text': ' '.join(part for part in (name, category, road_address or address) if part),
+        'category': category,
+        'address': address,
+        'road_address': road_address,
+        'rating': _join(item.get('visitorReviewScore') or item.get('rating')),
+        'review_count': _join(review_count),
+        'phone': _join(item.get('phone') or item.get('tel') or item.get('virtualPhone')),
+        'place_id': _join(item.get('id')),
+        'longitude': _join(item.get('x')),
+        'latitude': _join(item.get('y')),
+    }
+
+
+def _is_place_item(item: Any) -> bool:
+    return isinstance(item, dict) and bool(item.get('name')) and bool(item.get('id'))
+
+
+def extract_place_items(payload: Any) -> List[Dict]:
+    """검색 응답에서 장소 항목 목록 추출 (인식할 수 없는 구조면 빈 리스트)
+
+    지원 구조:
+    - allSearch: {"result": {"place": {"list": [...]}}}
+    - GraphQL: {"data": {<operation>: {"items": [...]}}} 또는 그 배열 (배치 요청)
+    """
+    if isinstance(payload, list):
+        items: List[Dict] = []
+        for entry in payload:
+            items.extend(extract_place_items(entry))
+        return items
+
+    if not isinstance(payload, dict):
+        return []
+
+    result = payload.get('result')
+    place = result.get('place') if isinstance(result, dict) else None
+    if isinstance(place, dict) and isinstance(place.get('list'), list):
+        return [item for item in place['list'] if _is_place_item(item)]
+
+    data = payload.get('data')
+    if isinstance(data, dict):
+        items = []
+        for key, operation in data.items():
+            if key.startswith(AD_KEY_PREFIXES) or not isinstance(operation, dict):
+                continue
+            if isinstance(operation.get('items'), list):
+                items.extend(item for item in operation['items'] if _is_place_item(item))
+        return items
+
+    return []
+
+
+def parse_search_payload(payload: Any, start_rank: int = 1) -> List[Dict]:
+    """검색 응답을 순위가 매겨진 결과 목록으로 변환"""
+    return [
+        normalize_place(item, start_rank + offset)
+        for offset, item in enumerate(extract_place_items(payload))
+    ]
+
+
+class SearchResponseCollector:
+    """페이지의 검색 목록 응답을 수집하여 장소 목록으로 누적"""
+
+    def __init__(self, page, quiet_seconds: float = 0.5):
+        self.page = page
+        self.quiet_seconds = quiet_seconds
+        self.places: List[Dict] = []
+        self.payload_count = 0
+        self._seen_ids = set()
+        self._updated = asyncio.Event()
+        self.logger = logging.getLogger('SearchResponseCollector')
+
+    def attach(self):
+        self.page.on("response", self._on_response)
+
+    def detach(self):
+        try:
+            self.page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+    async def _on_response(self, response):
+        if not is_search_list_response(response):
+            return
+        try:
+            payload = await response.json()
+        except Exception:
+            return
+
+        items = extract_place_items(payload)
+        if not items:
+            return
+
+        self.payload_count += 1
+        for item in items:
+            place_id = str(item.get('id'))
+            if place_id in self._seen_ids:
+                continue
+            self._seen_ids.add(place_id)
+            self.places.append(normalize_place(item, len(self.places) + 1))
+        self._updated.set()
+
+    async def wait_for_places(self, min_count: int, timeout: float) -> List[Dict]:
+        """min_count개가 모이거나, 응답이 quiet_seconds 동안 더 오지 않거나, timeout까지 대기"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(self.places) < min_count:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            # 첫 응답 전에는 남은 시간 전체, 이후에는 quiet_seconds만큼만 추가 응답을 기다림
+            wait = remaining if not self.places else min(remaining, self.quiet_seconds)
+            self._updated.clear()
+            try:
+                await asyncio.wait_for(self._updated.wait(), wait)
+            except asyncio.TimeoutError:
+                if self.places:
+                    break
+        return self.places[:min_count]
+
@@ -0,0 +1,85 @@
+"""
+검색 결과 일괄 추출
+searchIframe 안에서 스크립트 한 번으로 모든 결과 항목의 필드를 구조화된 레코드로 수집한다
+(항목/필드마다 query_selector + text_content를 호출하던 방식 대체)
+"""
+
+from typing import Dict, List
+
+# 항목 컨테이너 안에서 필드별로 시도할 선택자 (우선순위 순)
+FIELD_SELECTORS = {
+    'name': [".TYaxT", ".YwYLL", ".place_bluelink", ".item_name"],
+    'category': [".KCMnt", ".YzBgS", ".category", "[class*='category']"],
+    'address': [".LDgIH", ".addr", ".jibun", "[class*='addr']", "[class*='address']"],
+    'rating': [".orXYY", ".rating", "[class*='rating']", "[class*='star']"],
+    'review_count': [".MVx6e", ".review_count", "[class*='review']"],
+    'phone': [".xlx7Q", ".phone", ".tel", "[class*='phone']", "[class*='tel']"],
+}
+
+EXTRACT_SCRIPT = """
+({selector, start, limit, fields}) => {
+    const textOf = el => (el && el.textContent ? el.textContent.trim() : '');
+    const firstText = (root, selectors) => {
+        for (const selector of selectors) {
+            let el = null;
+            try {
+                el = root.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            const text = textOf(el);
+            if (text) return text;
+        }
+        return '';
+    };
+    const findContainer = el =>
+        el.closest('li')
+        || el.closest('[data-id]')
+        || el.closest("div[class*='item'], div[class*='place'], div[class*='list']")
+        || el;
+    const findPlaceId = (el, container) => {
+        for (const node of [el, container]) {
+            for (const attr of ['data-id', 'data-place-id', 'data-sid']) {
+                const value = node.getAttribute && node.getAttribute(attr);
+                if (value) return value;
+            }
+        }
+        const inner = container.querySelector('[data-id], [data-place-id]');
+        if (inner) return inner.getAttribute('data-id') || inner.getAttribute('data-place-id');
+        for (const link of container.querySelectorAll('a[href]')) {
+            const match = link.getAttribute('href').match(/\\/(\\d{5,})(?:[/?#]|$)/);
+            if (match) return match[1];
+        }
+        return '';
+    };
+
+    const items = Array.from(document.querySelectorAll(selector)).slice(start, start + limit);
+    return items.map((el, offset) => {
+        const container = findContainer(el);
+        const record = {
+            index: start + offset,
+            raw_text: textOf(el),
+            place_id: findPlaceId(el, container),
+        };
+        for (const [field, selectors] of Object.entries(fields)) {
+            record[field] = firstText(container, selectors);
+        }
+        return record;
+    });
+}
+"""
+
+
+async def extract_places(frame, selector: str, limit: int, start: int = 0) -> List[Dict]:
+    """selector에 해당하는 항목 중 [start, start + limit) 구간을 한 번에 추출
+
+    반환 레코드: index(0부터), raw_text, place_id 및 FIELD_SELECTORS의 필드
+    """
+    if limit <= 0:
+        return []
+    return await frame.evaluate(EXTRACT_SCRIPT, {
+        'selector': selector,
+        'start': start,
+        'limit': limit,
+        'fields': FIELD_SELECTORS,
+    })
@@ -0,0 +1,238 @@
+"""
+호스트별 요청 속도 제한
+네이버 호스트마다 토큰 버킷(초당 요청 수)과 동시 요청 수 한도를 두고,
+성공이 이어지면 동시 요청 수를 조금씩 올리고(가산 증가)
+403/429/캡차 신호가 오면 동시 요청 수와 속도를 크게 줄인다(승산 감소, AIMD).
+브라우저 페이지 이동과 allSearch HTTP 요청 등 모든 엔진이 같은 제한기를 공유한다
+"""
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import CRAWLING_SETTINGS, RATE_LIMIT_SETTINGS
+
+# 차단으로 보는 HTTP 상태 코드
+BLOCK_STATUSES = (403, 429)
+# 이동한 주소에 이 문자열이 있으면 캡차/로그인 확인 페이지로 판단
+CAPTCHA_URL_MARKERS = ('captcha', 'nid.naver.com/login', '/challenge')
+
+
+def is_block_signal(error: BaseException) -> bool:
+    """예외가 차단 신호(403/429/캡차)인지 여부 (status 속성 또는 blocked 속성으로 판단)"""
+    return getattr(error, 'status', None) in BLOCK_STATUSES or bool(getattr(error, 'blocked', False))
+
+
+def is_captcha_url(url: Optional[str]) -> bool:
+    return bool(url) and any(marker in url for marker in CAPTCHA_URL_MARKERS)
+
+
+class RequestSlot:
+    """요청 하나의 결과 기록 (표시하지 않으면 예외 여부로 판단)"""
+
+    def __init__(self):
+        self.outcome: Optional[str] = None
+        self.reason: Optional[str] = None
+
+    def ok(self):
+        self.outcome = 'success'
+
+    def blocked(self, reason: str = ''):
+        self.outcome = 'blocked'
+        self.reason = reason
+
+
+class HostLimiter:
+    """호스트 하나의 토큰 버킷 + AIMD 동시 요청 수"""
+
+    def __init__(self, host: str, rate: float, burst: int, settings: Optional[Dict] = None):
+        self.host = host
+        self.settings = settings or RATE_LIMIT_SETTINGS
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.concurrency = float(self.settings['initial_concurrency'])
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._streak = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop = None
+
+        self.requests = 0
+        self.successes = 0
+        self.blocks = 0
+        self.errors = 0
+        self.waited_seconds = 0.0
+        self.peak_concurrency = self.concurrency
+        self.last_block_reason: Optional[str] = None
+
+    @property
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.blocked_until
+
+    def _reserve_token(self) -> float:
+        """토큰 하나를 예약하고 사용할 수 있을 때까지 기다릴 시간(초) 반환"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        """현재 이벤트 루프용 Condition (asyncio.run을 여러 번 호출해도 사용 가능)"""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    async def acquire(self):
+        """동시 요청 슬롯과 토큰을 얻을 때까지 대기
+
+        토큰 대기 중에 취소되면 슬롯과 토큰을 돌려놓는다 (취소가 반복돼도 동시 요청 한도가 막히지 않도록)
+        """
+        started = time.monotonic()
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.concurrency))
+            self.in_flight += 1
+        delay = self._reserve_token()
+        if self.cooling_down:
+            # 차단 직후에는 사람처럼 불규칙한 간격을 추가
+            delay += random.uniform(*CRAWLING_SETTINGS['random_delay_range'])
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.tokens = min(self.burst, self.tokens + 1)
+                self.in_flight -= 1
+                async with self.condition:
+                    self.condition.notify_all()
+                raise
+        self.requests += 1
+        self.waited_seconds += time.monotonic() - started
+
+    async def release(self, outcome: str, reason: Optional[str] = None):
+        """요청 결과를 반영하고 슬롯 반환 (outcome: success, blocked, error)"""
+        if outcome == 'success':
+            self._on_success()
+        elif outcome == 'blocked':
+            self._on_block(reason)
+        else:
+            self.errors += 1
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def _on_success(self):
+        self.successes += 1
+        if self.cooling_down:
+            return
+        self._streak += 1
+        if self._streak >= self.settings['success_window']:
+            self._streak = 0
+            self.concurrency = min(self.settings['max_concurrency'], self.concurrency + 1)
+            self.rate = min(self.base_rate, self.rate + self.base_rate * self.settings['min_rate_ratio'])
+            self.peak_concurrency = max(self.peak_concurrency, self.concurrency)
+
+    def _on_block(self, reason: Optional[str]):
+        self.blocks += 1
+        self._streak = 0
+        self.last_block_reason = reason
+        if self.cooling_down:
+            return  # 같은 차단에 대한 동시 요청들의 신호는 한 번만 반영
+        factor = self.settings['decrease_factor']
+        self.concurrency = max(self.settings['min_concurrency'], self.concurrency * factor)
+        self.rate = max(self.base_rate * self.settings['min_rate_ratio'], self.rate * factor)
+        self.tokens = min(self.tokens, 0.0)
+        self.blocked_until = time.monotonic() + self.settings['block_cooldown']
+        print(f"⚠️ {self.host} 차단 신호({reason or '알 수 없음'}): 동시 {int(self.concurrency)}개, "
+              f"초당 {self.rate:.2f}회로 감소")
+
+    def stats(self) -> Dict:
+        return {
+            'host': self.host,
+            'rate': round(self.rate, 3),
+            'base_rate': self.base_rate,
+            'concurrency': int(self.concurrency),
+            'peak_concurrency': int(self.peak_concurrency),
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'successes': self.successes,
+            'blocks': self.blocks,
+            'errors': self.errors,
+            'cooling_down': self.cooling_down,
+            'last_block_reason': self.last_block_reason,
+            'average_wait_ms': round(self.waited_seconds / self.requests * 1000, 1) if self.requests else 0.0,
+        }
+
+
+class RateLimiter:
+    """호스트별 HostLimiter 모음"""
+
+    def __init__(self, settings: Optional[Dict] = None):
+        self.settings = settings or RATE_LIMIT_SETTINGS
+        self.enabled = self.settings['enabled']
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def for_host(self, host: str) -> HostLimiter:
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            config = self.settings['hosts'].get(host)
+            if config:
+                rate, burst = config['rate'], config['burst']
+            else:
+                rate, burst = 1 / max(CRAWLING_SETTINGS['delay_between_requests'], 0.001), 1
+            limiter = self._hosts[host] = HostLimiter(host, rate, burst, self.settings)
+        return limiter
+
+    @asynccontextmanager
+    async def request(self, url: str) -> AsyncIterator[RequestSlot]:
+        """url의 호스트 제한에 맞춰 요청 실행
+
+        블록 안에서 slot.blocked()/slot.ok()로 결과를 표시할 수 있으며,
+        표시하지 않으면 차단 예외(403/429)는 blocked, 그 외 예외는 error, 정상 종료는 success로 기록한다.
+        """
+        slot = RequestSlot()
+        if not self.enabled:
+            yield slot
+            return
+
+        limiter = self.for_host(urlparse(url).hostname or url)
+        await limiter.acquire()
+        try:
+            yield slot
+        except BaseException as e:
+            if slot.outcome is None:
+                if is_block_signal(e):
+                    slot.blocked(getattr(e, 'status', None) and f"HTTP {e.status}" or str(e))
+                else:
+                    slot.outcome = 'error'
+            raise
+        finally:
+            await limiter.release(slot.outcome or 'success', slot.reason)
+
+    def stats(self) -> Dict:
+        return {'enabled': self.enabled, 'hosts': [limiter.stats() for limiter in self._hosts.values()]}
+
+
+_default_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전역 속도 제한기 (모든 엔진이 공유)"""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = RateLimiter()
+    return _default_limiter
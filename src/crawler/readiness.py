@@ -0,0 +1,116 @@
+"""
+페이지 준비 상태 감지
+고정된 sleep 대신 실제 신호(검색 목록 응답, 프레임 로드, 목록 항목 수 안정화)로 대기하고
+단계별 대기 시간을 기록한다
+"""
+
+import time
+from typing import Awaitable, Dict, Optional, Any
+
+# searchIframe 목록을 채우는 응답 URL 패턴
+SEARCH_LIST_URL_PATTERNS = (
+    '/api/search/allSearch',
+    'pcmap-api.place.naver.com/graphql',
+    'map.naver.com/p/api/search',
+)
+
+# 검색 결과가 없을 때 searchIframe에 표시되는 안내 문구
+NO_RESULTS_TEXTS = (
+    '검색결과가 없습니다',
+    '조건에 맞는 업체가 없습니다',
+    '검색 결과가 없습니다',
+)
+
+# 목록 항목 수가 일정 시간 변하지 않을 때까지 MutationObserver로 대기
+SETTLE_SCRIPT = """
+({selector, quietMs, timeoutMs, minCount, baseline}) => new Promise(resolve => {
+    const start = performance.now();
+    const countItems = () => document.querySelectorAll(selector).length;
+    let last = countItems();
+    let quietTimer = null;
+    let observer = null;
+    let deadline = null;
+    const finish = (settled) => {
+        if (observer) observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve({count: countItems(), settled, elapsed: performance.now() - start});
+    };
+    const arm = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => {
+            if (last >= minCount && last !== baseline) finish(true);
+        }, quietMs);
+    };
+    observer = new MutationObserver(() => {
+        const count = countItems();
+        if (count !== last) {
+            last = count;
+            arm();
+        }
+    });
+    observer.observe(document.body || document.documentElement, {childList: true, subtree: true});
+    deadline = setTimeout(() => finish(false), timeoutMs);
+    arm();
+})
+"""
+
+
+def is_search_list_response(response) -> bool:
+    """검색 목록 데이터를 담은 응답인지 확인"""
+    url = response.url
+    return any(pattern in url for pattern in SEARCH_LIST_URL_PATTERNS)
+
+
+async def has_no_results_message(frame) -> bool:
+    """프레임에 '검색 결과 없음' 안내 문구가 있는지 확인 (목록을 못 찾은 것이 실패인지 구분용)"""
+    text = await frame.evaluate("() => document.body ? document.body.innerText : ''")
+    return any(marker in text for marker in NO_RESULTS_TEXTS)
+
+
+async def wait_for_item_count_settle(frame, selector: str, timeout_ms: int, quiet_ms: int,
+                                     min_count: int = 1, baseline: Optional[int] = None) -> Dict:
+    """선택자에 해당하는 항목 수가 quiet_ms 동안 변하지 않을 때까지 대기
+
+    baseline을 주면 항목 수가 baseline과 달라진 뒤에만 안정화로 판단한다 (스크롤 후 추가 로드 대기).
+    반환값: {'count': 항목 수, 'settled': 안정화 여부, 'elapsed': 대기 시간(ms)}
+    """
+    return await frame.evaluate(SETTLE_SCRIPT, {
+        'selector': selector,
+        'quietMs': quiet_ms,
+        'timeoutMs': timeout_ms,
+        'minCount': min_count,
+        'baseline': -1 if baseline is None else baseline,
+    })
+
+
+class StageTimer:
+    """단계별 대기 시간 측정"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.replaced_sleep_ms = 0.0
+
+    async def measure(self, stage: str, awaitable: Awaitable, replaces_ms: float = 0) -> Any:
+        """awaitable 대기 시간을 stage 이름으로 기록
+
+        replaces_ms: 이 대기가 대체한 기존 고정 sleep 시간 (절감량 계산용)
+        같은 stage를 여러 번 측정하면(재시도, 스크롤 반복 등) 시간을 누적한다.
+        """
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stages[stage] = round(self.stages.get(stage, 0.0) + elapsed_ms, 1)
+            self.replaced_sleep_ms += replaces_ms
+
+    def report(self) -> Dict:
+        """단계별 대기 시간과 기존 고정 sleep 대비 절감량"""
+        total_ms = round(sum(self.stages.values()), 1)
+        return {
+            'stages_ms': dict(self.stages),
+            'total_wait_ms': total_ms,
+            'replaced_sleep_ms': self.replaced_sleep_ms,
+            'saved_ms': round(self.replaced_sleep_ms - total_ms, 1),
+        }
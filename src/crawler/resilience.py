@@ -0,0 +1,210 @@
+"""
+단계별 재시도와 서킷 브레이커
+단계(goto, iframe, list_selector, scroll, http)마다 지터가 있는 지수 백오프로 재시도하고,
+엔진별 차단 비율이 기준을 넘으면 서킷을 열어 새 크롤링을 즉시 실패시킨다
+(브라우저 슬롯을 타임아웃으로 붙잡아 두지 않도록)
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple, Type, TypeVar
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import CIRCUIT_BREAKER_SETTINGS, CRAWLING_SETTINGS, RETRY_SETTINGS
+from src.crawler.errors import BlockedError, CircuitOpenError, CrawlError, StageTimeoutError
+from src.crawler.rate_limiter import is_block_signal
+
+T = TypeVar('T')
+
+# 서킷 상태
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
+
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 실패 후 대기 시간 (0 ~ base * 2^(attempt-1) 사이 균등 분포, full jitter)"""
+    ceiling = min(RETRY_SETTINGS['max_delay'], RETRY_SETTINGS['base_delay'] * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
+
+
+def stage_attempts(stage: str) -> int:
+    """단계별 최대 시도 횟수 (CRAWLING_SETTINGS['max_retries'] + 1 이하)"""
+    attempts = RETRY_SETTINGS['stage_attempts'].get(stage, 1)
+    return max(1, min(attempts, CRAWLING_SETTINGS['max_retries'] + 1))
+
+
+def to_crawl_error(error: BaseException, stage: str,
+                   timeout_types: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError,)) -> CrawlError:
+    """임의의 예외를 단계 정보가 있는 CrawlError로 변환"""
+    if isinstance(error, CrawlError):
+        if error.stage is None:
+            error.stage = stage
+        return error
+    if isinstance(error, timeout_types):
+        return StageTimeoutError(f"{stage} 대기 시간 초과: {error}", stage=stage)
+    if is_block_signal(error):
+        return BlockedError(f"{stage} 차단: {error}", stage=stage, status=getattr(error, 'status', None))
+    return CrawlError(f"{stage} 실패: {error}", stage=stage)
+
+
+async def retry_stage(stage: str, operation: Callable[[], Awaitable[T]],
+                      attempts: Optional[int] = None,
+                      timeout_types: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError,)) -> T:
+    """단계 하나를 재시도하며 실행
+
+    차단(BlockedError) 등 retryable이 False인 오류는 바로 발생시키고,
+    시도 횟수를 모두 쓰면 마지막 오류를 CrawlError 형태로 발생시킨다.
+    """
+    attempts = attempts or stage_attempts(stage)
+    for attempt in range(1, attempts + 1):
+        try:
+            return await operation()
+        except Exception as e:
+            error = to_crawl_error(e, stage, timeout_types)
+            if not error.retryable or attempt >= attempts:
+                if error is e:
+                    raise
+                raise error from e
+            delay = backoff_delay(attempt)
+            print(f"⚠ {stage} 실패 ({attempt}/{attempts}), {delay:.1f}초 후 재시도: {error}")
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """엔진 하나의 서킷 브레이커
+
+    최근 window_seconds 동안의 결과 중 차단 비율이 기준 이상이면 열리고,
+    open_seconds가 지나면 시험 요청 하나만 허용한다(half-open).
+    시험 요청이 성공하면 닫히고, 다시 차단되면 다시 열린다.
+    """
+
+    def __init__(self, name: str, settings: Optional[Dict] = None):
+        self.name = name
+        self.settings = settings or CIRCUIT_BREAKER_SETTINGS
+        self._events: Deque[Tuple[float, str]] = deque()
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.opened_count = 0
+        self.rejected = 0
+        self.totals = {'success': 0, 'blocked': 0, 'failure': 0}
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self._opened_at >= self.settings['open_seconds']:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.settings['open_seconds'] - (time.monotonic() - self._opened_at))
+
+    def is_available(self) -> bool:
+        """새 요청을 받을 수 있는지 (부수 효과 없음, 엔진 선택용)"""
+        if not self.settings['enabled']:
+            return True
+        state = self.state
+        return state == CIRCUIT_CLOSED or (state == CIRCUIT_HALF_OPEN and not self._probing)
+
+    def check(self) -> bool:
+        """요청 허용 여부 확인 (열려 있으면 CircuitOpenError), half-open 시험 요청이면 True"""
+        if not self.settings['enabled']:
+            return False
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return False
+        if state == CIRCUIT_HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        raise CircuitOpenError(
+            f"{self.name} 엔진 차단 비율이 높아 일시 중단됨 ({self.retry_after:.0f}초 후 재시도)",
+            engine=self.name, retry_after=self.retry_after or self.settings['open_seconds']
+        )
+
+    def record(self, outcome: str, probe: bool = False):
+        """결과 기록 (outcome: success, blocked, failure)"""
+        now = time.monotonic()
+        self.totals[outcome] += 1
+        self._events.append((now, outcome))
+        window_start = now - self.settings['window_seconds']
+        while self._events and self._events[0][0] < window_start:
+            self._events.popleft()
+
+        if probe:
+            self._probing = False
+            if outcome == 'blocked':
+                self._open(now)
+            elif outcome == 'success':
+                self._opened_at = None
+                self._events.clear()
+                print(f"✅ {self.name} 서킷 닫힘 (시험 요청 성공)")
+            return
+
+        if self._opened_at is None and outcome == 'blocked':
+            samples = len(self._events)
+            blocked = sum(1 for _, event in self._events if event == 'blocked')
+            if samples >= self.settings['min_samples'] and blocked / samples >= self.settings['block_rate_threshold']:
+                self._open(now)
+
+    def _open(self, now: float):
+        self._opened_at = now
+        self.opened_count += 1
+        print(f"🚫 {self.name} 서킷 열림: {self.settings['open_seconds']}초 동안 새 요청 차단")
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """서킷을 확인하고 실행한 뒤 결과 기록"""
+        probe = self.check()
+        outcome = None
+        try:
+            result = await operation()
+            outcome = 'success'
+            return result
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            outcome = 'blocked' if isinstance(e, BlockedError) or is_block_signal(e) else 'failure'
+            raise
+        finally:
+            if outcome:
+                self.record(outcome, probe)
+            elif probe:
+                self._probing = False  # 취소된 시험 요청
+
+    def stats(self) -> Dict:
+        samples = len(self._events)
+        blocked = sum(1 for _, event in self._events if event == 'blocked')
+        return {
+            'engine': self.name,
+            'state': self.state if self.settings['enabled'] else 'disabled',
+            'window_samples': samples,
+            'window_block_rate': round(blocked / samples, 3) if samples else 0.0,
+            'retry_after': round(self.retry_after, 1),
+            'opened_count': self.opened_count,
+            'rejected': self.rejected,
+            **self.totals,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(engine: str) -> CircuitBreaker:
+    """엔진별 프로세스 전역 서킷 브레이커"""
+    if engine not in _breakers:
+        _breakers[engine] = CircuitBreaker(engine)
+    return _breakers[engine]
+
+
+def circuit_stats() -> Dict:
+    return {engine: breaker.stats() for engine, breaker in _breakers.items()}
@@ -0,0 +1,245 @@
+"""
+깊은 목록 스크롤/페이지 이동 엔진
+searchIframe의 실제 목록 컨테이너를 스크롤하면서 항목 수 변화로 대기하고,
+컨테이너 끝에 도달하면 페이지 버튼으로 다음 페이지로 넘어가
+페이지 간 순위 오프셋을 이어서 100~300위까지 수집한다
+"""
+
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import READINESS_SETTINGS, SCROLL_ENGINE_SETTINGS
+from src.crawler.place_extractor import extract_places
+from src.crawler.readiness import StageTimer, wait_for_item_count_settle
+
+# 목록 컨테이너를 끝까지 스크롤 (document.body가 아니라 실제 스크롤 영역)
+SCROLL_SCRIPT = """
+({selector, containers}) => {
+    const items = document.querySelectorAll(selector);
+    const last = items[items.length - 1];
+    const isScrollable = el => {
+        const style = getComputedStyle(el);
+        return /(auto|scroll)/.test(style.overflowY) && el.scrollHeight > el.clientHeight;
+    };
+    let container = null;
+    for (const sel of containers) {
+        const el = document.querySelector(sel);
+        if (el && isScrollable(el)) { container = el; break; }
+    }
+    if (!container && last) {
+        for (let el = last.parentElement; el && el !== document.body; el = el.parentElement) {
+            if (isScrollable(el)) { container = el; break; }
+        }
+    }
+    const target = container || document.scrollingElement || document.body;
+    const before = target.scrollTop;
+    target.scrollTop = target.scrollHeight;
+    if (last) last.scrollIntoView({block: 'end'});
+    return {
+        container: container ? (container.id ? '#' + container.id : container.tagName.toLowerCase()) : 'document',
+        moved: target.scrollTop !== before,
+        count: items.length,
+    };
+}
+"""
+
+# 다음 페이지 버튼 클릭 (번호 버튼 우선, 없으면 다음 화살표)
+NEXT_PAGE_SCRIPT = """
+({selector, containers, nextSelectors, nextPage}) => {
+    const first = document.querySelector(selector);
+    const signature = first ? first.textContent : '';
+    const disabled = el => el.getAttribute('aria-disabled') === 'true'
+        || el.disabled || /disabled/.test(el.className);
+    for (const sel of containers) {
+        const box = document.querySelector(sel);
+        if (!box) continue;
+        const button = Array.from(box.querySelectorAll('a, button'))
+            .find(el => el.textContent.trim() === String(nextPage) && !disabled(el));
+        if (button) { button.click(); return {clicked: true, via: 'number', signature}; }
+    }
+    for (const sel of nextSelectors) {
+        let el = null;
+        try { el = document.querySelector(sel); } catch (e) { continue; }
+        if (el && !disabled(el)) { el.click(); return {clicked: true, via: 'arrow', signature}; }
+    }
+    return {clicked: false, via: null, signature};
+}
+"""
+
+# 첫 항목이 바뀌면 목록이 다음 페이지로 교체된 것으로 판단
+LIST_CHANGED_SCRIPT = """
+({selector, signature}) => {
+    const first = document.querySelector(selector);
+    return !!first && first.textContent !== signature;
+}
+"""
+
+# 추출 레코드 콜백: True를 반환하면 수집 중단 (예: 순위 조회 대상을 모두 찾음)
+RecordsCallback = Callable[[List[Dict]], Awaitable[bool]]
+
+
+class DeepListScroller:
+    """목록 컨테이너 스크롤 + 페이지 이동으로 target_count개까지 항목 수집
+
+    eager가 True면 스크롤할 때마다 새 항목을 추출해 on_records로 전달하고(스트리밍/순위 조회),
+    False면 페이지를 넘기기 전과 마지막에만 한 번씩 추출한다.
+    레코드의 index는 이전 페이지 항목 수를 더한 전체 순번(0부터)이다.
+    """
+
+    def __init__(self, frame, selector: str, target_count: int,
+                 timer: Optional[StageTimer] = None,
+                 on_event: Optional[Callable[[str, Dict], None]] = None,
+                 eager: bool = False,
+                 max_steps: Optional[int] = None,
+                 max_pages: Optional[int] = None,
+                 settings: Optional[Dict] = None):
+        self.frame = frame
+        self.selector = selector
+        self.target_count = target_count
+        self.timer = timer or StageTimer()
+        self.on_event = on_event
+        self.eager = eager
+        self.settings = settings or SCROLL_ENGINE_SETTINGS
+        self.max_steps = max_steps or self.settings['max_steps']
+        self.max_pages = max_pages or self.settings['max_pages']
+
+        self.page = 1
+        self.offset = 0  # 이전 페이지까지의 항목 수 (순위 오프셋)
+        self.count = 0  # 현재 페이지에 로드된 항목 수
+        self.extracted = 0  # 현재 페이지에서 추출한 항목 수
+        self.steps: List[Dict] = []
+
+    @property
+    def total(self) -> int:
+        """지금까지 로드된 전체 항목 수"""
+        return self.offset + self.count
+
+    async def collect(self, initial_count: int, on_records: RecordsCallback) -> Dict:
+        """항목을 수집하여 on_records로 전달하고 단계별 보고서 반환"""
+        self.count = initial_count
+        stopped_by = None
+        while stopped_by is None:
+            if self.eager and await self._deliver(on_records):
+                stopped_by = 'callback'
+            elif self.total >= self.target_count:
+                stopped_by = 'target'
+            elif len(self.steps) >= self.max_steps:
+                stopped_by = 'max_steps'
+            elif await self._scroll_step():
+                continue
+            elif self.page >= self.max_pages:
+                stopped_by = 'max_pages'
+            else:
+                # 현재 페이지를 다 읽었으므로 페이지를 넘기기 전에 남은 항목 추출
+                if await self._deliver(on_records):
+                    stopped_by = 'callback'
+                elif not await self._next_page():
+                    stopped_by = 'exhausted'
+
+        if stopped_by != 'callback':
+            await self._deliver(on_records)
+        return self.report(stopped_by)
+
+    async def _deliver(self, on_records: RecordsCallback) -> bool:
+        """현재 페이지에서 아직 추출하지 않은 항목을 추출해 전달"""
+        upto = min(self.count, self.target_count - self.offset)
+        if upto <= self.extracted:
+            return False
+        records = await extract_places(self.frame, self.selector, upto - self.extracted,
+                                       start=self.extracted)
+        self.extracted = upto
+        for record in records:
+            record['index'] += self.offset
+        return bool(await on_records(records))
+
+    async def _scroll_step(self) -> bool:
+        """컨테이너를 한 번 스크롤하고 항목이 늘었는지 반환"""
+        started = time.perf_counter()
+        scrolled = await self.frame.evaluate(SCROLL_SCRIPT, {
+            'selector': self.selector,
+            'containers': self.settings['container_selectors'],
+        })
+        # 이미 끝에 있어 움직이지 않았으면 지연 로드만 짧게 확인
+        timeout_ms = (READINESS_SETTINGS['scroll_timeout'] if scrolled['moved']
+                      else self.settings['bottom_timeout'])
+        settle = await self.timer.measure(f"scroll_{len(self.steps) + 1}", wait_for_item_count_settle(
+            self.frame,
+            self.selector,
+            timeout_ms=timeout_ms,
+            quiet_ms=READINESS_SETTINGS['scroll_quiet_ms'],
+            baseline=self.count,
+        ), replaces_ms=2000)
+
+        new_items = max(0, settle['count'] - self.count)
+        self.count = max(self.count, settle['count'])
+        self._record_step('scroll', new_items, started, container=scrolled['container'])
+        return new_items > 0
+
+    async def _next_page(self) -> bool:
+        """다음 페이지로 이동하고 목록이 교체될 때까지 대기"""
+        started = time.perf_counter()
+        clicked = await self.frame.evaluate(NEXT_PAGE_SCRIPT, {
+            'selector': self.selector,
+            'containers': self.settings['pagination_selectors'],
+            'nextSelectors': self.settings['next_page_selectors'],
+            'nextPage': self.page + 1,
+        })
+        if not clicked['clicked']:
+            return False
+
+        try:
+            await self.timer.measure(f"page_{self.page + 1}", self.frame.wait_for_function(
+                LIST_CHANGED_SCRIPT,
+                arg={'selector': self.selector, 'signature': clicked['signature']},
+                timeout=self.settings['page_timeout'],
+            ))
+        except Exception:
+            return False
+        settle = await wait_for_item_count_settle(
+            self.frame,
+            self.selector,
+            timeout_ms=READINESS_SETTINGS['list_settle_timeout'],
+            quiet_ms=READINESS_SETTINGS['list_settle_quiet_ms'],
+        )
+
+        self.offset += self.count
+        self.page += 1
+        self.count = settle['count']
+        self.extracted = 0
+        self._record_step('page', self.count, started, via=clicked['via'])
+        return self.count > 0
+
+    def _record_step(self, action: str, new_items: int, started: float, **extra):
+        step = {
+            'step': len(self.steps) + 1,
+            'action': action,
+            'page': self.page,
+            'count': self.count,
+            'total': self.total,
+            'new_items': new_items,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            **extra,
+        }
+        self.steps.append(step)
+        print(f"   {action} {step['step']}회 후: {self.total}개 (페이지 {self.page}, +{new_items})")
+        if self.on_event:
+            self.on_event("scroll", {
+                'step': step['step'], 'action': action, 'page': self.page,
+                'count': self.total, 'new_items': new_items, 'target': self.target_count,
+            })
+
+    def report(self, stopped_by: Optional[str]) -> Dict:
+        """단계별 항목 수와 종료 사유"""
+        return {
+            'pages': self.page,
+            'total_items': self.total,
+            'target': self.target_count,
+            'reached_target': self.total >= self.target_count,
+            'stopped_by': stopped_by,
+            'steps': self.steps,
+        }
@@ -0,0 +1,167 @@
+"""
+검색 결과 선택자 캐시
+마지막으로 성공한 선택자를 파일에 저장해 두고 다음 검색에서 먼저 사용하며,
+선택자 탐색이 필요할 때는 모든 후보를 한 번의 페이지 내 평가로 확인한다
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+import sys
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import SELECTOR_CACHE_SETTINGS
+
+# 검색 결과 항목 후보 선택자 (우선순위 순)
+RESULT_SELECTORS = [
+    "ul li", "li", ".YwYLL", "._3XamX", ".TYaxT", ".CHC5F",
+    "[data-id]", "div[data-place-id]", ".place_bluelink",
+    ".item_name", ".item", ".result"
+]
+
+# 후보 선택자별 매칭 개수를 한 번에 계산
+PROBE_SCRIPT = """
+(selectors) => selectors.map(selector => {
+    try {
+        return document.querySelectorAll(selector).length;
+    } catch (e) {
+        return 0;
+    }
+})
+"""
+
+# 후보 중 하나라도 매칭될 때까지 페이지 안에서 폴링 (매칭 전에는 null 반환)
+WAIT_ANY_SCRIPT = """
+(selectors) => {
+    const counts = selectors.map(selector => {
+        try {
+            return document.querySelectorAll(selector).length;
+        } catch (e) {
+            return 0;
+        }
+    });
+    return counts.some(count => count > 0) ? counts : null;
+}
+"""
+
+# 이 개수보다 많이 매칭되는 선택자를 우선 사용
+PREFERRED_MIN_COUNT = 3
+
+
+class SelectorCache:
+    """TTL이 있는 파일 기반 선택자 캐시"""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        self.path = path or SELECTOR_CACHE_SETTINGS['path']
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else SELECTOR_CACHE_SETTINGS['ttl_seconds']
+        self.logger = logging.getLogger('SelectorCache')
+        self._entries: Dict[str, Dict] = self._load()
+
+    def get(self, key: str) -> Optional[str]:
+        """만료되지 않은 캐시 선택자 반환"""
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        if time.time() - entry['saved_at'] > self.ttl_seconds:
+            self.invalidate(key)
+            return None
+        return entry['selector']
+
+    def put(self, key: str, selector: str):
+        """선택자 저장 (바뀐 경우에만 파일 기록)"""
+        entry = self._entries.get(key)
+        if entry and entry['selector'] == selector and time.time() - entry['saved_at'] <= self.ttl_seconds:
+            return
+        self._entries[key] = {'selector': selector, 'saved_at': time.time()}
+        self._save()
+
+    def invalidate(self, key: str):
+        """캐시 항목 삭제"""
+        if self._entries.pop(key, None) is not None:
+            self._save()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"선택자 캐시 로드 실패: {e}")
+            return {}
+
+    def _save(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"선택자 캐시 저장 실패: {e}")
+
+
+_default_cache: Optional[SelectorCache] = None
+
+
+def get_selector_cache() -> SelectorCache:
+    """프로세스 전역 선택자 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SelectorCache()
+    return _default_cache
+
+
+def choose_selector(selectors: List[str], counts: List[int]) -> Tuple[Optional[str], int]:
+    """PREFERRED_MIN_COUNT개보다 많이 매칭되는 첫 선택자, 없으면 매칭되는 첫 선택자"""
+    fallback = (None, 0)
+    for selector, count in zip(selectors, counts):
+        if count > PREFERRED_MIN_COUNT:
+            return selector, count
+        if count > 0 and fallback[0] is None:
+            fallback = (selector, count)
+    return fallback
+
+
+async def probe_selectors(frame, selectors: List[str]) -> List[int]:
+    """후보 선택자별 매칭 개수 (페이지 내 평가 1회)"""
+    return await frame.evaluate(PROBE_SCRIPT, selectors)
+
+
+async def resolve_result_selector(frame, cache: SelectorCache, cache_key: str = 'search_results',
+                                  selectors: Optional[List[str]] = None,
+                                  timeout_ms: int = 3000) -> Tuple[Optional[str], int, str]:
+    """검색 결과 선택자 결정
+
+    반환값: (선택자, 매칭 개수, 출처 'cache' | 'probe')
+    """
+    selectors = selectors or RESULT_SELECTORS
+
+    # 1. 캐시된 선택자가 여전히 매칭되면 그대로 사용
+    cached = cache.get(cache_key)
+    if cached:
+        count = (await probe_selectors(frame, [cached]))[0]
+        if count > 0:
+            return cached, count, 'cache'
+        cache.invalidate(cache_key)
+
+    # 2. 전체 후보를 한 번에 탐색
+    counts = await probe_selectors(frame, selectors)
+    if not any(counts):
+        # 아직 아무것도 매칭되지 않으면 페이지 안에서 폴링하며 대기
+        try:
+            handle = await frame.wait_for_function(WAIT_ANY_SCRIPT, arg=selectors, timeout=timeout_ms)
+            counts = await handle.json_value()
+        except Exception:
+            return None, 0, 'probe'
+
+    selector, count = choose_selector(selectors, counts)
+    if selector:
+        cache.put(cache_key, selector)
+    return selector, count, 'probe'
@@ -1,33 +1,171 @@
 """
 스텔스 크롤링을 위한 유틸리티 함수들
 네이버 지도의 안티봇 시스템을 우회하기 위한 기능들
+
+브라우저 핑거프린트는 번들 파일(config/fingerprint_profiles.json)의 프로필 묶음
+(UA, 뷰포트, 화면, 로케일, 플랫폼)을 프로세스 시작 시 한 번 읽어 두고,
+컨텍스트를 만들 때마다 가중치에 따라 하나를 O(1)로 뽑아 사용한다
 """
 
+import json
 import random
+import threading
 import time
-from typing import Dict, List
-from fake_useragent import UserAgent
+from typing import Dict, List, Optional
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+from config.settings import FINGERPRINT_SETTINGS
+
+# 프로필에 반드시 있어야 하는 항목
+PROFILE_FIELDS = ('id', 'user_agent', 'platform', 'viewport', 'locale', 'timezone_id')
+
+# navigator.platform을 프로필 값으로 맞추는 초기화 스크립트 (UA와 플랫폼 불일치 방지)
+PLATFORM_INIT_SCRIPT = """
+Object.defineProperty(Navigator.prototype, 'platform', { get: () => %s });
+"""
+
+
+class FingerprintProfilePool:
+    """미리 읽어 둔 핑거프린트 프로필 묶음
+
+    가중치만큼 프로필 인덱스를 반복한 추첨 테이블을 만들어 두어 draw()는 random.choice 한 번으로 끝난다.
+    프로필별 사용 횟수를 기록한다.
+    """
+
+    def __init__(self, profiles: List[Dict], source: Optional[str] = None):
+        if not profiles:
+            raise ValueError("핑거프린트 프로필이 비어 있습니다")
+        self.source = source
+        self.profiles: List[Dict] = []
+        self._index_by_id: Dict[str, int] = {}
+        self._draw_table: List[int] = []
+        for profile in profiles:
+            missing = [field for field in PROFILE_FIELDS if field not in profile]
+            if missing:
+                raise ValueError(f"프로필 {profile.get('id', '?')}에 {', '.join(missing)} 항목이 없습니다")
+            if profile['id'] in self._index_by_id:
+                raise ValueError(f"프로필 ID가 중복되었습니다: {profile['id']}")
+            weight = int(profile.get('weight', 1))
+            if weight < 1:
+                continue
+            index = len(self.profiles)
+            self.profiles.append(profile)
+            self._index_by_id[profile['id']] = index
+            self._draw_table.extend([index] * weight)
+        if not self.profiles:
+            raise ValueError("가중치가 1 이상인 핑거프린트 프로필이 없습니다")
+        self._usage = [0] * len(self.profiles)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: str) -> 'FingerprintProfilePool':
+        """번들 JSON 파일에서 프로필 읽기 (상대 경로는 프로젝트 루트 기준)"""
+        if not os.path.isabs(path):
+            path = os.path.join(PROJECT_ROOT, path)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['profiles'] if isinstance(data, dict) else data, source=path)
+
+    def draw(self) -> Dict:
+        """가중치에 따라 프로필 하나 선택 (반환된 프로필은 수정하지 말 것)"""
+        index = random.choice(self._draw_table)
+        with self._lock:
+            self._usage[index] += 1
+        return self.profiles[index]
+
+    def get(self, profile_id: str) -> Dict:
+        """ID로 프로필 선택 (사용 횟수 기록)"""
+        index = self._index_by_id.get(profile_id)
+        if index is None:
+            raise KeyError(f"알 수 없는 핑거프린트 프로필: {profile_id}")
+        with self._lock:
+            self._usage[index] += 1
+        return self.profiles[index]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            usage = list(self._usage)
+        total_weight = len(self._draw_table)
+        return {
+            'source': self.source,
+            'profile_count': len(self.profiles),
+            'draws': sum(usage),
+            'profiles': [
+                {
+                    'id': profile['id'],
+                    'platform': profile['platform'],
+                    'viewport': f"{profile['viewport']['width']}x{profile['viewport']['height']}",
+                    'weight_share': round(int(profile.get('weight', 1)) / total_weight, 3),
+                    'used': used,
+                }
+                for profile, used in zip(self.profiles, usage)
+            ],
+        }
+
+
+_profile_pool: Optional[FingerprintProfilePool] = None
+_profile_pool_lock = threading.Lock()
+
+
+def get_profile_pool() -> FingerprintProfilePool:
+    """프로세스 전역 프로필 풀 (처음 호출할 때 한 번만 파일을 읽음)"""
+    global _profile_pool
+    if _profile_pool is None:
+        with _profile_pool_lock:
+            if _profile_pool is None:
+                _profile_pool = FingerprintProfilePool.from_file(FINGERPRINT_SETTINGS['profiles_path'])
+    return _profile_pool
+
+
+def draw_profile() -> Dict:
+    """새 컨텍스트에 사용할 프로필 (풀을 끄면 기본 프로필 고정)"""
+    pool = get_profile_pool()
+    if not FINGERPRINT_SETTINGS['enabled']:
+        return pool.get(FINGERPRINT_SETTINGS['default_profile_id'])
+    return pool.draw()
+
+
+def profile_context_options(profile: Dict) -> Dict:
+    """프로필을 browser.new_context() 인자로 변환"""
+    options = {
+        'user_agent': profile['user_agent'],
+        'viewport': dict(profile['viewport']),
+        'locale': profile['locale'],
+        'timezone_id': profile['timezone_id'],
+    }
+    if 'screen' in profile:
+        options['screen'] = dict(profile['screen'])
+    if 'device_scale_factor' in profile:
+        options['device_scale_factor'] = profile['device_scale_factor']
+    if profile.get('accept_language'):
+        options['extra_http_headers'] = {'Accept-Language': profile['accept_language']}
+    return options
+
+
+def profile_init_script(profile: Dict) -> Optional[str]:
+    """프로필 플랫폼에 맞춘 초기화 스크립트 (override_platform이 꺼져 있으면 None)"""
+    if not FINGERPRINT_SETTINGS['override_platform']:
+        return None
+    return PLATFORM_INIT_SCRIPT % json.dumps(profile['platform'])
 
 
 class StealthUtils:
-    """스텔스 크롤링을 위한 유틸리티 클래스"""
+    """스텔스 크롤링을 위한 유틸리티 클래스
+
+    인스턴스마다 UA 데이터셋을 읽지 않고 프로세스 전역 프로필 풀을 공유한다.
+    """
     
-    def __init__(self):
-        self.ua = UserAgent()
+    def __init__(self, profile: Optional[Dict] = None):
+        self.profile = profile or draw_profile()
         
     def get_random_user_agent(self) -> str:
-        """랜덤 사용자 에이전트 반환"""
-        try:
-            return self.ua.random
-        except:
-            # fallback user agents
-            fallback_agents = [
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0'
-            ]
-            return random.choice(fallback_agents)
+        """랜덤 사용자 에이전트 반환 (새 프로필을 뽑아 UA만 사용)"""
+        return draw_profile()['user_agent']
     
     def get_stealth_browser_args(self) -> List[str]:
         """스텔스 브라우저 실행 인수 반환"""
@@ -61,15 +199,8 @@ class StealthUtils:
         ]
     
     def get_viewport_size(self) -> Dict[str, int]:
-        """랜덤 뷰포트 크기 반환"""
-        common_resolutions = [
-            {'width': 1920, 'height': 1080},
-            {'width': 1366, 'height': 768},
-            {'width': 1536, 'height': 864},
-            {'width': 1440, 'height': 900},
-            {'width': 1280, 'height': 720},
-        ]
-        return random.choice(common_resolutions)
+        """이 인스턴스 프로필의 뷰포트 크기 반환"""
+        return dict(self.profile['viewport'])
     
     def random_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
         """랜덤 지연 시간"""
@@ -120,17 +251,14 @@ class StealthUtils:
         action(page)
     
     @staticmethod
-    def get_stealth_context_options() -> Dict:
-        """스텔스 컨텍스트 옵션 반환"""
+    def get_stealth_context_options(profile: Optional[Dict] = None) -> Dict:
+        """스텔스 컨텍스트 옵션 반환 (UA/뷰포트/로케일이 같은 프로필에서 나옴)"""
         return {
-            'user_agent': StealthUtils().get_random_user_agent(),
-            'viewport': StealthUtils().get_viewport_size(),
-            'locale': 'ko-KR',
-            'timezone_id': 'Asia/Seoul',
+            **profile_context_options(profile or draw_profile()),
             'permissions': ['geolocation'],
             'geolocation': {'longitude': 126.9780, 'latitude': 37.5665},  # 서울 좌표
             'java_script_enabled': True,
             'accept_downloads': False,
             'bypass_csp': True,
             'ignore_https_errors': True,
-        } 
\ No newline at end of file
+        }
@@ -0,0 +1,100 @@
+"""
+순위 조회 대상 업체 매칭
+업체명 또는 플레이스 ID로 지정한 대상이 검색 결과에 나타났는지 확인하고
+찾은 순위와 매칭 근거를 기록한다
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+# 숫자만으로 된 5자리 이상 값은 플레이스 ID로 취급
+PLACE_ID_PATTERN = re.compile(r'^\d{5,}$')
+# 이름 비교 시 무시할 문자 (공백, 문장부호)
+NAME_NOISE_PATTERN = re.compile(r'[\s\-_.,·()\[\]&/]+')
+
+
+def normalize_name(name: str) -> str:
+    """이름 비교용 정규화 (유니코드 NFC, 공백/문장부호 제거, 소문자)"""
+    return NAME_NOISE_PATTERN.sub('', unicodedata.normalize('NFC', name or '')).lower()
+
+
+class TargetMatcher:
+    """검색 결과에서 대상 업체를 찾아 순위 기록
+
+    대상 문자열이 숫자 5자리 이상이면 place_id로, 아니면 업체명으로 비교한다.
+    업체명은 정규화 후 완전 일치(name) > 결과 이름에 포함(name_partial) >
+    원시 텍스트에 포함(raw_text) 순으로 판단한다.
+    """
+
+    def __init__(self, targets: Iterable[str]):
+        self.targets: List[str] = list(dict.fromkeys(t.strip() for t in targets if t and t.strip()))
+        if not self.targets:
+            raise ValueError("순위를 조회할 대상이 없습니다")
+        self._place_ids = {t: t for t in self.targets if PLACE_ID_PATTERN.match(t)}
+        self._names = {t: normalize_name(t) for t in self.targets if t not in self._place_ids}
+        self.found: Dict[str, Dict] = {}
+        self.scanned = 0
+
+    @property
+    def done(self) -> bool:
+        """모든 대상을 찾았는지 여부"""
+        return len(self.found) == len(self.targets)
+
+    def reset(self):
+        """기록 초기화 (다른 엔진으로 다시 검색할 때)"""
+        self.found = {}
+        self.scanned = 0
+
+    def remaining(self) -> List[str]:
+        return [t for t in self.targets if t not in self.found]
+
+    def match(self, place: Dict) -> Optional[Dict]:
+        """결과 하나에서 아직 찾지 못한 대상과 일치하는 것을 찾아 근거 반환"""
+        place_id = str(place.get('place_id') or '')
+        name = normalize_name(place.get('name', ''))
+        raw_text = normalize_name(place.get('raw_text', ''))
+
+        for target in self.remaining():
+            matched_by = None
+            if target in self._place_ids:
+                if place_id and place_id == target:
+                    matched_by = 'place_id'
+            else:
+                wanted = self._names[target]
+                if not wanted:
+                    continue
+                if name == wanted:
+                    matched_by = 'name'
+                elif name and wanted in name:
+                    matched_by = 'name_partial'
+                elif wanted in raw_text:
+                    matched_by = 'raw_text'
+            if matched_by:
+                return {
+                    'target': target,
+                    'rank': place.get('rank'),
+                    'matched_by': matched_by,
+                    'name': place.get('name', ''),
+                    'place_id': place_id,
+                    'raw_text': place.get('raw_text', ''),
+                }
+        return None
+
+    def scan(self, places: Iterable[Dict]) -> bool:
+        """결과 목록을 순서대로 확인하여 찾은 대상을 기록하고 완료 여부 반환"""
+        for place in places:
+            self.scanned += 1
+            evidence = self.match(place)
+            if evidence:
+                self.found[evidence['target']] = evidence
+                if self.done:
+                    break
+        return self.done
+
+    def report(self) -> List[Dict]:
+        """대상별 결과 (찾지 못한 대상은 rank None)"""
+        return [
+            self.found.get(target, {'target': target, 'rank': None, 'matched_by': None})
+            for target in self.targets
+        ]
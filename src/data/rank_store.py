@@ -0,0 +1,240 @@
+"""
+순위 이력 저장소 (SQLite)
+검색/크롤링 결과를 (실행, 키워드, 위치, 장소, 순위) 한 행씩 누적하여
+"업체 X가 키워드 K에서 90일 동안 몇 위였는지"를 파일을 다시 읽지 않고 조회한다.
+WAL 모드로 읽기와 쓰기가 서로 막지 않으며, 결과 묶음은 executemany 한 번(트랜잭션 하나)으로 기록한다.
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import RANK_STORE_SETTINGS
+from src.crawler.target_matcher import PLACE_ID_PATTERN, normalize_name
+from src.utils.result_cache import normalize_query
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    observed_at INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    engine TEXT,
+    source TEXT,
+    result_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ranks (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    observed_at INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    place_id TEXT,
+    name TEXT,
+    name_key TEXT NOT NULL,
+    rank INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ranks_keyword_time ON ranks(keyword, location, observed_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_place_time ON ranks(place_id, observed_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_name_time ON ranks(name_key, observed_at);
+CREATE INDEX IF NOT EXISTS idx_runs_keyword_time ON runs(keyword, location, observed_at);
+"""
+
+TimeValue = Union[datetime, int, float, str, None]
+
+
+def format_location(longitude: Optional[float] = None, latitude: Optional[float] = None) -> str:
+    """위치 키 (소수점 4자리 "경도,위도", 위치 없음은 빈 문자열)"""
+    if longitude is None or latitude is None:
+        return ''
+    return f"{longitude:.4f},{latitude:.4f}"
+
+
+def to_epoch(value: TimeValue) -> Optional[int]:
+    """datetime/ISO 문자열/epoch 초를 epoch 초로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int(value.timestamp())
+
+
+class RankStore:
+    """순위 이력 SQLite 저장소
+
+    연결 하나를 잠금으로 보호하여 여러 스레드(asyncio.to_thread)에서 함께 사용한다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or RANK_STORE_SETTINGS['db_path']
+        if self.db_path != ':memory:':
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=RANK_STORE_SETTINGS['busy_timeout_ms'] / 1000,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')  # WAL에서는 체크포인트 때만 fsync
+        self._conn.executescript(SCHEMA)
+        self.rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def record_results(self, keyword: str, places: Iterable[Dict],
+                       longitude: Optional[float] = None, latitude: Optional[float] = None,
+                       engine: Optional[str] = None, source: Optional[str] = None,
+                       observed_at: TimeValue = None) -> int:
+        """검색 결과 한 번을 실행 하나로 기록하고 run_id 반환 (순위 없는 항목은 제외)"""
+        return self.record_many(
+            {keyword: places}, longitude=longitude, latitude=latitude,
+            engine=engine, source=source, observed_at=observed_at
+        )[0]
+
+    def record_many(self, results: Dict[str, Iterable[Dict]],
+                    longitude: Optional[float] = None, latitude: Optional[float] = None,
+                    engine: Optional[str] = None, source: Optional[str] = None,
+                    observed_at: TimeValue = None) -> List[int]:
+        """키워드별 결과(crawl_keywords 반환 형식)를 한 트랜잭션으로 기록하고 run_id 목록 반환"""
+        observed = to_epoch(observed_at) or int(time.time())
+        location = format_location(longitude, latitude)
+        run_ids: List[int] = []
+        with self._lock, self._conn:
+            for keyword, places in results.items():
+                normalized = normalize_query(keyword)
+                rows = [
+                    (observed, normalized, location, str(place.get('place_id') or '') or None,
+                     place.get('name') or None, normalize_name(place.get('name', '')), int(place['rank']))
+                    for place in places if place.get('rank')
+                ]
+                cursor = self._conn.execute(
+                    'INSERT INTO runs (observed_at, keyword, location, engine, source, result_count) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (observed, normalized, location, engine, source, len(rows))
+                )
+                run_id = cursor.lastrowid
+                self._conn.executemany(
+                    'INSERT INTO ranks (run_id, observed_at, keyword, location, place_id, name, name_key, rank) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(run_id, *row) for row in rows]
+                )
+                self.rows_written += len(rows)
+                run_ids.append(run_id)
+        return run_ids
+
+    def history(self, keyword: Optional[str] = None, place: Optional[str] = None,
+                longitude: Optional[float] = None, latitude: Optional[float] = None,
+                since: TimeValue = None, until: TimeValue = None,
+                limit: Optional[int] = None) -> List[Dict]:
+        """순위 이력 조회 (시간순, 행 수가 limit을 넘으면 최신 limit행만 반환)"""
+        return self.query_history(keyword, place, longitude, latitude, since, until, limit)[0]
+
+    def query_history(self, keyword: Optional[str] = None, place: Optional[str] = None,
+                      longitude: Optional[float] = None, latitude: Optional[float] = None,
+                      since: TimeValue = None, until: TimeValue = None,
+                      limit: Optional[int] = None) -> Tuple[List[Dict], bool]:
+        """순위 이력 조회 후 (시간순 행 목록, 잘림 여부) 반환
+
+        limit을 넘으면 가장 최근 limit행을 남기고 잘림 여부를 True로 반환한다.
+
+        keyword: 검색어 (정규화 후 비교)
+        place: 플레이스 ID(숫자 5자리 이상) 또는 업체명(정규화 후 완전 일치)
+        위치를 주면 해당 위치의 검색만, 주지 않으면 모든 위치를 포함한다.
+        """
+        if not keyword and not place:
+            raise ValueError("keyword 또는 place 중 하나는 지정해야 합니다")
+
+        clauses, params = [], []
+        if keyword:
+            clauses.append('keyword = ?')
+            params.append(normalize_query(keyword))
+        if longitude is not None and latitude is not None:
+            clauses.append('location = ?')
+            params.append(format_location(longitude, latitude))
+        if place:
+            place = place.strip()
+            if PLACE_ID_PATTERN.match(place):
+                clauses.append('place_id = ?')
+                params.append(place)
+            else:
+                clauses.append('name_key = ?')
+                params.append(normalize_name(place))
+        if since is not None:
+            clauses.append('observed_at >= ?')
+            params.append(to_epoch(since))
+        if until is not None:
+            clauses.append('observed_at <= ?')
+            params.append(to_epoch(until))
+
+        limit = min(limit or RANK_STORE_SETTINGS['default_limit'], RANK_STORE_SETTINGS['max_limit'])
+        sql = (
+            'SELECT run_id, observed_at, keyword, location, place_id, name, rank FROM ranks '
+            f"WHERE {' AND '.join(clauses)} ORDER BY observed_at DESC, rank LIMIT ?"
+        )
+        # 최신 행부터 limit + 1행을 읽어 잘림 여부를 판단하고, 반환은 시간순으로 뒤집음
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit + 1)).fetchall()
+        truncated = len(rows) > limit
+        rows = rows[:limit]
+        rows.sort(key=lambda row: (row['observed_at'], row['rank']))
+        return [
+            {**dict(row), 'observed_at': datetime.fromtimestamp(row['observed_at']).isoformat()}
+            for row in rows
+        ], truncated
+
+    def runs(self, keyword: str, since: TimeValue = None, limit: Optional[int] = None) -> List[Dict]:
+        """키워드의 검색 실행 목록 (결과가 0개였던 실행 포함, 최신순)"""
+        clauses, params = ['keyword = ?'], [normalize_query(keyword)]
+        if since is not None:
+            clauses.append('observed_at >= ?')
+            params.append(to_epoch(since))
+        limit = min(limit or RANK_STORE_SETTINGS['default_limit'], RANK_STORE_SETTINGS['max_limit'])
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM runs WHERE {' AND '.join(clauses)} ORDER BY observed_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [
+            {**dict(row), 'observed_at': datetime.fromtimestamp(row['observed_at']).isoformat()}
+            for row in rows
+        ]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            runs, rows = self._conn.execute(
+                'SELECT (SELECT COUNT(*) FROM runs), (SELECT COUNT(*) FROM ranks)'
+            ).fetchone()
+        return {'db_path': self.db_path, 'runs': runs, 'rows': rows, 'rows_written': self.rows_written}
+
+
+_rank_store: Optional[RankStore] = None
+
+
+def get_rank_store() -> Optional[RankStore]:
+    """프로세스 전역 순위 이력 저장소 (설정에서 비활성화하면 None)"""
+    global _rank_store
+    if not RANK_STORE_SETTINGS['enabled']:
+        return None
+    if _rank_store is None:
+        _rank_store = RankStore()
+    return _rank_store
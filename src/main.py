@@ -4,10 +4,8 @@
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
-from pathlib import Path
 from typing import List, Dict
 import sys
 import os
@@ -18,6 +16,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import OUTPUT_SETTINGS, LOG_SETTINGS
 from src.crawler.naver_map_crawler import NaverMapCrawler
 from src.utils.data_processor import DataProcessor
+from src.utils.ndjson_sink import NDJSONSink, read_ndjson
+from src.data.rank_store import get_rank_store
 
 # 로깅 설정
 logging.basicConfig(
@@ -49,52 +49,44 @@ async def main():
             
             logger.info(f"검색 키워드: {keywords}")
             
-            # 키워드별 검색 수행
-            all_results = await crawler.crawl_keywords(keywords)
-            
-            # 데이터 처리
-            processor = DataProcessor()
-            
-            # 모든 결과를 하나의 리스트로 합치기
-            all_places = []
-            for keyword, places in all_results.items():
-                all_places.extend(places)
-            
-            # 중복 제거 및 정리
-            processed_data = processor.process_places_data(all_places)
-            
-            # 결과 저장
             timestamp = datetime.now().strftime(OUTPUT_SETTINGS['timestamp_format'])
+            processor = DataProcessor()
             
-            # JSON 파일 저장
-            json_filename = OUTPUT_SETTINGS['json_filename'].format(timestamp=timestamp)
-            json_path = Path(OUTPUT_SETTINGS['output_directory']) / json_filename
-            
-            # 출력 디렉토리 생성
-            json_path.parent.mkdir(exist_ok=True)
+            # 키워드가 끝날 때마다 결과를 NDJSON에 바로 추가 (도중에 종료되어도 끝난 키워드는 보존)
+            ndjson_filename = OUTPUT_SETTINGS['ndjson_filename'].format(timestamp=timestamp)
+            ndjson_path = os.path.join(OUTPUT_SETTINGS['output_directory'], ndjson_filename)
+            crawled_at = datetime.now().isoformat(timespec='seconds')
+            rank_store = get_rank_store()
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': timestamp,
-                    'total_places': len(processed_data),
-                    'keywords': keywords,
-                    'places': processed_data
-                }, f, ensure_ascii=False, indent=2)
+            with NDJSONSink(ndjson_path) as sink:
+                async def write_keyword(keyword: str, places: List[Dict], stats: Dict):
+                    # 파일 쓰기/fsync와 SQLite 쓰기/커밋은 스레드에서 실행하여 다른 키워드 워커를 막지 않음
+                    await asyncio.to_thread(sink.write_places, keyword, places, crawled_at=crawled_at)
+                    # 순위 이력 저장소에도 기록 (키워드 K에서 업체 X의 순위 추이 조회용)
+                    if rank_store and places:
+                        await asyncio.to_thread(
+                            rank_store.record_results, keyword, places,
+                            source='main', observed_at=crawled_at
+                        )
+                
+                # 키워드별 검색 수행 (여러 페이지에서 동시에, 결과는 메모리에 모으지 않음)
+                await crawler.crawl_keywords(keywords, on_result=write_keyword, retain_results=False)
             
-            # Excel 파일 저장
+            # 데이터 처리 + Excel 저장 (기록한 NDJSON을 청크 단위로 읽어 메모리를 일정하게 유지)
             excel_filename = OUTPUT_SETTINGS['excel_filename'].format(timestamp=timestamp)
-            excel_path = Path(OUTPUT_SETTINGS['output_directory']) / excel_filename
-            processor.save_to_excel(processed_data, str(excel_path))
+            excel_path = processor.save_chunks_to_excel(
+                processor.iter_processed_chunks(read_ndjson(sink.path)), excel_filename
+            )
             
             # 결과 요약 출력
             logger.info(f"크롤링 완료!")
-            logger.info(f"총 수집된 장소: {len(processed_data)}개")
-            logger.info(f"JSON 파일: {json_path}")
+            logger.info(f"총 수집된 장소: {processor.last_export_stats.get('rows', 0)}개")
+            logger.info(f"NDJSON 파일: {sink.path} ({sink.lines}줄)")
             logger.info(f"Excel 파일: {excel_path}")
             
             # 키워드별 결과 요약
-            for keyword, places in all_results.items():
-                logger.info(f"'{keyword}': {len(places)}개 장소")
+            for keyword, stats in crawler.last_keyword_stats.items():
+                logger.info(f"'{keyword}': {stats['result_count']}개 장소 ({stats['elapsed_seconds']}초)")
                 
     except Exception as e:
         logger.error(f"메인 실행 중 오류: {e}")
@@ -111,7 +103,7 @@ async def test_single_search():
             
             logger.info(f"테스트 결과: {len(results)}개 장소 발견")
             for i, place in enumerate(results, 1):
-                logger.info(f"{i}. {place['name']} - {place['address']}")
+                logger.info(f"{i}. {place['name']} - {place.get('address', '')}")
                 
     except Exception as e:
         logger.error(f"테스트 중 오류: {e}")
@@ -1,21 +1,106 @@
 """
 크롤링된 데이터 처리 및 저장 유틸리티
 Excel, CSV, JSON 형식으로 데이터 저장 기능
+(수집일/키워드로 분할한 Parquet/Arrow IPC 데이터셋은 pyarrow 사용, requirements.txt에 포함)
 """
 
 import pandas as pd
+import numpy as np
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import re
+from datetime import date, datetime
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
 import logging
 import sys
+import time
+import tracemalloc
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pa_dataset
+except ImportError:  # Parquet/Arrow 저장은 선택 기능
+    pa = None
+    pa_dataset = None
 
 # 상위 디렉토리의 모듈 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from config.settings import OUTPUT_SETTINGS
 
+# DataFrame 컬럼 순서 (존재하는 컬럼만 사용)
+COLUMN_ORDER = [
+    'search_keyword', 'rank', 'name', 'address', 'category',
+    'rating', 'review_count', 'phone', 'url', 'crawled_at'
+]
+# 공백 정리 대상 문자열 컬럼
+TEXT_COLUMNS = ['name', 'address', 'category', 'phone', 'url']
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+RATING_PATTERN = re.compile(r'(?P<number>\d+\.?\d*)')  # "4.5점" -> "4.5"
+REVIEW_COUNT_PATTERN = re.compile(r'(?P<number>\d+)')  # "리뷰 1,250개" -> "1250" (쉼표 제거 후)
+
+# 문자열 정제에 쓰는 dtype (pyarrow가 있으면 Arrow 연산으로 행 단위 Python 호출 없이 처리)
+STRING_DTYPE = pd.ArrowDtype(pa.string()) if pa is not None else 'string'
+# str.split()과 같은 공백 문자 집합 (Arrow 정규식의 \s는 ASCII 공백만 포함하므로 NBSP 등을 직접 나열)
+WHITESPACE_RUN = '[\\s\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+'
+
+# Parquet/Arrow 데이터셋 파티션 컬럼 (hive 형식: crawl_date=2025-01-01/search_keyword=카페)
+PARTITION_COLUMNS = ['crawl_date', 'search_keyword']
+DATASET_FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}
+
+
+def arrow_schema():
+    """데이터셋 스키마 (rank int, rating float, crawled_at timestamp)"""
+    return pa.schema([
+        ('rank', pa.int32()),
+        ('name', pa.string()),
+        ('address', pa.string()),
+        ('category', pa.string()),
+        ('rating', pa.float64()),
+        ('review_count', pa.int64()),
+        ('phone', pa.string()),
+        ('url', pa.string()),
+        ('crawled_at', pa.timestamp('s')),
+        ('crawl_date', pa.date32()),
+        ('search_keyword', pa.string()),
+    ])
+
+
+def arrow_partitioning():
+    return pa_dataset.partitioning(
+        pa.schema([('crawl_date', pa.date32()), ('search_keyword', pa.string())]), flavor='hive'
+    )
+
+
+# Excel 시트 이름 규칙
+ALL_DATA_SHEET = '전체_데이터'
+SUMMARY_SHEET = '요약_통계'
+SHEET_NAME_MAX_LENGTH = 30
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+
+def make_sheet_names(keywords: Iterable[str], reserved: Iterable[str] = (ALL_DATA_SHEET, SUMMARY_SHEET)) -> Dict[str, str]:
+    """키워드별 고유 시트 이름 생성
+    
+    Excel에서 쓸 수 없는 문자는 '_'로 바꾸고 30자로 자른 뒤,
+    잘라서 같아진 이름(대소문자 무시)은 '~2', '~3' 접미사로 구분한다.
+    """
+    used = {name.lower() for name in reserved}
+    names: Dict[str, str] = {}
+    for keyword in keywords:
+        base = INVALID_SHEET_CHARS.sub('_', str(keyword)).strip("' ") or 'sheet'
+        name = base[:SHEET_NAME_MAX_LENGTH]
+        suffix = 2
+        while name.lower() in used:
+            tag = f"~{suffix}"
+            name = base[:SHEET_NAME_MAX_LENGTH - len(tag)] + tag
+            suffix += 1
+        used.add(name.lower())
+        names[keyword] = name
+    return names
+
 
 class DataProcessor:
     """데이터 처리 및 저장 클래스"""
@@ -23,6 +108,7 @@ class DataProcessor:
     def __init__(self):
         self.setup_logging()
         self.ensure_output_directory()
+        self.last_export_stats: Dict = {}
     
     def setup_logging(self):
         """로깅 설정"""
@@ -35,39 +121,23 @@ class DataProcessor:
             os.makedirs(output_dir)
             self.logger.info(f"출력 디렉토리 생성: {output_dir}")
     
-    def process_crawling_results(self, results: Dict[str, List[Dict]]) -> pd.DataFrame:
-        """크롤링 결과를 DataFrame으로 변환"""
+    def process_crawling_results(self, results: Dict[str, List[Dict]],
+                                 crawled_at: Optional[datetime] = None) -> pd.DataFrame:
+        """크롤링 결과를 DataFrame으로 변환
+        
+        행마다 dict를 복사하지 않고 DataFrame을 한 번에 만든 뒤 컬럼 단위로 정제한다.
+        rank/review_count는 Int64, rating은 float, crawled_at은 datetime, search_keyword는 category.
+        """
         try:
-            all_data = []
-            
-            for keyword, places in results.items():
-                for place in places:
-                    # 기본 정보에 키워드 추가
-                    place_data = place.copy()
-                    place_data['search_keyword'] = keyword
-                    place_data['crawled_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # 데이터 정제
-                    place_data = self.clean_place_data(place_data)
-                    all_data.append(place_data)
-            
-            # DataFrame 생성
-            df = pd.DataFrame(all_data)
-            
+            keywords = list(results.keys())
+            lengths = [len(results[keyword]) for keyword in keywords]
+            df = pd.DataFrame.from_records(
+                list(chain.from_iterable(results[keyword] for keyword in keywords))
+            )
             if not df.empty:
-                # 컬럼 순서 정리
-                column_order = [
-                    'search_keyword', 'rank', 'name', 'address', 'category',
-                    'rating', 'review_count', 'phone', 'url', 'crawled_at'
-                ]
-                
-                # 존재하는 컬럼만 선택
-                available_columns = [col for col in column_order if col in df.columns]
-                df = df[available_columns]
-                
-                # 정렬
-                df = df.sort_values(['search_keyword', 'rank']).reset_index(drop=True)
+                df['search_keyword'] = np.repeat(keywords, lengths)
             
+            df = self.clean_frame(df, crawled_at)
             self.logger.info(f"데이터 처리 완료: {len(df)} 건")
             return df
             
@@ -75,35 +145,105 @@ class DataProcessor:
             self.logger.error(f"데이터 처리 실패: {e}")
             return pd.DataFrame()
     
+    def iter_processed_chunks(self, records: Iterable[Dict], chunk_size: int = 100_000,
+                              crawled_at: Optional[datetime] = None) -> Iterator[pd.DataFrame]:
+        """search_keyword가 포함된 레코드 스트림을 chunk_size 행씩 정제하여 반환
+        
+        전체 이력을 메모리에 올리지 않고 처리할 때 사용 (정렬은 청크 안에서만 적용됨)
+        """
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            yield self.clean_frame(pd.DataFrame.from_records(chunk), crawled_at)
+    
+    def clean_frame(self, df: pd.DataFrame, crawled_at: Optional[datetime] = None) -> pd.DataFrame:
+        """컬럼 단위 정제: 공백 정리, 숫자 추출, 타입 지정, 컬럼 순서/정렬"""
+        if df.empty:
+            return df
+        
+        # 이력 재처리 시 기존 수집 시각 유지, 없으면 현재 시각
+        now = pd.Timestamp(crawled_at or datetime.now()).floor('s')
+        if 'crawled_at' in df.columns:
+            df['crawled_at'] = pd.to_datetime(df['crawled_at'], errors='coerce').fillna(now)
+        else:
+            df['crawled_at'] = now
+        
+        df = df[[col for col in COLUMN_ORDER if col in df.columns]].copy()
+        
+        for col in TEXT_COLUMNS:
+            if col in df.columns:
+                df[col] = self._collapse_whitespace(df[col])
+        
+        if 'rating' in df.columns:
+            df['rating'] = self._extract_number(df['rating'], RATING_PATTERN, 'Float64')
+        
+        if 'review_count' in df.columns:
+            # "리뷰 1,250개" -> 쉼표 제거 후 숫자 추출
+            df['review_count'] = self._extract_number(df['review_count'], REVIEW_COUNT_PATTERN, 'Int64',
+                                                      remove=',')
+        
+        if 'rank' in df.columns:
+            df['rank'] = pd.to_numeric(df['rank'], errors='coerce').astype('Int64')
+        
+        if 'search_keyword' in df.columns:
+            df['search_keyword'] = self._collapse_whitespace(df['search_keyword'], 'category')
+            df = df.sort_values(['search_keyword', 'rank'] if 'rank' in df.columns else ['search_keyword'],
+                                kind='stable').reset_index(drop=True)
+        return df
+    
+    @staticmethod
+    def _map_unique(series: pd.Series, func) -> pd.Series:
+        """고유값 Series에 벡터 연산 func를 적용하고 코드로 펼침
+        
+        이력 데이터는 업체명/주소/평점 문자열이 반복되므로 행 수가 아니라 고유값 수만큼만 정규식을 실행한다.
+        """
+        codes, uniques = pd.factorize(series)
+        # 숫자가 섞인 컬럼(예: 4.0, "4.5점")도 문자열로 바꾼 뒤 처리
+        mapped = func(pd.Series(uniques, dtype=object).astype('string').astype(STRING_DTYPE)).array
+        return pd.Series(mapped.take(codes, allow_fill=True), index=series.index, name=series.name)
+    
+    @classmethod
+    def _collapse_whitespace(cls, series: pd.Series, dtype: str = 'string') -> pd.Series:
+        """개행/연속 공백을 공백 하나로 바꾸고 앞뒤 공백 제거 (pandas 문자열 연산, 결측값 유지)"""
+        def collapse(uniques: pd.Series) -> pd.Series:
+            collapsed = uniques.str.replace(WHITESPACE_RUN, ' ', regex=True).str.strip()
+            if dtype == 'category':
+                # 범주 값은 기존처럼 object 문자열로 유지 (string dtype 범주는 Arrow/Excel 변환 결과가 달라짐)
+                collapsed = collapsed.astype(object).where(collapsed.notna(), None)
+            return collapsed.astype(dtype)
+        return cls._map_unique(series, collapse)
+    
+    @classmethod
+    def _extract_number(cls, series: pd.Series, pattern: re.Pattern, dtype: str, remove: str = '') -> pd.Series:
+        """문자열에서 pattern의 number 그룹을 추출해 dtype(Float64/Int64)으로 변환, 없으면 결측값
+        
+        remove에 지정한 문자(예: 천 단위 쉼표)는 추출 전에 제거한다.
+        """
+        def extract(uniques: pd.Series) -> pd.Series:
+            text = uniques.str.replace(remove, '', regex=False) if remove else uniques
+            extracted = text.str.extract(pattern.pattern, expand=False)
+            return pd.to_numeric(extracted, errors='coerce').astype(dtype)
+        return cls._map_unique(series, extract)
+    
     def clean_place_data(self, place_data: Dict) -> Dict:
-        """장소 데이터 정제"""
+        """장소 데이터 정제 (단일 레코드용, DataFrame은 clean_frame 사용)"""
         try:
-            # 텍스트 정제
+            # 텍스트 정제 (개행/연속 공백을 공백 하나로)
             for key, value in place_data.items():
                 if isinstance(value, str):
-                    # 불필요한 공백 제거
-                    value = value.strip()
-                    # 개행문자 제거
-                    value = value.replace('\n', ' ').replace('\r', ' ')
-                    # 연속된 공백 제거
-                    value = ' '.join(value.split())
-                    place_data[key] = value
-            
-            # 평점 숫자 추출
+                    place_data[key] = WHITESPACE_PATTERN.sub(' ', value).strip()
+            
+            # 평점 숫자 추출 (예: "4.5점" -> "4.5")
             if place_data.get('rating'):
-                rating_text = place_data['rating']
-                # 숫자 부분만 추출 (예: "4.5점" -> "4.5")
-                import re
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+                rating_match = RATING_PATTERN.search(place_data['rating'])
                 if rating_match:
                     place_data['rating'] = rating_match.group(1)
             
-            # 리뷰 수 숫자 추출
+            # 리뷰 수 숫자 추출 (예: "리뷰 125개" -> "125")
             if place_data.get('review_count'):
-                review_text = place_data['review_count']
-                # 숫자 부분만 추출 (예: "리뷰 125개" -> "125")
-                import re
-                review_match = re.search(r'(\d+)', review_text.replace(',', ''))
+                review_match = REVIEW_COUNT_PATTERN.search(place_data['review_count'].replace(',', ''))
                 if review_match:
                     place_data['review_count'] = review_match.group(1)
             
@@ -113,40 +253,200 @@ class DataProcessor:
             self.logger.warning(f"데이터 정제 실패: {e}")
             return place_data
     
-    def save_to_excel(self, df: pd.DataFrame, filename: Optional[str] = None) -> str:
-        """Excel 파일로 저장"""
+    def save_to_excel(self, df: pd.DataFrame, filename: Optional[str] = None,
+                      streaming: Optional[bool] = None) -> str:
+        """Excel 파일로 저장 (전체 데이터, 키워드별 시트, 요약 통계)
+        
+        키워드별 시트와 요약 통계는 groupby 한 번으로 만든다.
+        streaming이 True면 openpyxl write_only 모드로 한 행씩 기록하여 메모리를 일정하게 유지하고,
+        None이면 행 수가 excel_streaming_threshold 이상일 때 자동으로 사용한다.
+        저장 시간과 최대 메모리는 self.last_export_stats에 기록된다.
+        """
         try:
             if filename is None:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = f"naver_places_ranking_{timestamp}.xlsx"
             
             output_path = os.path.join(OUTPUT_SETTINGS['output_directory'], filename)
-            
-            # Excel 저장 (여러 시트로 구성)
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # 전체 데이터
-                df.to_excel(writer, sheet_name='전체_데이터', index=False)
+            if streaming is None:
+                streaming = len(df) >= OUTPUT_SETTINGS['excel_streaming_threshold']
+            
+            trace_memory = OUTPUT_SETTINGS['excel_trace_memory'] and not tracemalloc.is_tracing()
+            if trace_memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            try:
+                has_keywords = 'search_keyword' in df.columns and not df.empty
+                keywords = pd.unique(df['search_keyword']) if has_keywords else []
+                sheet_names = make_sheet_names(keywords)
+                sheet_count = 1 + len(sheet_names) + (0 if df.empty else 1)
                 
-                # 키워드별 시트 생성
-                if 'search_keyword' in df.columns:
-                    for keyword in df['search_keyword'].unique():
-                        keyword_df = df[df['search_keyword'] == keyword]
-                        sheet_name = keyword[:30]  # 시트명 길이 제한
-                        keyword_df.to_excel(writer, sheet_name=sheet_name, index=False)
+                def sheets():
+                    # 키워드별 시트는 groupby 한 번으로 순서대로 생성 (그룹을 한꺼번에 복사하지 않음)
+                    yield ALL_DATA_SHEET, df
+                    if has_keywords:
+                        for keyword, group in df.groupby('search_keyword', sort=False, observed=True):
+                            yield sheet_names[keyword], group
+                    if not df.empty:
+                        yield SUMMARY_SHEET, pd.DataFrame(self.create_summary_stats(df))
                 
-                # 요약 통계
-                if not df.empty:
-                    summary_data = self.create_summary_stats(df)
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name='요약_통계', index=False)
-            
-            self.logger.info(f"Excel 파일 저장 완료: {output_path}")
+                if streaming:
+                    self._write_excel_streaming(output_path, sheets())
+                else:
+                    # Excel 저장 (여러 시트로 구성)
+                    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+                        for sheet_name, frame in sheets():
+                            frame.to_excel(writer, sheet_name=sheet_name, index=False)
+            finally:
+                elapsed = time.perf_counter() - started
+                peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+                if trace_memory:
+                    tracemalloc.stop()
+            
+            self.last_export_stats = {
+                'path': output_path,
+                'mode': 'streaming' if streaming else 'pandas',
+                'rows': len(df),
+                'sheets': sheet_count,
+                'seconds': round(elapsed, 3),
+                'peak_memory_mb': round(peak / 1024 / 1024, 1) if peak is not None else None,
+            }
+            memory = (f", 최대 메모리 {self.last_export_stats['peak_memory_mb']}MB"
+                      if peak is not None else "")
+            self.logger.info(
+                f"Excel 파일 저장 완료: {output_path} "
+                f"({len(df)}행, 시트 {sheet_count}개, {self.last_export_stats['mode']}, {elapsed:.2f}초{memory})"
+            )
             return output_path
             
         except Exception as e:
             self.logger.error(f"Excel 저장 실패: {e}")
             return ""
     
+    @staticmethod
+    def _write_excel_streaming(output_path: str, sheets: Iterable, batch_rows: int = 10_000) -> None:
+        """openpyxl write_only 모드로 시트를 한 행씩 기록 (batch_rows 행씩만 변환)"""
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        for sheet_name, frame in sheets:
+            sheet = workbook.create_sheet(title=sheet_name)
+            sheet.append([str(col) for col in frame.columns])
+            for start in range(0, len(frame), batch_rows):
+                batch = frame.iloc[start:start + batch_rows]
+                # 결측값(NA/NaN/NaT)은 빈 셀로 기록
+                values = batch.astype(object).where(batch.notna(), None)
+                for row in values.itertuples(index=False, name=None):
+                    sheet.append(row)
+        workbook.save(output_path)
+
+    def save_chunks_to_excel(self, chunks: Iterable[pd.DataFrame], filename: Optional[str] = None,
+                             batch_rows: int = 10_000) -> str:
+        """정제된 청크를 차례로 받아 Excel로 저장 (iter_processed_chunks와 함께 사용)
+
+        전체 DataFrame을 만들지 않고 write_only 모드로 전체/키워드별 시트에 청크를 바로 기록하며,
+        요약 통계는 키워드별 합계/개수만 누적하여 마지막에 계산한다. 메모리는 청크 크기에 비례한다.
+        키워드 시트/행은 전체 정렬 없이 기록 순서(키워드 완료 순서)를 따른다.
+        """
+        from openpyxl import Workbook
+
+        try:
+            if filename is None:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                filename = f"naver_places_ranking_{timestamp}.xlsx"
+            output_path = os.path.join(OUTPUT_SETTINGS['output_directory'], filename)
+
+            started = time.perf_counter()
+            workbook = Workbook(write_only=True)
+            all_sheet = workbook.create_sheet(title=ALL_DATA_SHEET)
+            keyword_sheets: Dict[str, object] = {}
+            totals: Dict[str, Dict] = {}
+            header = None
+            rows = 0
+
+            def append_rows(sheet, frame: pd.DataFrame):
+                for start in range(0, len(frame), batch_rows):
+                    batch = frame.iloc[start:start + batch_rows]
+                    values = batch.astype(object).where(batch.notna(), None)
+                    for row in values.itertuples(index=False, name=None):
+                        sheet.append(row)
+
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+                if header is None:
+                    header = [str(col) for col in chunk.columns]
+                    all_sheet.append(header)
+                append_rows(all_sheet, chunk)
+                rows += len(chunk)
+                if 'search_keyword' not in chunk.columns:
+                    continue
+                for keyword, group in chunk.groupby('search_keyword', sort=False, observed=True):
+                    sheet = keyword_sheets.get(keyword)
+                    if sheet is None:
+                        # 시트 이름은 등장 순서대로 정해지므로 이미 만든 시트 이름은 바뀌지 않음
+                        name = make_sheet_names([*keyword_sheets, keyword])[keyword]
+                        sheet = keyword_sheets[keyword] = workbook.create_sheet(title=name)
+                        sheet.append(header)
+                    append_rows(sheet, group)
+                    self._accumulate_summary(totals.setdefault(keyword, {}), group)
+
+            if header is None:
+                all_sheet.append(COLUMN_ORDER)
+            if totals:
+                summary_sheet = workbook.create_sheet(title=SUMMARY_SHEET)
+                summary = pd.DataFrame([self._summary_row(keyword, total) for keyword, total in totals.items()])
+                summary_sheet.append(list(summary.columns))
+                append_rows(summary_sheet, summary)
+            workbook.save(output_path)
+            elapsed = time.perf_counter() - started
+
+            self.last_export_stats = {
+                'path': output_path,
+                'mode': 'chunked',
+                'rows': rows,
+                'sheets': 1 + len(keyword_sheets) + (1 if totals else 0),
+                'seconds': round(elapsed, 3),
+                'peak_memory_mb': None,
+            }
+            self.logger.info(
+                f"Excel 파일 저장 완료: {output_path} "
+                f"({rows}행, 시트 {self.last_export_stats['sheets']}개, chunked, {elapsed:.2f}초)"
+            )
+            return output_path
+
+        except Exception as e:
+            self.logger.error(f"Excel 저장 실패: {e}")
+            return ""
+
+    @staticmethod
+    def _accumulate_summary(total: Dict, group: pd.DataFrame) -> None:
+        """키워드 하나의 요약 통계용 합계/개수 누적"""
+        total['count'] = total.get('count', 0) + len(group)
+        for col in ('rating', 'review_count'):
+            if col in group.columns:
+                values = pd.to_numeric(group[col], errors='coerce')
+                total[f'{col}_sum'] = total.get(f'{col}_sum', 0.0) + float(values.sum())
+                total[f'{col}_n'] = total.get(f'{col}_n', 0) + int(values.notna().sum())
+        if 'category' in group.columns:
+            total.setdefault('categories', set()).update(group['category'].dropna())
+
+    @staticmethod
+    def _summary_row(keyword: str, total: Dict) -> Dict:
+        """누적한 합계로 create_summary_stats와 같은 형식의 요약 행 생성"""
+        stats = {
+            '검색_키워드': keyword,
+            '총_장소_수': total['count'],
+            '평균_평점': '',
+            '평균_리뷰_수': '',
+            '카테고리_수': len(total['categories']) if 'categories' in total else '',
+        }
+        if total.get('rating_n'):
+            stats['평균_평점'] = f"{total['rating_sum'] / total['rating_n']:.2f}"
+        if total.get('review_count_n'):
+            stats['평균_리뷰_수'] = f"{total['review_count_sum'] / total['review_count_n']:.0f}"
+        return stats
+
     def save_to_csv(self, df: pd.DataFrame, filename: Optional[str] = None) -> str:
         """CSV 파일로 저장"""
         try:
@@ -194,46 +494,38 @@ class DataProcessor:
             return ""
     
     def create_summary_stats(self, df: pd.DataFrame) -> List[Dict]:
-        """요약 통계 생성"""
+        """요약 통계 생성 (키워드별 groupby 한 번으로 계산)"""
         try:
-            summary_data = []
+            if 'search_keyword' not in df.columns or df.empty:
+                return []
+            
+            grouped = df.groupby('search_keyword', sort=False, observed=True)
+            summary = pd.DataFrame({'총_장소_수': grouped.size()})
+            if 'rating' in df.columns:
+                summary['평균_평점'] = pd.to_numeric(df['rating'], errors='coerce').groupby(
+                    df['search_keyword'], sort=False, observed=True).mean()
+            if 'review_count' in df.columns:
+                summary['평균_리뷰_수'] = pd.to_numeric(df['review_count'], errors='coerce').groupby(
+                    df['search_keyword'], sort=False, observed=True).mean()
+            if 'category' in df.columns:
+                summary['카테고리_수'] = grouped['category'].nunique()
             
-            if 'search_keyword' in df.columns:
-                for keyword in df['search_keyword'].unique():
-                    keyword_df = df[df['search_keyword'] == keyword]
-                    
-                    stats = {
-                        '검색_키워드': keyword,
-                        '총_장소_수': len(keyword_df),
-                        '평균_평점': '',
-                        '평균_리뷰_수': '',
-                        '카테고리_수': ''
-                    }
-                    
-                    # 평점 통계
-                    if 'rating' in keyword_df.columns:
-                        try:
-                            numeric_ratings = pd.to_numeric(keyword_df['rating'], errors='coerce')
-                            if not numeric_ratings.isna().all():
-                                stats['평균_평점'] = f"{numeric_ratings.mean():.2f}"
-                        except:
-                            pass
-                    
-                    # 리뷰 수 통계
-                    if 'review_count' in keyword_df.columns:
-                        try:
-                            numeric_reviews = pd.to_numeric(keyword_df['review_count'], errors='coerce')
-                            if not numeric_reviews.isna().all():
-                                stats['평균_리뷰_수'] = f"{numeric_reviews.mean():.0f}"
-                        except:
-                            pass
-                    
-                    # 카테고리 통계
-                    if 'category' in keyword_df.columns:
-                        unique_categories = keyword_df['category'].nunique()
-                        stats['카테고리_수'] = unique_categories
-                    
-                    summary_data.append(stats)
+            summary_data = []
+            for keyword, row in summary.iterrows():
+                stats = {
+                    '검색_키워드': keyword,
+                    '총_장소_수': int(row['총_장소_수']),
+                    '평균_평점': '',
+                    '평균_리뷰_수': '',
+                    '카테고리_수': ''
+                }
+                if pd.notna(row.get('평균_평점')):
+                    stats['평균_평점'] = f"{row['평균_평점']:.2f}"
+                if pd.notna(row.get('평균_리뷰_수')):
+                    stats['평균_리뷰_수'] = f"{row['평균_리뷰_수']:.0f}"
+                if '카테고리_수' in summary.columns:
+                    stats['카테고리_수'] = int(row['카테고리_수'])
+                summary_data.append(stats)
             
             return summary_data
             
@@ -241,6 +533,108 @@ class DataProcessor:
             self.logger.error(f"요약 통계 생성 실패: {e}")
             return []
     
+    def save_to_dataset(self, df: pd.DataFrame, base_dir: Optional[str] = None,
+                        file_format: str = 'parquet') -> str:
+        """수집일/키워드로 분할한 Parquet 또는 Arrow IPC 데이터셋에 추가 저장
+        
+        base_dir/crawl_date=YYYY-MM-DD/search_keyword=.../part-{timestamp}-{i}.{parquet|arrow}
+        실행마다 파일 이름이 달라 기존 파티션에 이어서 쌓인다.
+        """
+        try:
+            if pa is None:
+                raise RuntimeError("pyarrow가 설치되어 있지 않습니다 (pip install pyarrow)")
+            if file_format not in DATASET_FORMATS:
+                raise ValueError(f"지원하지 않는 형식: {file_format}")
+            if df.empty:
+                return ""
+            
+            base_dir = base_dir or OUTPUT_SETTINGS[
+                'dataset_directory' if file_format == 'parquet' else 'arrow_dataset_directory'
+            ]
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            pa_dataset.write_dataset(
+                self._to_arrow_table(df),
+                base_dir,
+                format=DATASET_FORMATS[file_format],
+                partitioning=arrow_partitioning(),
+                basename_template=f"part-{timestamp}-{{i}}.{file_format}",
+                existing_data_behavior='overwrite_or_ignore',
+            )
+            
+            self.logger.info(f"{file_format} 데이터셋 저장 완료: {base_dir} ({len(df)}행)")
+            return base_dir
+            
+        except Exception as e:
+            self.logger.error(f"{file_format} 데이터셋 저장 실패: {e}")
+            return ""
+    
+    def save_to_parquet(self, df: pd.DataFrame, base_dir: Optional[str] = None) -> str:
+        """수집일/키워드로 분할한 Parquet 데이터셋에 저장"""
+        return self.save_to_dataset(df, base_dir, 'parquet')
+    
+    def save_to_arrow(self, df: pd.DataFrame, base_dir: Optional[str] = None) -> str:
+        """수집일/키워드로 분할한 Arrow IPC 데이터셋에 저장"""
+        return self.save_to_dataset(df, base_dir, 'arrow')
+    
+    def load_dataset(self, base_dir: Optional[str] = None,
+                     keywords: Optional[Sequence[str]] = None,
+                     start_date: Optional[Union[date, str]] = None,
+                     end_date: Optional[Union[date, str]] = None,
+                     columns: Optional[Sequence[str]] = None,
+                     file_format: str = 'parquet') -> pd.DataFrame:
+        """저장된 데이터셋에서 요청한 파티션(키워드/기간)과 컬럼만 읽기
+        
+        파티션 조건은 디렉토리 단계에서 걸러지므로 해당하지 않는 파일은 열지 않는다.
+        """
+        if pa is None:
+            raise RuntimeError("pyarrow가 설치되어 있지 않습니다 (pip install pyarrow)")
+        base_dir = base_dir or OUTPUT_SETTINGS[
+            'dataset_directory' if file_format == 'parquet' else 'arrow_dataset_directory'
+        ]
+        if not os.path.isdir(base_dir):
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        
+        dataset = pa_dataset.dataset(
+            base_dir, format=DATASET_FORMATS[file_format], partitioning=arrow_partitioning(),
+            schema=arrow_schema(), exclude_invalid_files=True
+        )
+        conditions = []
+        if keywords:
+            conditions.append(pa_dataset.field('search_keyword').isin(list(keywords)))
+        if start_date:
+            conditions.append(pa_dataset.field('crawl_date') >= pa.scalar(pd.Timestamp(start_date).date()))
+        if end_date:
+            conditions.append(pa_dataset.field('crawl_date') <= pa.scalar(pd.Timestamp(end_date).date()))
+        row_filter = None
+        for condition in conditions:
+            row_filter = condition if row_filter is None else row_filter & condition
+        
+        table = dataset.to_table(columns=list(columns) if columns else None, filter=row_filter)
+        return table.to_pandas()
+    
+    def _to_arrow_table(self, df: pd.DataFrame):
+        """정제된 DataFrame을 데이터셋 스키마의 Arrow 테이블로 변환 (없는 컬럼은 null)"""
+        schema = arrow_schema()
+        crawled_at = pd.to_datetime(df['crawled_at']) if 'crawled_at' in df.columns else pd.Series(
+            pd.Timestamp.now(), index=df.index)
+        arrays = []
+        for field in schema:
+            if field.name == 'crawl_date':
+                values = crawled_at.dt.date
+            elif field.name == 'crawled_at':
+                values = crawled_at.dt.floor('s')
+            elif field.name in df.columns:
+                values = df[field.name]
+                if field.name == 'search_keyword':
+                    values = values.astype('string')
+            else:
+                values = None
+            if values is None:
+                arrays.append(pa.nulls(len(df), type=field.type))
+            else:
+                arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        return pa.Table.from_arrays(arrays, schema=schema)
+    
     def save_all_formats(self, results: Dict[str, List[Dict]]) -> Dict[str, str]:
         """모든 형식으로 저장"""
         saved_files = {}
@@ -259,6 +653,15 @@ class DataProcessor:
                 csv_path = self.save_to_csv(df)
                 if csv_path:
                     saved_files['csv'] = csv_path
+                
+                # Parquet 데이터셋 (pyarrow가 있을 때만)
+                if pa is not None:
+                    parquet_path = self.save_to_parquet(df)
+                    if parquet_path:
+                        saved_files['parquet'] = parquet_path
+                else:
+                    self.logger.warning("pyarrow가 설치되어 있지 않아 Parquet 데이터셋을 건너뜀 "
+                                        "(pip install -r requirements.txt)")
             
             # JSON 저장 (원본 데이터)
             json_path = self.save_to_json(results)
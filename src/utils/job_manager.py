@@ -0,0 +1,168 @@
+"""
+비동기 크롤링 작업 관리
+작업을 큐에 넣고 즉시 ID를 반환하며, 워커 풀이 작업을 실행한다.
+진행 상황/결과는 ID로 조회하고, 완료된 작업은 보관 기간이 지나면 삭제된다
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import JOB_SETTINGS
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+# 작업 실행 함수: (요청 데이터, 진행 이벤트 콜백) -> 결과
+JobRunner = Callable[[Any, Callable[[str, Dict], None]], Awaitable[Any]]
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업이 너무 많음"""
+
+
+class Job:
+    """크롤링 작업 하나"""
+
+    def __init__(self, payload: Any):
+        self.id = uuid.uuid4().hex
+        self.payload = payload
+        self.status = JOB_QUEUED
+        self.progress: Dict = {'stage': JOB_QUEUED, 'events': 0}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._finished_monotonic: Optional[float] = None
+
+    def update_progress(self, stage: str, data: Dict):
+        """진행 이벤트 반영"""
+        self.progress = {
+            'stage': stage,
+            'events': self.progress.get('events', 0) + 1,
+            'updated_at': datetime.now().isoformat(),
+            **data,
+        }
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_DONE, JOB_FAILED)
+
+    def expired(self, retention_seconds: float) -> bool:
+        return (self._finished_monotonic is not None
+                and time.monotonic() - self._finished_monotonic > retention_seconds)
+
+    def to_dict(self) -> Dict:
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'progress': self.progress,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobManager:
+    """작업 큐 + 워커 풀 + 만료 정리"""
+
+    def __init__(self, runner: JobRunner, workers: Optional[int] = None,
+                 retention_seconds: Optional[float] = None,
+                 max_queued: Optional[int] = None):
+        self.runner = runner
+        self.worker_count = workers or JOB_SETTINGS['workers']
+        self.retention_seconds = retention_seconds or JOB_SETTINGS['retention_seconds']
+        self.max_queued = max_queued or JOB_SETTINGS['max_queued']
+        self.jobs: Dict[str, Job] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self.logger = logging.getLogger('JobManager')
+
+    async def start(self):
+        """워커와 만료 정리 태스크 시작"""
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.worker_count)]
+        self._tasks.append(asyncio.create_task(self._cleanup_loop()))
+        self.logger.info(f"작업 관리자 시작: 워커 {self.worker_count}개")
+
+    async def stop(self):
+        """워커 종료 (실행 중인 작업은 취소)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, payload: Any) -> Job:
+        """작업 등록 후 즉시 반환"""
+        if self._queue.qsize() >= self.max_queued:
+            raise JobQueueFullError(f"대기 중인 작업이 {self.max_queued}개를 초과했습니다")
+        job = Job(payload)
+        self.jobs[job.id] = job
+        self._queue.put_nowait(job)
+        job.progress['queue_position'] = self._queue.qsize()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (만료된 작업은 None)"""
+        job = self.jobs.get(job_id)
+        if job and job.expired(self.retention_seconds):
+            self.jobs.pop(job_id, None)
+            return None
+        return job
+
+    async def _worker(self, worker_id: int):
+        while True:
+            job = await self._queue.get()
+            job.status = JOB_RUNNING
+            job.started_at = datetime.now()
+            job.update_progress(JOB_RUNNING, {'worker': worker_id})
+            try:
+                job.result = await self.runner(job.payload, job.update_progress)
+                job.status = JOB_DONE
+            except asyncio.CancelledError:
+                job.status = JOB_FAILED
+                job.error = "작업이 취소되었습니다"
+                raise
+            except Exception as e:
+                job.status = JOB_FAILED
+                job.error = str(e)
+                self.logger.error(f"작업 {job.id} 실패: {e}")
+            finally:
+                job.finished_at = datetime.now()
+                job._finished_monotonic = time.monotonic()
+                job.update_progress(job.status, {})
+                self._queue.task_done()
+
+    async def _cleanup_loop(self):
+        while True:
+            await asyncio.sleep(JOB_SETTINGS['cleanup_interval'])
+            expired = [job_id for job_id, job in self.jobs.items()
+                       if job.expired(self.retention_seconds)]
+            for job_id in expired:
+                self.jobs.pop(job_id, None)
+            if expired:
+                self.logger.info(f"만료된 작업 {len(expired)}개 삭제")
+
+    def stats(self) -> Dict:
+        """작업 상태별 개수"""
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'workers': self.worker_count,
+            'queued': self._queue.qsize(),
+            'retention_seconds': self.retention_seconds,
+            'jobs': counts,
+        }
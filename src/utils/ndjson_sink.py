@@ -0,0 +1,308 @@
+"""
+추가 전용(append-only) NDJSON 결과 기록
+키워드 검색이 끝날 때마다 장소 하나를 한 줄(압축 JSON)로 바로 추가하여
+실행 도중 종료되어도 이미 끝난 키워드의 결과는 남도록 한다.
+gzip/zstd 압축과 fsync 정책을 지원하며, 읽을 때는 잘린 마지막 줄을 건너뛴다.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional
+import sys
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 기능
+    zstandard = None
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import NDJSON_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+FSYNC_POLICIES = ('always', 'batch', 'never')
+GZIP_MAGIC = b'\x1f\x8b\x08'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+READ_CHUNK_SIZE = 1 << 16
+
+
+def resolve_compression(compression: Optional[str]) -> Optional[str]:
+    """압축 방식 확인 (zstandard가 없으면 zstd 대신 gzip)"""
+    if compression in (None, '', 'none'):
+        return None
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+    if compression == 'zstd' and zstandard is None:
+        logger.warning("zstandard 패키지가 없어 gzip으로 압축합니다")
+        return 'gzip'
+    return compression
+
+
+def sink_path(path: str, compression: Optional[str]) -> str:
+    """압축 방식에 맞는 확장자(.gz/.zst)를 붙인 경로"""
+    suffix = COMPRESSION_SUFFIXES.get(compression, '')
+    return path if not suffix or path.endswith(suffix) else path + suffix
+
+
+class NDJSONSink:
+    """한 줄에 레코드 하나씩 추가하는 NDJSON 파일
+
+    fsync 정책
+      always: 줄마다 압축 버퍼를 비우고 디스크에 동기화 (가장 안전, 가장 느림)
+      batch : write_many/write_places 호출(키워드 묶음)마다 동기화
+      never : 닫을 때까지 OS 버퍼에 맡김
+
+    압축 파일은 열 때마다 새 gzip 멤버/zstd 프레임으로 이어 쓰고, 동기화 시점마다
+    압축 블록을 마감(flush)하므로 도중에 종료되어도 마지막 동기화까지는 읽을 수 있다.
+    쓰기는 잠금으로 직렬화되므로 asyncio.to_thread 등 여러 스레드에서 호출해도
+    한 번의 write_many 묶음은 연속된 줄로 기록된다.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = 'default',
+                 fsync: Optional[str] = None, compression_level: Optional[int] = None):
+        if compression == 'default':
+            compression = NDJSON_SETTINGS['compression']
+        self.compression = resolve_compression(compression)
+        self.fsync = fsync or NDJSON_SETTINGS['fsync']
+        if self.fsync not in FSYNC_POLICIES:
+            raise ValueError(f"지원하지 않는 fsync 정책: {self.fsync}")
+        self.compression_level = compression_level or NDJSON_SETTINGS['compression_level']
+        self.path = sink_path(path, self.compression)
+        self.lines = 0
+        self.syncs = 0
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.compression is None:
+            self._drop_partial_line()
+
+        self._file = open(self.path, 'ab')
+        if self.compression == 'gzip':
+            self._stream = gzip.GzipFile(fileobj=self._file, mode='ab', compresslevel=self.compression_level)
+        elif self.compression == 'zstd':
+            compressor = zstandard.ZstdCompressor(level=self.compression_level)
+            self._stream = compressor.stream_writer(self._file, closefd=False)
+        else:
+            self._stream = self._file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _drop_partial_line(self):
+        """비압축 파일이 이전 실행에서 줄 중간에 끊겼으면 마지막 줄바꿈 뒤를 잘라냄"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - READ_CHUNK_SIZE)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+                logger.warning(f"잘린 마지막 줄 제거: {self.path} ({end - position}바이트)")
+
+    def _write_line(self, record: Dict):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str)
+        self._stream.write(line.encode('utf-8') + b'\n')
+        self.lines += 1
+
+    def write(self, record: Dict):
+        """레코드 한 줄 추가"""
+        with self._lock:
+            self._write_line(record)
+            if self.fsync == 'always':
+                self.flush()
+
+    def write_many(self, records: Iterable[Dict]) -> int:
+        """레코드 여러 줄을 추가하고 (batch 정책이면) 한 번 동기화"""
+        count = 0
+        with self._lock:
+            for record in records:
+                self._write_line(record)
+                count += 1
+                if self.fsync == 'always':
+                    self.flush()
+            if count and self.fsync == 'batch':
+                self.flush()
+        return count
+
+    def write_places(self, keyword: str, places: Iterable[Dict], **extra) -> int:
+        """키워드 검색 결과를 장소당 한 줄로 추가 (search_keyword와 extra 필드 포함)"""
+        return self.write_many({**place, 'search_keyword': keyword, **extra} for place in places)
+
+    def flush(self, sync: bool = True):
+        """압축 블록을 마감하고 파일 버퍼를 비움 (sync면 fsync까지)"""
+        with self._lock:
+            if self.compression == 'gzip':
+                self._stream.flush(zlib.Z_SYNC_FLUSH)
+            elif self.compression == 'zstd':
+                self._stream.flush(zstandard.FLUSH_BLOCK)
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+                self.syncs += 1
+
+    def close(self):
+        """압축 스트림을 마감하고 파일 닫기 (never 정책이어도 닫을 때는 동기화)"""
+        with self._lock:
+            if self.closed:
+                return
+            try:
+                if self._stream is not self._file:
+                    self._stream.close()  # gzip 멤버 끝/zstd 프레임 끝 기록 (파일은 닫지 않음)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self.syncs += 1
+            finally:
+                self._file.close()
+
+
+def _detect_compression(path: str) -> Optional[str]:
+    """파일 앞부분의 매직 바이트로 압축 방식 판별"""
+    with open(path, 'rb') as f:
+        head = f.read(4)
+    if head.startswith(GZIP_MAGIC[:2]):
+        return 'gzip'
+    if head == ZSTD_MAGIC:
+        return 'zstd'
+    return None
+
+
+def _decompress_until_error(decompressor, data: bytes, step: int = 1024) -> bytes:
+    """data를 step 바이트씩 풀다가 손상된 지점에서 멈추고 그때까지 풀린 내용 반환"""
+    output = []
+    for start in range(0, len(data), step):
+        try:
+            output.append(decompressor.decompress(data[start:start + step]))
+        except zlib.error:
+            break
+    return b''.join(output)
+
+
+def _iter_gzip_chunks(f) -> Iterator[Optional[bytes]]:
+    """gzip 멤버를 차례로 풀어 반환
+
+    이전 실행이 중간에 끊겼거나 손상된 멤버는 풀 수 있는 데까지 반환한 뒤
+    None(경계 표시)을 내고 다음 멤버 헤더부터 다시 읽는다. 뒤에 멤버가 없으면 그대로 종료.
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    data = f.read(READ_CHUNK_SIZE)
+    while data:
+        checkpoint = decompressor.copy()
+        try:
+            yield decompressor.decompress(data)
+        except zlib.error:
+            # 다음 멤버 헤더 앞까지(없으면 청크 끝까지)는 끊긴 멤버의 나머지이므로 풀 수 있는 데까지 반환
+            position = data.find(GZIP_MAGIC, 1)
+            yield _decompress_until_error(checkpoint, data[:position] if position > 0 else data)
+            yield None
+            # 다음 멤버 헤더가 없으면 다음 청크에서 계속 찾음
+            while position == -1:
+                tail = data[-(len(GZIP_MAGIC) - 1):]
+                more = f.read(READ_CHUNK_SIZE)
+                if not more:
+                    return
+                data = tail + more
+                position = data.find(GZIP_MAGIC, 1)
+            decompressor = zlib.decompressobj(wbits=31)
+            data = data[position:]
+            continue
+        if decompressor.eof:
+            data = decompressor.unused_data
+            decompressor = zlib.decompressobj(wbits=31)
+            if data:
+                continue
+        data = f.read(READ_CHUNK_SIZE)
+
+
+def _iter_zstd_chunks(f) -> Iterator[Optional[bytes]]:
+    reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True, closefd=False)
+    while True:
+        try:
+            chunk = reader.read(READ_CHUNK_SIZE)
+        except zstandard.ZstdError:
+            return  # 마지막 프레임이 잘림
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_raw_chunks(f) -> Iterator[Optional[bytes]]:
+    while True:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_ndjson(path: str, compression: Optional[str] = 'auto') -> Iterator[Dict]:
+    """NDJSON 파일을 한 줄씩 읽어 레코드 반환
+
+    compression이 'auto'면 매직 바이트로 판별한다.
+    줄바꿈으로 끝나지 않은 마지막 줄(기록 중 종료)과 끊긴 압축 멤버 주변의
+    깨진 줄은 경고만 남기고 건너뛴다.
+    """
+    if compression == 'auto':
+        compression = _detect_compression(path)
+    if compression == 'zstd' and zstandard is None:
+        raise RuntimeError("zstd 파일을 읽으려면 zstandard 패키지가 필요합니다")
+
+    iter_chunks = {'gzip': _iter_gzip_chunks, 'zstd': _iter_zstd_chunks}.get(compression, _iter_raw_chunks)
+    skipped = 0
+    pending = b''
+    with open(path, 'rb') as f:
+        for chunk in iter_chunks(f):
+            if chunk is None:
+                # 끊긴 멤버 경계: 마감되지 않은 줄은 버림
+                skipped += bool(pending.strip())
+                pending = b''
+                continue
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    skipped += 1
+
+    if pending.strip():
+        try:
+            yield json.loads(pending)
+        except ValueError:
+            skipped += 1
+    if skipped:
+        logger.warning(f"읽을 수 없는 줄 {skipped}개 건너뜀: {path}")
+
+
+def load_keyword_results(path: str) -> Dict[str, List[Dict]]:
+    """NDJSON 기록을 키워드별 결과 dict로 다시 묶음 (search_keyword 필드 기준, 기록 순서 유지)"""
+    results: Dict[str, List[Dict]] = {}
+    for record in read_ndjson(path):
+        keyword = record.pop('search_keyword', '')
+        results.setdefault(keyword, []).append(record)
+    return results
@@ -0,0 +1,135 @@
+"""
+검색 결과 원시 텍스트(raw_text) 파서
+업체명/카테고리/주소/영업 상태/영업 시간/별점/리뷰 수를 미리 컴파일한 정규식으로 추출한다.
+(google_apps_script_webapp.js의 extract* 함수와 크롤러/백엔드의 extract_business_name 통합)
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# 업체명 뒤에 오는 구분 키워드 (가장 먼저 나오는 키워드 앞까지가 업체명)
+NAME_STOP_KEYWORDS = [
+    "예약", "광고", "영업", "리뷰", "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
+    "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
+    "네이버페이", "톡톡", "별점", "현재", "위치", "거리", "출발", "도착", "상세주소", "저장", "더보기"
+]
+
+# 우선순위 순 카테고리 (텍스트에 여러 개가 있으면 앞쪽 항목 우선)
+CATEGORY_KEYWORDS = [
+    '한식', '중식', '일식', '양식', '카페', '베이커리', '치킨', '피자', '분식', '냉면', '갈비', '삼겹살',
+    '스테이크', '이자카야', '술집', '바', '공방', '미용실', '병원', '약국', '은행'
+]
+CATEGORY_PRIORITY = {category: i for i, category in enumerate(CATEGORY_KEYWORDS)}
+
+REGIONS = "서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주"
+
+# 키워드 집합은 긴 키워드를 먼저 두어 같은 위치에서 가장 긴 키워드가 일치하도록 함
+NAME_STOP_PATTERN = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(NAME_STOP_KEYWORDS, key=len, reverse=True)
+))
+CATEGORY_PATTERN = re.compile('|'.join(
+    re.escape(category) for category in sorted(CATEGORY_KEYWORDS, key=len, reverse=True)
+))
+CATEGORY_FALLBACK_PATTERN = re.compile(r'(한식|중식|일식|양식|카페|음식|요리|[가-힣]+점|[가-힣]+집)')
+ADDRESS_PATTERN = re.compile(rf'(?:{REGIONS})\s+[가-힣\s\d]+')
+STATUS_PATTERN = re.compile(r'영업 중|영업 종료|휴무')
+HOURS_PATTERN = re.compile(r'(\d{1,2}:\d{2}에 영업 (?:시작|종료))')
+RATING_PATTERN = re.compile(r'별점(\d+\.?\d*)')
+REVIEW_COUNT_PATTERN = re.compile(r'리뷰\s*(\d+\+?|\d+)')
+TAG_PATTERN = re.compile(r'미쉐린|광고|새로오픈')
+
+# 영업 상태가 여러 개 있으면 이 순서로 우선 (스크립트와 동일)
+STATUS_PRIORITY = {'영업 중': 0, '영업 종료': 1, '휴무': 2}
+TAG_ORDER = ['미쉐린', '광고', '새로오픈']
+
+NAME_MAX_LENGTH = 30
+NAME_FALLBACK_LENGTH = 20
+
+
+def extract_business_name(raw_text: str) -> str:
+    """원시 텍스트에서 업체명만 추출
+
+    첫 구분 키워드 앞까지를 업체명으로 사용하며 30자를 넘으면 잘라서 "..."를 붙인다.
+    키워드 앞이 비어 있으면 앞 20자를 사용한다.
+    """
+    if not raw_text:
+        return ""
+
+    match = NAME_STOP_PATTERN.search(raw_text)
+    name = raw_text[:match.start() if match else len(raw_text)].strip()
+    if len(name) > NAME_MAX_LENGTH:
+        name = name[:NAME_MAX_LENGTH] + "..."
+    if name:
+        return name
+    return raw_text[:NAME_FALLBACK_LENGTH] + "..." if len(raw_text) > NAME_FALLBACK_LENGTH else raw_text
+
+
+def extract_category(raw_text: str) -> str:
+    """카테고리 (목록 키워드 우선, 없으면 '~점', '~집' 등 패턴)"""
+    found = set(CATEGORY_PATTERN.findall(raw_text))
+    if found:
+        return min(found, key=CATEGORY_PRIORITY.__getitem__)
+    match = CATEGORY_FALLBACK_PATTERN.search(raw_text)
+    return match.group(1) if match else ''
+
+
+def extract_address(raw_text: str) -> str:
+    match = ADDRESS_PATTERN.search(raw_text)
+    return match.group(0) if match else ''
+
+
+def extract_business_status(raw_text: str) -> str:
+    found = set(STATUS_PATTERN.findall(raw_text))
+    return min(found, key=STATUS_PRIORITY.__getitem__) if found else ''
+
+
+def extract_business_hours(raw_text: str) -> str:
+    match = HOURS_PATTERN.search(raw_text)
+    return match.group(1) if match else ''
+
+
+def extract_rating(raw_text: str) -> str:
+    match = RATING_PATTERN.search(raw_text)
+    return match.group(1) if match else ''
+
+
+def extract_review_count(raw_text: str) -> str:
+    match = REVIEW_COUNT_PATTERN.search(raw_text)
+    return match.group(1) if match else ''
+
+
+def extract_tags(raw_text: str) -> List[str]:
+    """미쉐린/광고/새로오픈 표시"""
+    found = set(TAG_PATTERN.findall(raw_text))
+    return [tag for tag in TAG_ORDER if tag in found]
+
+
+# 필드 이름 -> 추출 함수
+FIELD_EXTRACTORS = {
+    'name': extract_business_name,
+    'category': extract_category,
+    'address': extract_address,
+    'business_status': extract_business_status,
+    'business_hours': extract_business_hours,
+    'rating': extract_rating,
+    'review_count': extract_review_count,
+    'naver_pay': lambda raw_text: '네이버페이' in raw_text,
+    'reservation': lambda raw_text: '예약' in raw_text or '톡톡' in raw_text,
+    'tags': extract_tags,
+}
+
+
+def parse_raw_text(raw_text: str, fields: Optional[Sequence[str]] = None) -> Dict:
+    """원시 텍스트 하나를 필드별로 파싱 (fields를 주면 해당 필드만)"""
+    raw_text = raw_text or ''
+    names = fields or FIELD_EXTRACTORS.keys()
+    return {field: FIELD_EXTRACTORS[field](raw_text) for field in names}
+
+
+def parse_raw_texts(raw_texts: Iterable[str], fields: Optional[Sequence[str]] = None) -> List[Dict]:
+    """원시 텍스트 여러 개를 한 번에 파싱 (입력 순서 유지)"""
+    extractors = [(field, FIELD_EXTRACTORS[field]) for field in (fields or FIELD_EXTRACTORS.keys())]
+    return [
+        {field: extract(raw_text or '') for field, extract in extractors}
+        for raw_text in raw_texts
+    ]
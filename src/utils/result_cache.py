@@ -0,0 +1,126 @@
+"""
+검색 결과 캐시
+TTL과 최대 개수(LRU 제거)가 있는 프로세스 내 캐시.
+같은 키로 동시에 들어온 요청은 진행 중인 계산 하나를 함께 기다린다 (single-flight)
+"""
+
+import asyncio
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import sys
+import os
+
+# 상위 디렉토리의 모듈 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config.settings import RESULT_CACHE_SETTINGS
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (유니코드 NFC, 공백 정리, 소문자)"""
+    return ' '.join(unicodedata.normalize('NFC', query).split()).lower()
+
+
+def make_cache_key(query: str, limit: int, longitude: Optional[float] = None,
+                   latitude: Optional[float] = None, **options) -> Tuple:
+    """검색어/개수/위치(소수점 4자리)/기타 옵션으로 캐시 키 생성"""
+    location = None
+    if longitude is not None and latitude is not None:
+        location = (round(longitude, 4), round(latitude, 4))
+    return (normalize_query(query), limit, location, tuple(sorted(options.items())))
+
+
+class ResultCache:
+    """TTL + LRU 캐시와 single-flight 요청 병합"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else RESULT_CACHE_SETTINGS['ttl_seconds']
+        self.max_entries = max_entries or RESULT_CACHE_SETTINGS['max_entries']
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """(값, 저장 후 경과 초) 반환, 없거나 만료되면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        age = time.monotonic() - stored_at
+        if age > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value, age
+
+    def lookup(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """get()과 같지만 적중/실패를 통계에 반영 (single-flight 없이 직접 계산하는 경로용)"""
+        cached = self.get(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def set(self, key: Hashable, value: Any):
+        """값 저장 (최대 개수를 넘으면 가장 오래 사용하지 않은 항목 제거)"""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]],
+                             should_cache: Callable[[Any], bool] = lambda value: True) -> Tuple[Any, Dict]:
+        """캐시에 있으면 반환, 같은 키 계산이 진행 중이면 합류, 없으면 계산
+
+        계산은 별도 태스크로 실행되므로 먼저 요청한 쪽이 취소되어도 합류한 요청은 결과를 받는다.
+        반환값: (값, {'hit': bool, 'age_seconds': float, 'coalesced': bool})
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            value, age = cached
+            return value, {'hit': True, 'age_seconds': round(age, 2), 'coalesced': False}
+
+        task = self._inflight.get(key)
+        coalesced = task is not None
+        if coalesced:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_computed(key, done, should_cache))
+
+        value = await asyncio.shield(task)
+        return value, {'hit': False, 'age_seconds': 0.0, 'coalesced': coalesced}
+
+    def _on_computed(self, key: Hashable, task: asyncio.Task, should_cache: Callable[[Any], bool]):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        value = task.result()
+        if should_cache(value):
+            self.set(key, value)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        """캐시 상태"""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'inflight': len(self._inflight),
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'evictions': self.evictions,
+        }
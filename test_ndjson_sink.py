@@ -0,0 +1,53 @@
+"""
+NDJSON 기록 복구 테스트
+잘리거나 손상된 마지막 gzip 멤버가 있어도 그 앞의 줄은 읽을 수 있는지 확인
+"""
+
+from src.utils.ndjson_sink import NDJSONSink, read_ndjson
+
+
+def write_records(path, start, count):
+    with NDJSONSink(str(path), compression='gzip', fsync='never') as sink:
+        sink.write_many({'rank': i, 'name': f'장소 {i}'} for i in range(start, start + count))
+        return sink.path
+
+
+def test_truncated_tail_keeps_written_lines(tmp_path):
+    """마지막 멤버가 잘리면 잘린 지점 앞까지의 줄을 반환해야 함"""
+    path = write_records(tmp_path / 'out.ndjson', 0, 2000)
+    data = open(path, 'rb').read()
+    with open(path, 'wb') as f:
+        f.write(data[:len(data) - 200])
+
+    records = list(read_ndjson(path))
+    assert records
+    assert [r['rank'] for r in records] == list(range(len(records)))
+
+
+def test_corrupt_tail_keeps_lines_before_corruption(tmp_path):
+    """손상된 마지막 멤버(뒤에 멤버 없음)도 손상 지점 앞까지의 줄을 반환해야 함"""
+    path = write_records(tmp_path / 'out.ndjson', 0, 2000)
+    data = bytearray(open(path, 'rb').read())
+    for i in range(len(data) - 300, len(data) - 200):
+        data[i] ^= 0xFF
+    with open(path, 'wb') as f:
+        f.write(bytes(data))
+
+    records = list(read_ndjson(path))
+    assert len(records) > 1000
+    assert [r['rank'] for r in records] == list(range(len(records)))
+
+
+def test_corrupt_member_followed_by_valid_member(tmp_path):
+    """손상된 멤버 뒤에 이어 쓴 멤버도 모두 읽어야 함"""
+    path = write_records(tmp_path / 'out.ndjson', 0, 2000)
+    data = bytearray(open(path, 'rb').read())
+    for i in range(len(data) - 300, len(data) - 200):
+        data[i] ^= 0xFF
+    with open(path, 'wb') as f:
+        f.write(bytes(data))
+    write_records(tmp_path / 'out.ndjson', 5000, 10)
+
+    ranks = [r['rank'] for r in read_ndjson(path)]
+    assert ranks[-10:] == list(range(5000, 5010))
+    assert len(ranks) > 1000
@@ -0,0 +1,63 @@
+"""
+속도 제한기 취소 처리 테스트
+토큰 대기 중에 취소된 요청이 동시 요청 슬롯과 토큰을 돌려놓는지 확인 (네트워크 사용 안 함)
+"""
+
+import asyncio
+
+from src.crawler.rate_limiter import HostLimiter, RateLimiter
+
+
+def test_cancel_during_token_wait_releases_slot():
+    """토큰 대기 중 취소되면 in_flight와 토큰이 원래대로 돌아와야 함"""
+
+    async def scenario():
+        limiter = HostLimiter('example.com', rate=1.0, burst=1)
+        await limiter.acquire()  # 토큰 1개 사용, 슬롯 1개 사용
+        tokens_before = limiter.tokens
+
+        waiting = asyncio.create_task(limiter.acquire())  # 다음 토큰까지 약 1초 대기
+        await asyncio.sleep(0.05)
+        assert limiter.in_flight == 2
+        waiting.cancel()
+        try:
+            await waiting
+        except asyncio.CancelledError:
+            pass
+
+        assert limiter.in_flight == 1
+        assert limiter.requests == 1
+        # 취소된 요청이 예약한 토큰이 환불되어 대기 중 보충분만 늘어남
+        assert limiter.tokens >= tokens_before
+
+        await limiter.release('success')
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_repeated_cancels_do_not_wedge_host():
+    """취소가 동시 요청 한도만큼 반복돼도 다음 요청이 슬롯을 얻어야 함"""
+
+    async def scenario():
+        limiter = RateLimiter()
+        host = limiter.for_host('map.naver.com')
+        host.concurrency = 2
+        host.tokens = 0.0  # 모든 요청이 토큰을 기다리도록
+
+        for _ in range(5):
+            task = asyncio.create_task(host.acquire())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        assert host.in_flight == 0
+        host.tokens = float(host.burst)
+        async with limiter.request('https://map.naver.com/p/api/search/allSearch'):
+            assert host.in_flight == 1
+        assert host.in_flight == 0
+
+    asyncio.run(scenario())